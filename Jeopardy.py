@@ -1,10 +1,202 @@
-from PyQt5.QtWidgets import QMainWindow, QApplication
-from Program_files.menu_window import MenuWindow
-from questions import all_questions, category_names
 import sys
 
+from Program_files import startup_profile
+
+if '--startup-profile' in sys.argv:
+    # started before the other imports so they are timed too.
+    startup_profile.enable()
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from Program_files.menu_window import MenuWindow
+import argparse
+import os
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    '''
+    Function to read the command line options.
+    '''
+    parser = argparse.ArgumentParser(description='Jeopardy!')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        '--board', metavar='PATH',
+        help='board file to play (.json, .toml, .csv, .tsv or .jpack). '
+             'Without it the board in questions.py is used.'
+    )
+    source.add_argument(
+        '--bank', metavar='PATH',
+        help='SQLite question bank to pick the board from'
+    )
+    parser.add_argument(
+        '--round', default='0', metavar='ROUND',
+        help='round of the board file to play, by index or name (default: 0)'
+    )
+    parser.add_argument(
+        '--category', action='append', metavar='NAME',
+        help='with --bank, category to play (repeat for each). '
+             'Without it 6 are picked at random.'
+    )
+    parser.add_argument(
+        '--tag', action='append', default=[], metavar='TAG',
+        help='with --bank, only use questions with this tag (can be repeated)'
+    )
+    parser.add_argument(
+        '--difficulty', type=int, metavar='N',
+        help='with --bank, only use questions of this difficulty'
+    )
+    parser.add_argument(
+        '--no-autosave', action='store_true',
+        help="don't offer to resume the last game or save this one"
+    )
+    parser.add_argument(
+        '--buzzer-port', type=int, metavar='PORT',
+        help='let players buzz in from their devices, on this TCP port '
+             '(see Program_files/buzzer.py)'
+    )
+    parser.add_argument(
+        '--buzzer-lockout', type=int, default=250, metavar='MS',
+        help='how long a player who buzzes too early is locked out (default: 250)'
+    )
+    parser.add_argument(
+        '--spectator-port', type=int, metavar='PORT',
+        help='show the board and scores to other screens at http://HOST:PORT/'
+    )
+    # does nothing here, it's only listed for --help. The scan of sys.argv at
+    # the top of this file is what turns the profile on, before the imports.
+    parser.add_argument(
+        '--startup-profile', action='store_true',
+        help='print import and startup times, then quit'
+    )
+    parser.add_argument(
+        '--count-lookups', action='store_true',
+        help='count widget searches (findChild) for every click and key press, '
+             'printed when the game closes'
+    )
+    parser.add_argument(
+        '--watchdog', type=int, nargs='?', const=50, metavar='MS',
+        help='record what blocks the GUI thread for longer than MS (default: 50), '
+             'printed when the game closes'
+    )
+    parser.add_argument(
+        '--trace', metavar='PATH',
+        help='write a Chrome trace of every click to PATH when the game closes, '
+             'to open in Perfetto'
+    )
+    args, qt_args = parser.parse_known_args(argv[1:])
+    args.qt_args = argv[:1] + qt_args
+    return args
+
+
+def get_board(args: argparse.Namespace) -> tuple:
+    '''
+    Function to get the questions and category names to play.
+        Called by the menu once it is showing.
+    '''
+    if args.bank is not None:
+        from Program_files.question_bank import BankError, QuestionBank
+
+        if not os.path.exists(args.bank):
+            raise BankError(f'{args.bank}: no such question bank')
+        with QuestionBank(args.bank) as bank:
+            return bank.build_board(
+                category_names=args.category,
+                tags=args.tag,
+                difficulty=args.difficulty
+            )
+
+    if args.board is None:
+        from questions import all_questions, category_names
+        return all_questions, category_names
+
+    from Program_files.board_loader import load_board
+
+    round_key = int(args.round) if args.round.isdigit() else args.round
+    return load_board(args.board, round=round_key)
+
+
+def get_next_round(args: argparse.Namespace, played: int):
+    '''
+    Function to get the board of a later round of the board file.
+        Called in a background thread while the round before it is played.
+
+        Parameters:
+            played: rounds played before it.
+
+        Returns:
+            (questions, category_names), None if the board has no more rounds.
+    '''
+    if args.board is None:
+        return None
+
+    from Program_files.board_loader import load_board, round_names
+
+    names = round_names(args.board)
+    first = int(args.round) if args.round.isdigit() else names.index(args.round)
+    if first + played >= len(names):
+        return None
+    return load_board(args.board, round=first + played)
+
+
+def ask_to_resume():
+    '''
+    Function to offer to carry on the last game, if it didn't end normally.
+
+        Returns:
+            GameEngine of the last game, None to start a new game.
+    '''
+    from Program_files import journal
+
+    if not journal.has_autosave():
+        return None
+    msg = QMessageBox()
+    msg.setWindowTitle("Jeopardy! - Resume Game")
+    msg.setText("The last game didn't finish.\nDo you want to carry on with it?")
+    msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+    msg.setDefaultButton(QMessageBox.Yes)
+    if msg.exec_() != QMessageBox.Yes:
+        return None
+    return journal.resume()
+
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window1 = MenuWindow(all_questions, category_names)
+    args = parse_args(sys.argv)
+    startup_profile.mark('imports done')
+
+    app = QApplication(args.qt_args)
+    startup_profile.mark('QApplication created')
+
+    if args.count_lookups:
+        from Program_files import lookups
+        lookups.watch(app)
+    if args.watchdog is not None:
+        from Program_files import watchdog
+        watchdog.watch(app, threshold=args.watchdog / 1000)
+    if args.trace:
+        from Program_files import tracing
+        tracing.enable()
+        app.aboutToQuit.connect(lambda: tracing.write(args.trace))
+
+    engine = None
+    if not args.no_autosave and not startup_profile.enabled:
+        engine = ask_to_resume()
+
+    buzzer = None
+    if args.buzzer_port is not None:
+        from Program_files.buzzer import BuzzerServer
+        buzzer = BuzzerServer(port=args.buzzer_port, lockout=args.buzzer_lockout / 1000)
+
+    spectator_feed = None
+    if args.spectator_port is not None:
+        from Program_files.spectator import SpectatorFeed
+        spectator_feed = SpectatorFeed(port=args.spectator_port)
+
+    window1 = MenuWindow(
+        board_loader=lambda: get_board(args),
+        autosave=not args.no_autosave,
+        buzzer=buzzer,
+        spectator_feed=spectator_feed,
+        round_loader=lambda played: get_next_round(args, played)
+    )
+    if engine is not None:
+        window1.resume_game(engine)
     app.exec_()
@@ -1,8 +1,19 @@
-from .game_window import (
-    GameWindow,
-    QuestionWindow,
-    Team,
-)
+from .models import Question, Team
+from .engine import GameEngine
 
 
-from .menu_window import MenuWindow
+# The windows import PyQt5, so they are only imported when first used.
+# This lets the engine run without PyQt5 installed.
+_windows = {
+    'GameWindow': 'game_window',
+    'QuestionWindow': 'game_window',
+    'MenuWindow': 'menu_window',
+}
+
+
+def __getattr__(name):
+    if name in _windows:
+        from importlib import import_module
+        module = import_module(f'.{_windows[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
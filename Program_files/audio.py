@@ -0,0 +1,309 @@
+'''
+Script to play the theme song and the sound effects (cues).
+
+Everything is loaded when the board loads, so nothing is decoded when a question
+opens:
+    - the cues (buzz in, time's up, daily double) are WAV files loaded into a small
+      pool of QSoundEffect objects each, so a cue can start again while it's
+      still playing. Cues missing from Program_files/sounds are generated.
+    - the theme song is decoded to PCM in memory with QAudioDecoder and played
+      with QAudioOutput. Until decoding is done it plays through QMediaPlayer.
+
+All of these play asynchronously, so starting a sound never waits on the GUI
+thread. If QtMultimedia can't be loaded the game runs without sound.
+'''
+
+import array
+import math
+import os
+import sys
+import time
+import wave
+from collections import deque
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+THEME_PATH = os.path.join(ROOT_DIR, 'Jeopardy-theme-song.mp3')
+SOUNDS_DIR = os.path.join(ROOT_DIR, 'sounds')
+GENERATED_DIR = os.path.join(SOUNDS_DIR, 'generated')
+
+CUES = ['buzz_in', 'times_up', 'daily_double']
+VOICES = 3  # sound effects per cue, so a cue can overlap itself
+
+SAMPLE_RATE = 22050
+
+# tones of the generated cues, (frequency Hz, seconds)
+CUE_TONES = {
+    'buzz_in': [(880, 0.12), (1320, 0.18)],
+    'times_up': [(660, 0.2), (520, 0.2), (392, 0.45)],
+    'daily_double': [(523, 0.1), (659, 0.1), (784, 0.1), (1047, 0.35)],
+}
+
+
+def generate_cue(name: str, path: str) -> None:
+    '''
+    Function to write a simple tone sequence for a cue as a 16 bit mono WAV.
+    '''
+    samples = array.array('h')
+    for frequency, seconds in CUE_TONES[name]:
+        count = int(SAMPLE_RATE * seconds)
+        fade = min(count // 2, SAMPLE_RATE // 100)  # 10 ms fade in/out, no clicks
+        for index in range(count):
+            envelope = min(1.0, index / fade, (count - index) / fade) if fade else 1.0
+            value = math.sin(2 * math.pi * frequency * index / SAMPLE_RATE)
+            samples.append(int(12000 * envelope * value))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with wave.open(tmp_path, 'wb') as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(SAMPLE_RATE)
+        file.writeframes(samples.tobytes())
+    os.replace(tmp_path, path)
+
+
+def cue_path(name: str) -> str:
+    '''
+    Function to get the WAV file of a cue, generating it if there isn't one.
+        A file in Program_files/sounds/<name>.wav replaces the generated sound.
+    '''
+    path = os.path.join(SOUNDS_DIR, f'{name}.wav')
+    if os.path.exists(path):
+        return path
+    path = os.path.join(GENERATED_DIR, f'{name}.wav')
+    if not os.path.exists(path):
+        generate_cue(name, path)
+    return path
+
+
+class NullAudioSink():
+    '''
+    Class to stand in for the sound card. It plays nothing but records when
+    every sound was started, which is used to measure start latency.
+    '''
+
+    def __init__(self, history=1000):
+        self.started = deque(maxlen=history)  # (name, perf_counter)
+        self.prepared = set()
+        self.theme_playing = False
+        self.muted = False
+
+    def prepare_cue(self, name: str, path: str, voices: int) -> None:
+        self.prepared.add(name)
+
+    def prepare_theme(self, path: str) -> None:
+        self.prepared.add('theme')
+
+    def start_cue(self, name: str) -> None:
+        self.started.append((name, time.perf_counter()))
+
+    def start_theme(self) -> None:
+        self.theme_playing = True
+        self.started.append(('theme', time.perf_counter()))
+
+    def stop_theme(self) -> None:
+        self.theme_playing = False
+
+    def set_muted(self, muted: bool) -> None:
+        self.muted = muted
+
+
+class QtAudioSink():
+    '''
+    Class to play sounds with QtMultimedia.
+    '''
+
+    def __init__(self):
+        from PyQt5 import QtMultimedia
+        self.QtMultimedia = QtMultimedia
+
+        self.effects = {}  # cue name -> list of QSoundEffect
+        self.next_voice = {}
+        self.muted = False
+
+        # theme song, the player is used until the PCM decode is done.
+        self.theme_player = None
+        self.theme_decoder = None
+        self.theme_pcm = bytearray()
+        self.theme_format = None
+        self.theme_output = None
+        self.theme_buffer = None
+
+    # Cues
+
+    def prepare_cue(self, name: str, path: str, voices: int) -> None:
+        from PyQt5.QtCore import QUrl
+
+        effects = []
+        for _ in range(voices):
+            effect = self.QtMultimedia.QSoundEffect()
+            effect.setSource(QUrl.fromLocalFile(path))
+            effect.setMuted(self.muted)
+            effects.append(effect)
+        self.effects[name] = effects
+        self.next_voice[name] = 0
+
+    def start_cue(self, name: str) -> None:
+        effects = self.effects.get(name)
+        if not effects:
+            return
+
+        # a free voice if there is one, otherwise the one started longest ago.
+        start = self.next_voice[name]
+        for offset in range(len(effects)):
+            index = (start + offset) % len(effects)
+            if not effects[index].isPlaying():
+                break
+        else:
+            index = start
+        self.next_voice[name] = (index + 1) % len(effects)
+
+        effect = effects[index]
+        if effect.isPlaying():
+            effect.stop()
+        effect.play()
+
+    # Theme
+
+    def prepare_theme(self, path: str) -> None:
+        from PyQt5.QtCore import QUrl
+
+        self.theme_player = self.QtMultimedia.QMediaPlayer()
+        self.theme_player.setMedia(
+            self.QtMultimedia.QMediaContent(QUrl.fromLocalFile(path))
+        )
+        self.theme_player.setMuted(self.muted)
+
+        decoder = self.QtMultimedia.QAudioDecoder()
+        audio_format = self.QtMultimedia.QAudioFormat()
+        audio_format.setSampleRate(44100)
+        audio_format.setChannelCount(2)
+        audio_format.setSampleSize(16)
+        audio_format.setSampleType(self.QtMultimedia.QAudioFormat.SignedInt)
+        audio_format.setByteOrder(self.QtMultimedia.QAudioFormat.LittleEndian)
+        audio_format.setCodec('audio/pcm')
+        decoder.setAudioFormat(audio_format)
+        decoder.setSourceFilename(path)
+        decoder.bufferReady.connect(self._theme_buffer_ready)
+        decoder.finished.connect(self._theme_decoded)
+        decoder.error.connect(self._theme_decode_failed)
+        self.theme_decoder = decoder
+        decoder.start()
+
+    def _theme_buffer_ready(self) -> None:
+        audio_buffer = self.theme_decoder.read()
+        if self.theme_format is None:
+            self.theme_format = audio_buffer.format()
+        self.theme_pcm += audio_buffer.constData().asstring(audio_buffer.byteCount())
+
+    def _theme_decoded(self) -> None:
+        from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+
+        if not self.theme_pcm or self.theme_format is None:
+            return
+        self.theme_buffer = QBuffer()
+        self.theme_buffer.setData(QByteArray(bytes(self.theme_pcm)))
+        self.theme_buffer.open(QIODevice.ReadOnly)
+        self.theme_pcm = bytearray()
+        self.theme_output = self.QtMultimedia.QAudioOutput(self.theme_format)
+        self.theme_output.setVolume(0.0 if self.muted else 1.0)
+        self.theme_decoder = None
+
+    def _theme_decode_failed(self, *args) -> None:
+        # keep using the media player.
+        self.theme_decoder = None
+        self.theme_pcm = bytearray()
+
+    def start_theme(self) -> None:
+        if self.theme_output is not None:
+            self.theme_output.stop()
+            self.theme_buffer.seek(0)
+            self.theme_output.start(self.theme_buffer)
+        elif self.theme_player is not None:
+            self.theme_player.play()
+
+    def stop_theme(self) -> None:
+        if self.theme_output is not None:
+            self.theme_output.stop()
+        if self.theme_player is not None:
+            self.theme_player.stop()
+
+    def set_muted(self, muted: bool) -> None:
+        self.muted = muted
+        for effects in self.effects.values():
+            for effect in effects:
+                effect.setMuted(muted)
+        if self.theme_player is not None:
+            self.theme_player.setMuted(muted)
+        if self.theme_output is not None:
+            self.theme_output.setVolume(0.0 if muted else 1.0)
+
+
+class AudioEngine():
+    '''
+    Class the game uses to play sounds.
+    '''
+
+    def __init__(self, sink=None):
+        self.sink = sink if sink is not None else NullAudioSink()
+        self.muted = False
+        self.loaded = False
+
+    def load(self, theme_path=THEME_PATH, cues=CUES, voices=VOICES) -> None:
+        '''
+        Function to load the theme song and cues, done when the board loads.
+        '''
+        if self.loaded:
+            return
+        for name in cues:
+            self.sink.prepare_cue(name, cue_path(name), voices)
+        self.sink.prepare_theme(theme_path)
+        self.loaded = True
+
+    def play_theme(self) -> None:
+        '''
+        Function to play the theme song from the start.
+        '''
+        self.sink.start_theme()
+
+    def stop_theme(self) -> None:
+        '''
+        Function to stop the theme song.
+        '''
+        self.sink.stop_theme()
+
+    def play_cue(self, name: str) -> None:
+        '''
+        Function to play a sound effect, e.g. 'buzz_in'.
+        '''
+        self.sink.start_cue(name)
+
+    def set_muted(self, muted: bool) -> None:
+        '''
+        Function to mute or unmute every sound.
+        '''
+        self.muted = muted
+        self.sink.set_muted(muted)
+
+
+# audio engine shared by the game, made by get_audio_engine()
+_audio_engine = None
+
+
+def get_audio_engine() -> AudioEngine:
+    '''
+    Function to get the game's audio engine, loading it the first time.
+        QtMultimedia is slow to import and start, so this is called by the menu
+        in the background after it shows.
+    '''
+    global _audio_engine
+    if _audio_engine is None:
+        try:
+            sink = QtAudioSink()
+        except ImportError as error:
+            print(f'QtMultimedia not available, playing without sound: {error}',
+                  file=sys.stderr)
+            sink = NullAudioSink()
+        _audio_engine = AudioEngine(sink)
+        _audio_engine.load()
+    return _audio_engine
@@ -0,0 +1,497 @@
+'''
+Script to load boards (categories and questions) from data files.
+
+Supported formats, chosen by file extension:
+
+    .json   {"rounds": [{"name": "Jeopardy", "categories": [
+                {"name": "Category 1", "questions": [
+                    {"question": "...", "answer": "...", "points": 100}, ...]}, ...]}, ...]}
+
+    .toml   [[rounds]]
+            name = "Jeopardy"
+            [[rounds.categories]]
+            name = "Category 1"
+            [[rounds.categories.questions]]
+            question = "..."
+            answer = "..."
+            points = 100
+
+    .csv    one question per row, with a header row:
+            round,category,points,question,answer
+            (the round column is optional, .tsv files are tab separated)
+
+    .jpack  compiled board pack, see Program_files/board_pack.py
+
+JSON and TOML files may also leave out "rounds" and put "categories" at the top
+level for a single round board.
+
+A question can also have an "image" and/or a "video" (an image and video column
+in csv files): the path of a picture or video file shown with the question,
+relative to the board file.
+
+Only the round being played is validated and turned into Question objects.
+Mistakes in the file raise BoardError with the file name and line number.
+
+To check a board file type *"python -m Program_files.board_loader PATH"*.
+'''
+
+import bisect
+import csv
+import io
+import json
+import json.decoder
+import json.scanner
+import os
+import re
+import sys
+
+from .models import Question
+
+CSV_FIELDS = ['category', 'points', 'question', 'answer']
+MEDIA_FIELDS = ['image', 'video']
+
+
+class BoardError(ValueError):
+    '''
+    Error raised when a board file can't be loaded.
+    '''
+
+    def __init__(self, message: str, path=None, line=None):
+        self.message = message
+        self.path = path
+        self.line = line
+
+        location = path or '<board>'
+        if line is not None:
+            location = f'{location}, line {line}'
+        super(BoardError, self).__init__(f'{location}: {message}')
+
+
+class _Lines():
+    '''
+    Class to remember the line number each parsed table/object started on.
+    '''
+
+    def __init__(self):
+        self.lines = {}
+
+    def set(self, obj, line) -> None:
+        self.lines[id(obj)] = line
+
+    def get(self, obj):
+        return self.lines.get(id(obj))
+
+
+# Readers, each returns (document, lines)
+
+
+def _read_json(text: str, path: str) -> tuple:
+    lines = _Lines()
+    newlines = [index for index, char in enumerate(text) if char == '\n']
+
+    decoder = json.JSONDecoder()
+
+    def parse_object(s_and_end, *args):
+        string, start = s_and_end
+        obj, end = json.decoder.JSONObject(s_and_end, *args)
+        lines.set(obj, bisect.bisect_left(newlines, start) + 1)
+        return obj, end
+
+    # the pure python scanner is used so parse_object can record line numbers.
+    decoder.parse_object = parse_object
+    decoder.scan_once = json.scanner.py_make_scanner(decoder)
+
+    try:
+        document = decoder.decode(text)
+    except json.JSONDecodeError as error:
+        raise BoardError(error.msg, path, error.lineno) from None
+    return document, lines
+
+
+_toml_table_re = re.compile(r'^\s*\[\[\s*([\w.]+)\s*\]\]', re.MULTILINE)
+
+
+def _read_toml(text: str, path: str) -> tuple:
+    try:
+        import tomllib
+    except ImportError:
+        raise BoardError('TOML boards need Python 3.11 or newer', path) from None
+
+    try:
+        document = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as error:
+        match = re.search(r'line (\d+)', str(error))
+        line = int(match.group(1)) if match else None
+        raise BoardError(str(error), path, line) from None
+
+    # tomllib doesn't keep positions, so the [[...]] table headers are matched up
+    # with the parsed tables in the order they appear in the file.
+    headers = {}
+    for match in _toml_table_re.finditer(text):
+        line = text.count('\n', 0, match.start()) + 1
+        headers.setdefault(match.group(1), []).append(line)
+
+    lines = _Lines()
+    rounds = document.get('rounds')
+    if isinstance(rounds, list):
+        tables = [('rounds', rounds)]
+        categories = [c for r in rounds if isinstance(r, dict)
+                      for c in r.get('categories', []) or []]
+        prefix = 'rounds.'
+    else:
+        tables = []
+        categories = document.get('categories', []) or []
+        prefix = ''
+    tables.append((prefix + 'categories', categories))
+    tables.append((prefix + 'categories.questions',
+                   [q for c in categories if isinstance(c, dict)
+                    for q in c.get('questions', []) or []]))
+
+    for key, objects in tables:
+        if not isinstance(objects, list):
+            continue
+        for obj, line in zip(objects, headers.get(key, [])):
+            lines.set(obj, line)
+    return document, lines
+
+
+def _read_csv(text: str, path: str, round_key=None) -> tuple:
+    '''
+    Function to read a csv/tsv board into the same shape as a JSON document.
+        Rows of other rounds are skipped without being checked.
+    '''
+    delimiter = '\t' if path and path.lower().endswith('.tsv') else ','
+    reader = csv.reader(io.StringIO(text, newline=''), delimiter=delimiter)
+
+    try:
+        header = [name.strip().lower() for name in next(reader)]
+    except StopIteration:
+        raise BoardError('board file is empty', path, 1) from None
+    missing = [name for name in CSV_FIELDS if name not in header]
+    if missing:
+        raise BoardError(
+            f'header row is missing column(s): {", ".join(missing)}', path, 1
+        )
+    column = {name: header.index(name) for name in header}
+    round_column = column.get('round')
+
+    lines = _Lines()
+    rounds = {}
+    round_categories = {}  # categories of each round, by name
+    round_order = []
+    previous_line = reader.line_num
+    for row in reader:
+        # a quoted cell can span lines, so a row starts after the previous one ended.
+        line = previous_line + 1
+        previous_line = reader.line_num
+        if not any(cell.strip() for cell in row):
+            continue
+
+        round_name = ''
+        if round_column is not None and round_column < len(row):
+            round_name = row[round_column].strip()
+        if round_name not in rounds:
+            round_obj = {'name': round_name or None, 'categories': []}
+            lines.set(round_obj, line)
+            rounds[round_name] = round_obj
+            round_categories[round_name] = {}
+            round_order.append(round_name)
+        round_obj = rounds[round_name]
+
+        if round_key is not None:
+            index = round_order.index(round_name)
+            if not _is_round(round_key, round_obj, index):
+                continue
+
+        if len(row) < len(header):
+            raise BoardError(
+                f'expected {len(header)} columns, got {len(row)}', path, line
+            )
+        category_name = row[column['category']]
+        categories = round_categories[round_name]
+        if category_name not in categories:
+            category = {'name': category_name, 'questions': []}
+            lines.set(category, line)
+            categories[category_name] = category
+            round_obj['categories'].append(category)
+
+        question = {
+            'question': row[column['question']],
+            'answer': row[column['answer']],
+            'points': _csv_number(row[column['points']]),
+        }
+        for key in MEDIA_FIELDS:
+            if key in column and row[column[key]].strip():
+                question[key] = row[column[key]].strip()
+        lines.set(question, line)
+        categories[category_name]['questions'].append(question)
+
+    document = {'rounds': [rounds[name] for name in round_order]}
+    return document, lines
+
+
+def _csv_number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+
+_readers = {
+    '.json': _read_json,
+    '.toml': _read_toml,
+    '.csv': _read_csv,
+    '.tsv': _read_csv,
+}
+
+
+# Validating
+
+
+def _is_round(round_key, round_obj, index: int) -> bool:
+    if isinstance(round_key, int):
+        return index == round_key
+    return isinstance(round_obj, dict) and round_obj.get('name') == round_key
+
+
+def _get_rounds(document, path: str) -> list:
+    if not isinstance(document, dict):
+        raise BoardError('board must be a table/object', path, 1)
+    if 'rounds' in document:
+        rounds = document['rounds']
+        if not isinstance(rounds, list) or not rounds:
+            raise BoardError('"rounds" must be a non-empty list', path)
+        return rounds
+    if 'categories' in document:
+        return [document]
+    raise BoardError('board has no "rounds" or "categories"', path, 1)
+
+
+def _build_round(round_obj, lines: _Lines, path: str, categories=None, rows=None) -> tuple:
+    '''
+    Function to validate a round and make its Question objects.
+
+        Returns: tuple
+            all_questions: list of columns, each a list of Question.
+            category_names: list of str.
+    '''
+    round_line = lines.get(round_obj)
+    if not isinstance(round_obj, dict):
+        raise BoardError('round must be a table/object', path, round_line)
+
+    category_objs = round_obj.get('categories')
+    if not isinstance(category_objs, list):
+        raise BoardError('round has no "categories" list', path, round_line)
+    if categories is not None and len(category_objs) != categories:
+        raise BoardError(
+            f'expected {categories} categories, got {len(category_objs)}',
+            path, round_line
+        )
+
+    all_questions = []
+    category_names = []
+    for category in category_objs:
+        category_line = lines.get(category)
+        if not isinstance(category, dict):
+            raise BoardError('category must be a table/object', path, round_line)
+
+        name = category.get('name')
+        if not isinstance(name, str):
+            raise BoardError('category needs a "name" string', path, category_line)
+
+        question_objs = category.get('questions')
+        if not isinstance(question_objs, list):
+            raise BoardError(
+                f'category "{name}" has no "questions" list', path, category_line
+            )
+        expected_rows = rows
+        if expected_rows is None and all_questions:
+            expected_rows = len(all_questions[0])
+        if expected_rows is not None and len(question_objs) != expected_rows:
+            raise BoardError(
+                f'category "{name}" needs {expected_rows} questions, got {len(question_objs)}',
+                path, category_line
+            )
+        if not question_objs:
+            raise BoardError(f'category "{name}" has no questions', path, category_line)
+
+        column = []
+        for question in question_objs:
+            column.append(_build_question(question, lines, path, category_line))
+        all_questions.append(column)
+        # the same names come back in every round and every board loaded.
+        category_names.append(sys.intern(name))
+
+    if not all_questions:
+        raise BoardError('round has no categories', path, round_line)
+    return all_questions, category_names
+
+
+def _build_question(question, lines: _Lines, path: str, category_line) -> Question:
+    line = lines.get(question)
+    if not isinstance(question, dict):
+        raise BoardError('question must be a table/object', path, category_line)
+
+    for key in ('question', 'answer', *MEDIA_FIELDS):
+        if not isinstance(question.get(key, ''), str):
+            raise BoardError(f'"{key}" must be a string', path, line)
+
+    points = question.get('points')
+    if isinstance(points, bool) or not isinstance(points, (int, float)):
+        raise BoardError(f'"points" must be a number, got {points!r}', path, line)
+    if points <= 0:
+        raise BoardError(f'"points" must be more than 0, got {points}', path, line)
+
+    # media paths are relative to the board file.
+    media = {}
+    for key in MEDIA_FIELDS:
+        if question.get(key):
+            media[key] = os.path.join(os.path.dirname(os.path.abspath(path)), question[key])
+
+    return Question(
+        question=question.get('question', ''),
+        answer=question.get('answer', ''),
+        points=points,
+        **media
+    )
+
+
+# Board packs
+
+
+def _is_pack(path: str) -> bool:
+    return path.lower().endswith('.jpack')
+
+
+def _open_pack(path: str):
+    from .board_pack import BoardPack, PackError
+
+    try:
+        return BoardPack(path)
+    except PackError as error:
+        raise BoardError(str(error).split(': ', 1)[-1], path) from None
+    except OSError as error:
+        raise BoardError(error.strerror or str(error), path) from None
+
+
+def _load_pack(path: str, round, categories, rows) -> tuple:
+    '''
+    Function to load a round of a pack, checking only its shape.
+        The pack was validated when it was compiled.
+    '''
+    from .board_pack import PackError
+
+    pack = _open_pack(path)
+    try:
+        all_questions, category_names = pack.load_board(round)
+    except PackError:
+        pack.close()
+        raise BoardError(f'board has no round {round!r}', path) from None
+
+    if categories is not None and len(all_questions) != categories:
+        pack.close()
+        raise BoardError(
+            f'expected {categories} categories, got {len(all_questions)}', path
+        )
+    sizes = {len(column) for column in all_questions}
+    if (rows is not None and sizes != {rows}) or len(sizes) > 1:
+        pack.close()
+        raise BoardError(f'categories need {rows or "the same number of"} questions', path)
+    return all_questions, category_names
+
+
+# Public functions
+
+
+def read_document(path: str, round_key=None) -> tuple:
+    '''
+    Function to read a board file without validating it.
+
+        Parameters:
+            path: path of the board file.
+            round_key: for csv files, round (index or name) to keep. None keeps all.
+
+        Returns: tuple
+            document: parsed file in the JSON layout.
+            lines: line numbers of the parsed objects.
+    '''
+    extension = os.path.splitext(path)[1].lower()
+    reader = _readers.get(extension)
+    if reader is None:
+        raise BoardError(
+            f'unknown board format "{extension}", use one of: {", ".join(_readers)}',
+            path
+        )
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as file:
+            text = file.read()
+    except OSError as error:
+        raise BoardError(error.strerror or str(error), path) from None
+
+    if reader is _read_csv:
+        return reader(text, path, round_key)
+    return reader(text, path)
+
+
+def round_names(path: str) -> list:
+    '''
+    Function to get the names of the rounds in a board file.
+        Rounds without a name are called "Round N".
+    '''
+    if _is_pack(path):
+        with _open_pack(path) as pack:
+            return pack.round_names()
+
+    document, lines = read_document(path)
+    return [
+        (round_obj.get('name') if isinstance(round_obj, dict) else None) or f'Round {index + 1}'
+        for index, round_obj in enumerate(_get_rounds(document, path))
+    ]
+
+
+def load_board(path: str, round=0, categories=None, rows=None) -> tuple:
+    '''
+    Function to load one round of a board file.
+
+        Parameters:
+            path: path of the board file.
+            round: index or name of the round to load.
+            categories: number of categories the round must have, None for any.
+            rows: number of questions each category must have, None for any
+                (every category still needs the same number).
+
+        Returns: tuple
+            all_questions: list of columns (categories), each a list of Question.
+            category_names: list of str.
+    '''
+    if _is_pack(path):
+        return _load_pack(path, round, categories, rows)
+
+    document, lines = read_document(path, round_key=round)
+    rounds = _get_rounds(document, path)
+
+    for index, round_obj in enumerate(rounds):
+        if _is_round(round, round_obj, index):
+            return _build_round(round_obj, lines, path, categories, rows)
+
+    raise BoardError(f'board has no round {round!r}', path)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print('usage: python -m Program_files.board_loader PATH')
+        sys.exit(2)
+
+    board_path = sys.argv[1]
+    try:
+        names = round_names(board_path)
+        for index, round_name in enumerate(names):
+            questions, category_names = load_board(board_path, round=index)
+            count = sum(len(column) for column in questions)
+            print(f'{round_name}: {len(category_names)} categories, {count} questions')
+    except BoardError as error:
+        print(error)
+        sys.exit(1)
@@ -0,0 +1,417 @@
+'''
+Script to compile boards into a binary "board pack" that loads instantly.
+
+A pack is read through mmap, so opening one only reads the small header and
+offset tables. Question objects are made the first time a question is asked for,
+i.e. when it is clicked on the board.
+
+Layout (little endian, offsets from the start of the file unless noted):
+
+    header          magic b'JPAK', version (H), 0 (H), round count (I)
+    round table     per round: name offset (I), name length (I),
+                    category count (I), category table offset (I)
+    category table  per category: name offset (I), name length (I),
+                    content hash (16s), segment offset (I), segment length (I),
+                    question count (I)
+    segments        per category: per question: points (d), question offset (I),
+                    question length (I), answer offset (I), answer length (I),
+                    image offset (I), image length (I), video offset (I),
+                    video length (I), then the UTF-8 question/answer text and
+                    media paths. Offsets in a segment are from the start of the
+                    segment, so it can be copied as is.
+    names           UTF-8 round and category names
+
+Media paths are stored relative to the pack, so a pack can be moved with its
+pictures and videos. Version 1 packs (without media) can still be read.
+
+The content hash of each category is stored so a rebuild copies the segments of
+unchanged categories from the old pack instead of encoding them again.
+
+To compile a board file type:
+    python -m Program_files.board_pack SOURCE PACK
+where SOURCE is any board file Program_files/board_loader.py can read.
+'''
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from .models import Question
+
+MAGIC = b'JPAK'
+VERSION = 2
+EXTENSION = '.jpack'
+
+HEADER = struct.Struct('<4sHHI')
+ROUND = struct.Struct('<IIII')
+CATEGORY = struct.Struct('<II16sIII')
+QUESTION = struct.Struct('<dIIIIIIII')
+QUESTION_V1 = struct.Struct('<dIIII')  # questions of version 1 packs, without media
+
+
+class PackError(ValueError):
+    '''
+    Error raised when a file isn't a usable board pack.
+    '''
+
+
+def _media_path(path: str, base: str) -> str:
+    # path of a picture/video as stored in a pack in the directory base.
+    if not path or base is None:
+        return path
+    return os.path.relpath(path, base).replace(os.sep, '/')
+
+
+def category_hash(name: str, questions: list, base=None) -> bytes:
+    '''
+    Function to get the content hash of a category.
+
+        Parameters:
+            name: category name.
+            questions: list of Question in the category.
+            base: directory of the pack, media paths are hashed relative to it.
+    '''
+    content = json.dumps(
+        [name, [[q.get_question(), q.get_answer(), q.get_points()]
+                + ([_media_path(q.get_image(), base), _media_path(q.get_video(), base)]
+                   if q.get_image() or q.get_video() else [])
+                for q in questions]],
+        ensure_ascii=False
+    )
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+def encode_segment(questions: list, base=None) -> bytes:
+    '''
+    Function to encode the questions of one category.
+
+        Parameters:
+            questions: list of Question in the category.
+            base: directory of the pack, media paths are stored relative to it.
+    '''
+    table = bytearray()
+    blob = bytearray()
+    text_start = QUESTION.size * len(questions)
+    for question in questions:
+        offsets = []
+        for text in (question.get_question(), question.get_answer(),
+                     _media_path(question.get_image(), base),
+                     _media_path(question.get_video(), base)):
+            encoded = text.encode('utf-8')
+            offsets += [text_start + len(blob), len(encoded)]
+            blob += encoded
+        table += QUESTION.pack(float(question.get_points()), *offsets)
+    return bytes(table + blob)
+
+
+class BoardPack():
+    '''
+    Class to read a board pack.
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self.file.close()
+            raise PackError(f'{path}: not a board pack') from None
+
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise PackError(f'{path}: not a board pack')
+        magic, version, _, round_count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise PackError(f'{path}: not a board pack')
+        if version not in (1, VERSION):
+            self.close()
+            raise PackError(f'{path}: unsupported board pack version {version}')
+        self.version = version
+        self.question_struct = QUESTION if version == VERSION else QUESTION_V1
+        self.directory = os.path.dirname(os.path.abspath(path))
+
+        self.rounds = [
+            ROUND.unpack_from(self.data, HEADER.size + index * ROUND.size)
+            for index in range(round_count)
+        ]
+
+    def close(self) -> None:
+        '''
+        Function to close the pack. Boards taken from it can't be used after.
+        '''
+        if getattr(self, 'data', None) is not None and not self.data.closed:
+            self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _text(self, offset: int, length: int) -> str:
+        return self.data[offset:offset + length].decode('utf-8')
+
+    def round_names(self) -> list:
+        '''
+        Function to get the name of each round in the pack.
+        '''
+        return [self._text(offset, length) for offset, length, _, _ in self.rounds]
+
+    def round_index(self, round) -> int:
+        '''
+        Function to find a round by index or name.
+        '''
+        if isinstance(round, int):
+            if 0 <= round < len(self.rounds):
+                return round
+        elif round in self.round_names():
+            return self.round_names().index(round)
+        raise PackError(f'{self.path}: board has no round {round!r}')
+
+    def categories(self, round=0) -> list:
+        '''
+        Function to get the category table of a round.
+
+            Returns:
+                list of (name, hash, segment offset, segment length, question count).
+        '''
+        _, _, count, table_offset = self.rounds[self.round_index(round)]
+        categories = []
+        for index in range(count):
+            name_offset, name_length, digest, offset, length, questions = \
+                CATEGORY.unpack_from(self.data, table_offset + index * CATEGORY.size)
+            categories.append(
+                (self._text(name_offset, name_length), digest, offset, length, questions)
+            )
+        return categories
+
+    def question(self, segment_offset: int, row: int) -> Question:
+        '''
+        Function to make the Question object of one question.
+
+            Parameters:
+                segment_offset: offset of the category's segment.
+                row: row of the question in the category.
+        '''
+        points, *offsets = self.question_struct.unpack_from(
+            self.data, segment_offset + row * self.question_struct.size
+        )
+        texts = [
+            self._text(segment_offset + offset, length)
+            for offset, length in zip(offsets[::2], offsets[1::2])
+        ]
+        if len(texts) == 2:  # version 1 packs have no media
+            texts += ['', '']
+        question, answer, image, video = texts
+        return Question(
+            question=question,
+            answer=answer,
+            points=int(points) if points.is_integer() else points,
+            image=os.path.join(self.directory, image) if image else '',
+            video=os.path.join(self.directory, video) if video else ''
+        )
+
+    def load_board(self, round=0) -> tuple:
+        '''
+        Function to get one round of the pack.
+
+            Returns: tuple
+                all_questions: list of columns, each makes its Question objects
+                    when they are first used.
+                category_names: list of str.
+        '''
+        categories = self.categories(round)
+        all_questions = [
+            PackColumn(self, offset, count) for _, _, offset, _, count in categories
+        ]
+        return all_questions, [sys.intern(category[0]) for category in categories]
+
+
+class PackColumn():
+    '''
+    Class for one category of a pack, makes each Question when it's first used.
+    '''
+
+    __slots__ = ('pack', 'segment_offset', 'questions')
+
+    def __init__(self, pack: BoardPack, segment_offset: int, count: int):
+        self.pack = pack
+        self.segment_offset = segment_offset
+        self.questions = [None] * count
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(len(self)))]
+        question = self.questions[row]
+        if question is None:
+            if row < 0:
+                row += len(self.questions)
+            question = self.pack.question(self.segment_offset, row)
+            self.questions[row] = question
+        return question
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def points(self, row: int) -> float:
+        '''
+        Function to get the points of a question without making its Question.
+        '''
+        question = self.questions[row]
+        if question is not None:
+            return question.get_points()
+        struct = self.pack.question_struct
+        points = struct.unpack_from(self.pack.data, self.segment_offset + row * struct.size)[0]
+        return int(points) if points.is_integer() else points
+
+
+def pack_source(all_questions: list):
+    '''
+    Function to find the pack and round a board was loaded from, without
+        making its Question objects.
+
+        Parameters:
+            all_questions: list of columns of a board.
+
+        Returns:
+            (absolute path of the pack, round index), None if the board isn't
+            a whole round of a pack.
+    '''
+    if not all_questions or not all(isinstance(column, PackColumn) for column in all_questions):
+        return None
+    pack = all_questions[0].pack
+    offsets = [column.segment_offset for column in all_questions]
+    for index in range(len(pack.rounds)):
+        if [offset for _, _, offset, _, _ in pack.categories(index)] == offsets:
+            return os.path.abspath(pack.path), index
+    return None
+
+
+def write_pack(path: str, rounds: list, previous=None) -> dict:
+    '''
+    Function to write a board pack.
+
+        Parameters:
+            path: file to write.
+            rounds: list of (round name, all_questions, category_names).
+            previous: path of an older pack to reuse unchanged categories from.
+
+        Returns:
+            dict with the number of 'encoded' and 'reused' categories.
+    '''
+    # segments of the old pack, by content hash
+    reusable = {}
+    base = os.path.dirname(os.path.abspath(path))
+    if previous is not None and os.path.exists(previous):
+        try:
+            with BoardPack(previous) as old:
+                if old.version != VERSION or old.directory != base:
+                    # its segments have another layout or other media paths.
+                    raise PackError(f'{previous}: not reusable')
+                for index in range(len(old.rounds)):
+                    for _, digest, offset, length, _ in old.categories(index):
+                        reusable[digest] = bytes(old.data[offset:offset + length])
+        except PackError:
+            pass
+
+    stats = {'encoded': 0, 'reused': 0}
+    category_count = sum(len(names) for _, _, names in rounds)
+    tables_end = HEADER.size + ROUND.size * len(rounds) + CATEGORY.size * category_count
+
+    segments = bytearray()
+    names = bytearray()
+    round_entries = []
+    category_tables = []
+
+    def add_name(text: str) -> tuple:
+        encoded = text.encode('utf-8')
+        names.extend(encoded)
+        return len(names) - len(encoded), len(encoded)
+
+    for round_name, all_questions, category_names in rounds:
+        table = []
+        for name, questions in zip(category_names, all_questions):
+            questions = list(questions)
+            digest = category_hash(name, questions, base)
+            segment = reusable.get(digest)
+            if segment is None:
+                segment = encode_segment(questions, base)
+                stats['encoded'] += 1
+            else:
+                stats['reused'] += 1
+            table.append((add_name(name), digest, len(segments), len(segment), len(questions)))
+            segments.extend(segment)
+        round_entries.append((add_name(round_name), len(category_names)))
+        category_tables.append(table)
+
+    names_start = tables_end + len(segments)
+    output = bytearray(HEADER.pack(MAGIC, VERSION, 0, len(rounds)))
+    table_offset = HEADER.size + ROUND.size * len(rounds)
+    for ((name_offset, name_length), count), table in zip(round_entries, category_tables):
+        output += ROUND.pack(names_start + name_offset, name_length, count, table_offset)
+        table_offset += CATEGORY.size * len(table)
+    for table in category_tables:
+        for (name_offset, name_length), digest, offset, length, count in table:
+            output += CATEGORY.pack(
+                names_start + name_offset, name_length, digest,
+                tables_end + offset, length, count
+            )
+    output += segments
+    output += names
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(output)
+    os.replace(tmp_path, path)
+    return stats
+
+
+def compile_board(source: str, path: str) -> dict:
+    '''
+    Function to compile every round of a board file into a pack.
+        Categories that haven't changed since the last compile are reused.
+
+        Parameters:
+            source: board file (.json, .toml, .csv or .tsv).
+            path: pack to write.
+    '''
+    from .board_loader import load_board, round_names
+
+    rounds = []
+    for index, round_name in enumerate(round_names(source)):
+        all_questions, category_names = load_board(source, round=index)
+        rounds.append((round_name, all_questions, category_names))
+    return write_pack(path, rounds, previous=path)
+
+
+def load_pack(path: str, round=0) -> tuple:
+    '''
+    Function to load one round of a pack, like board_loader.load_board.
+        The pack stays open for as long as the board is used.
+    '''
+    return BoardPack(path).load_board(round)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print('usage: python -m Program_files.board_pack SOURCE PACK')
+        sys.exit(2)
+
+    from .board_loader import BoardError
+
+    try:
+        stats = compile_board(sys.argv[1], sys.argv[2])
+    except BoardError as error:
+        sys.exit(str(error))
+    print(f'{sys.argv[2]}: {stats["encoded"]} categories encoded, '
+          f'{stats["reused"]} unchanged')
@@ -0,0 +1,266 @@
+'''
+Script with the network buzzer server.
+
+Players buzz in from their own devices on the local network instead of shouting.
+The server runs an asyncio event loop in a background thread, next to the Qt
+event loop, and the game window arms it when a question is opened.
+
+Every buzz is stamped with time.monotonic() as soon as the server reads it, and
+the earliest stamp wins, not the first buzz the server gets round to handling.
+Like on the show, a player who buzzes before the buzzers are armed is locked out
+for `lockout` seconds.
+
+Protocol, one line of UTF-8 text per message:
+    player -> server
+        JOIN <team name or number>   play for a team (several devices can join
+                                     the same team).
+        BUZZ                         buzz in.
+    server -> player
+        WELCOME <team number> <team name>
+        ERROR <reason>
+        ARMED                        a question is open, buzz now.
+        CLOSED                       the question is over.
+        WON                          your buzz was first.
+        LATE                         another buzz was first.
+        LOCKED <ms>                  buzzed too early, buzzes are ignored for <ms>.
+
+To buzz from a computer type:
+    python -m Program_files.buzzer HOST PORT TEAM
+and press Enter to buzz. Phones can use any TCP terminal app.
+'''
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+
+DEFAULT_PORT = 8765
+DEFAULT_LOCKOUT = 0.25
+
+
+class _PlayerConnection(asyncio.Protocol):
+    '''
+    Class for the connection of one player device.
+    '''
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b''
+        self.team_index = None
+        self.locked_until = 0.0
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        self.server.players.add(self)
+
+    def connection_lost(self, exc) -> None:
+        self.server.players.discard(self)
+
+    def data_received(self, data: bytes) -> None:
+        # stamped before anything else, this is the time the buzz is judged on.
+        stamp = time.monotonic()
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(b'\n')
+        if len(self.buffer) > 1024:  # not a player
+            self.transport.close()
+            return
+        for line in lines:
+            command, _, argument = line.decode('utf-8', 'replace').strip().partition(' ')
+            command = command.upper()
+            if command == 'BUZZ':
+                self.server.buzz(self, stamp)
+            elif command == 'JOIN':
+                self.server.join(self, argument.strip())
+            elif command:
+                self.send(f'ERROR unknown command {command}')
+
+    def send(self, message: str) -> None:
+        if not self.transport.is_closing():
+            self.transport.write(message.encode('utf-8') + b'\n')
+
+
+class BuzzerServer():
+    '''
+    Class to take buzzes from the players' devices and pick the first one.
+    '''
+
+    def __init__(self, host='0.0.0.0', port=DEFAULT_PORT, lockout=DEFAULT_LOCKOUT):
+        '''
+            Parameters:
+                host: address to listen on, all of them by default.
+                port: TCP port to listen on, 0 for any free port.
+                lockout: seconds a player is locked out for buzzing too early.
+        '''
+        self.host = host
+        self.port = port
+        self.lockout = lockout
+
+        self.team_names = []
+        self.on_buzz = None
+        self.players = set()
+
+        # state of the current question, only used in the server's thread.
+        self.armed = False
+        self.armed_at = 0.0
+        self.pending = []  # (stamp, player) of the buzzes not judged yet
+        self.winner = None
+
+        self.loop = None
+        self.server = None
+        self.thread = None
+
+    # Game side, called from the GUI thread
+
+    def start(self, team_names: list, on_buzz=None) -> None:
+        '''
+        Function to start the server in a background thread.
+            Raises OSError if the port can't be used.
+
+            Parameters:
+                team_names: names of the teams players can join.
+                on_buzz: function called as on_buzz(team_index, reaction_time)
+                    from the server's thread when a team wins the buzz.
+        '''
+        self.team_names = list(team_names)
+        self.on_buzz = on_buzz
+        started = threading.Event()
+        error = []
+
+        def run() -> None:
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.server = self.loop.run_until_complete(self.loop.create_server(
+                    lambda: _PlayerConnection(self), self.host, self.port
+                ))
+            except OSError as exc:
+                error.append(exc)
+                started.set()
+                self.loop.close()
+                return
+            self.port = self.server.sockets[0].getsockname()[1]
+            started.set()
+            self.loop.run_forever()
+
+            self.server.close()
+            for player in list(self.players):
+                player.transport.close()
+            self.loop.run_until_complete(self.server.wait_closed())
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name='buzzer server', daemon=True)
+        self.thread.start()
+        started.wait()
+        if error:
+            self.thread = None
+            raise error[0]
+
+    def stop(self) -> None:
+        '''
+        Function to disconnect the players and stop the server.
+        '''
+        if self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+
+    def arm(self) -> None:
+        '''
+        Function to let the players buzz in for a new question.
+        '''
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self._arm)
+
+    def close(self) -> None:
+        '''
+        Function to stop taking buzzes for the question.
+        '''
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self._close)
+
+    # Server side, run in the server's thread
+
+    def _broadcast(self, message: str) -> None:
+        for player in self.players:
+            player.send(message)
+
+    def _arm(self) -> None:
+        self.armed = True
+        self.armed_at = time.monotonic()
+        self.pending = []
+        self.winner = None
+        self._broadcast('ARMED')
+
+    def _close(self) -> None:
+        self.armed = False
+        self.pending = []
+        # buzzes from now on are early for the next question, not late for this one.
+        self.winner = None
+        self._broadcast('CLOSED')
+
+    def join(self, player: _PlayerConnection, team: str) -> None:
+        lowered = [name.lower() for name in self.team_names]
+        if team.isdigit() and 1 <= int(team) <= len(self.team_names):
+            player.team_index = int(team) - 1
+        elif team.lower() in lowered:
+            player.team_index = lowered.index(team.lower())
+        else:
+            player.send(f'ERROR no team {team!r}')
+            return
+        player.send(f'WELCOME {player.team_index + 1} '
+                    f'{self.team_names[player.team_index]}')
+
+    def buzz(self, player: _PlayerConnection, stamp: float) -> None:
+        if player.team_index is None:
+            player.send('ERROR join a team first')
+        elif stamp < player.locked_until:
+            player.send(f'LOCKED {(player.locked_until - stamp) * 1000:.0f}')
+        elif not self.armed:
+            if self.winner is None:
+                player.locked_until = stamp + self.lockout
+                player.send(f'LOCKED {self.lockout * 1000:.0f}')
+            else:
+                player.send('LATE')
+        else:
+            if not self.pending:
+                # judged once every buzz read in this pass of the loop is stamped.
+                self.loop.call_soon(self._judge)
+            self.pending.append((stamp, player))
+
+    def _judge(self) -> None:
+        if not self.armed or not self.pending:
+            return
+        stamp, winner = min(self.pending, key=lambda buzz: buzz[0])
+        self.armed = False
+        self.winner = winner
+        for _, player in self.pending:
+            player.send('WON' if player is winner else 'LATE')
+        self.pending = []
+        if self.on_buzz is not None:
+            self.on_buzz(winner.team_index, stamp - self.armed_at)
+
+
+def _play(host: str, port: int, team: str) -> None:
+    with socket.create_connection((host, port)) as connection:
+        connection.sendall(f'JOIN {team}\n'.encode('utf-8'))
+
+        def show_messages() -> None:
+            for line in connection.makefile(encoding='utf-8'):
+                print(line.strip())
+            print('disconnected')
+
+        threading.Thread(target=show_messages, daemon=True).start()
+        for _ in sys.stdin:  # Enter buzzes
+            connection.sendall(b'BUZZ\n')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 4:
+        print('usage: python -m Program_files.buzzer HOST PORT TEAM')
+        sys.exit(2)
+    try:
+        _play(sys.argv[1], int(sys.argv[2]), sys.argv[3])
+    except (OSError, KeyboardInterrupt) as error:
+        sys.exit(str(error))
@@ -0,0 +1,252 @@
+'''
+Script with the game engine.
+
+The engine holds all of the game state: the board, the teams and their points,
+which questions have been opened/answered and a log of every turn. Points are
+kept in a score ledger (Program_files/ledger.py), so they can be undone. It doesn't
+use PyQt5; the windows register listeners and redraw themselves when the engine
+tells them something changed.
+
+Listeners are called as listener(event, **data) with one of these events:
+    'question_opened'   col, row
+    'answer_revealed'   col, row
+    'points_changed'    team_index, points, entry (the ledger Entry)
+    'round_started'     round (the board was replaced by the next round's)
+'''
+
+from collections import namedtuple
+
+from .ledger import ScoreLedger
+from .models import BoardFlags, Question, Team
+from . import tracing
+
+
+# one entry of the turn log, points are logged in the ledger instead.
+#   kind: 'open' or 'reveal'
+#   col, row: question on the board.
+Turn = namedtuple('Turn', ['kind', 'col', 'row'])
+
+
+def column_points(column, row: int) -> float:
+    '''
+    Function to get how many points a question in a column is worth.
+        Boards from a pack read the points without loading the question.
+    '''
+    if hasattr(column, 'points'):
+        return column.points(row)
+    return column[row].get_points()
+
+
+class GameEngine():
+    '''
+    Class to run a game without any windows.
+    '''
+
+    def __init__(self, questions: list, category_names: list, team_names: list):
+        # board, and how many rounds were played before it in this game.
+        self.all_questions = questions
+        self.category_names = category_names
+        self.round = 0
+
+        # teams, kept in the order they were entered.
+        self.team_names = list(team_names)
+        self.teams = {name: Team(name) for name in self.team_names}
+        self.team_list = list(self.teams.values())
+        self.ledger = ScoreLedger(len(self.team_list))
+
+        # reveal state of each question, indexed (col, row)
+        self.opened = BoardFlags(map(len, questions))
+
+        # question currently being played, (col, row) or None.
+        self.current = None
+
+        self.log = []
+        self.listeners = []
+
+    def add_listener(self, listener) -> None:
+        '''
+        Function to register a function called on every state change.
+
+            Parameters:
+                listener: function called as listener(event, **data).
+        '''
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        '''
+        Function to remove a listener added with add_listener.
+        '''
+        self.listeners.remove(listener)
+
+    def notify(self, event: str, **data) -> None:
+        '''
+        Function to tell the listeners about a state change.
+        '''
+        if tracing.enabled:
+            # one span per listener, so a trace shows which one is slow.
+            for listener in self.listeners:
+                with tracing.span(getattr(listener, '__qualname__', repr(listener)),
+                                  event=event):
+                    listener(event, **data)
+            return
+        for listener in self.listeners:
+            listener(event, **data)
+
+    # Board
+
+    def get_question(self, col: int, row: int) -> Question:
+        '''
+        Function to get a question on the board.
+
+            Parameters:
+                col: column (category) of the question.
+                row: row of the question in the column.
+        '''
+        return self.all_questions[col][row]
+
+    def question_points(self, col: int, row: int) -> float:
+        '''
+        Function to get how many points a question on the board is worth.
+            Boards from a pack read the points without loading the question.
+        '''
+        return column_points(self.all_questions[col], row)
+
+    def next_round(self, questions: list, category_names: list) -> None:
+        '''
+        Function to replace the board with the next round's.
+            The teams keep their points.
+
+            Parameters:
+                questions: list of columns (categories) of Question objects.
+                category_names: list of category names.
+        '''
+        self.all_questions = questions
+        self.category_names = category_names
+        self.opened = BoardFlags(map(len, questions))
+        self.current = None
+        self.round += 1
+        self.notify('round_started', round=self.round)
+
+    def is_opened(self, col: int, row: int) -> bool:
+        '''
+        Function to check if a question's answer has been shown.
+        '''
+        return self.opened.get(col, row)
+
+    def questions_left(self) -> int:
+        '''
+        Function to count the questions whose answer hasn't been shown.
+        '''
+        return len(self.opened) - self.opened.count()
+
+    def open_question(self, col: int, row: int) -> Question:
+        '''
+        Function to start playing a question.
+
+            Parameters:
+                col: column (category) of the question.
+                row: row of the question in the column.
+
+            Returns:
+                the Question object.
+        '''
+        self.current = (col, row)
+        self.log.append(Turn('open', col, row))
+        self.notify('question_opened', col=col, row=row)
+        return self.all_questions[col][row]
+
+    def reveal_answer(self, col=None, row=None) -> None:
+        '''
+        Function to mark a question's answer as shown.
+            Defaults to the question currently being played.
+        '''
+        if col is None:
+            col, row = self.current
+        if self.opened.get(col, row):
+            return
+        self.opened.set(col, row)
+        self.log.append(Turn('reveal', col, row))
+        self.notify('answer_revealed', col=col, row=row)
+
+    # Teams and scoring
+
+    def get_team(self, team_index: int) -> Team:
+        '''
+        Function to get a team by its position.
+        '''
+        return self.team_list[team_index]
+
+    def get_points(self, team_index: int) -> float:
+        '''
+        Function to get a team's points.
+        '''
+        return self.ledger.total(team_index)
+
+    def scores(self) -> list:
+        '''
+        Function to get every team's points, in team order.
+        '''
+        return list(self.ledger.totals)
+
+    def _points_changed(self, entry) -> None:
+        # keeps the Team object in step with the ledger, then redraws.
+        points = self.ledger.total(entry.team_index)
+        self.team_list[entry.team_index].set_points(points)
+        self.notify('points_changed', team_index=entry.team_index,
+                    points=points, entry=entry)
+
+    def award(self, team_index: int, points=None) -> None:
+        '''
+        Function to give points to a team.
+            Negative points take points away.
+
+            Parameters:
+                team_index: position of the team.
+                points: how many points, defaults to the current question's points.
+        '''
+        question = self.current
+        if points is None:
+            points = self.get_question(*question).get_points()
+        self._points_changed(self.ledger.award(team_index, points, question))
+
+    def deduct(self, team_index: int, points=None) -> None:
+        '''
+        Function to take points away from a team, e.g. for a wrong answer.
+            Defaults to the current question's points.
+        '''
+        question = self.current
+        if points is None:
+            points = self.get_question(*question).get_points()
+        self._points_changed(self.ledger.deduct(team_index, points, question))
+
+    def set_points(self, team_index: int, points: float) -> None:
+        '''
+        Function to overwrite a team's points (manual edit by the host).
+        '''
+        self._points_changed(self.ledger.override(team_index, points))
+
+    def undo(self) -> bool:
+        '''
+        Function to undo the last change to the points.
+
+            Returns:
+                False if there was nothing to undo.
+        '''
+        entry = self.ledger.undo()
+        if entry is None:
+            return False
+        self._points_changed(entry)
+        return True
+
+    def redo(self) -> bool:
+        '''
+        Function to redo the last undone change to the points.
+
+            Returns:
+                False if there was nothing to redo.
+        '''
+        entry = self.ledger.redo()
+        if entry is None:
+            return False
+        self._points_changed(entry)
+        return True
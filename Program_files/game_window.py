@@ -1,58 +1,22 @@
+import threading
+
 from PyQt5.QtWidgets import QMainWindow, QWidget, QSizePolicy
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import Qt, pyqtSignal, QUrl
+from PyQt5 import QtWidgets
+from .ui_loader import load_ui
+from .theme import apply_theme, mark
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer, QUrl
 from .question_window import QuestionWindow, Question
-from PyQt5.QtGui import QIntValidator, QIcon
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-
-
-class Team():
-    '''
-    Team Class
-    '''
-
-    def __init__(self, name: str, points=0):
-        self.name = name  # team name
-        self.points = points  # points
-
-    def get_name(self) -> str:
-        '''
-        Function to get team name.
-        '''
-        return self.name
-
-    def get_points(self) -> float:
-        '''
-        Function to get points.
-        '''
-        return self.points
+from .models import Team
+from .engine import GameEngine, column_points
+from .journal import GameJournal
+from .audio import get_audio_engine
+from .idle import IdleScheduler, LOW, NORMAL
+from .media import PREFETCH_PRIORITY, display_size
+from .scoreboard import ScoreboardModel, set_up_team_view
+from . import tracing
+from PyQt5.QtGui import QIcon
 
-    def set_points(self, points: float) -> None:
-        '''
-        Function to set points.
-
-            Parameter:
-                points: how many points to set
-        '''
-        self.points = points
-
-    def add_points(self, points: float) -> None:
-        '''
-        Function to add points.
-
-            Parameter:
-                points: how many points to add.
-        '''
-        self.points = self.points + points
-
-    def remove_points(self, points: float) -> None:
-        '''
-        Function to remove points.
-
-            Parameter:
-                points: how many points to remove.
-        '''
-        self.points = self.points - points
+POLISH_STEP = 20  # widgets of the next round's board styled per idle step
 
 
 class GameWindow(QMainWindow):
@@ -60,70 +24,112 @@ class GameWindow(QMainWindow):
     Class to handle the game window
     '''
 
-    def __init__(self, team_names: list, category_names: list, questions: list, parent=None):
+    def __init__(self, team_names=None, category_names=None, questions=None,
+                 parent=None, engine=None, autosave=True, buzzer=None,
+                 spectator_feed=None, round_loader=None):
+        '''
+            Parameters:
+                team_names, category_names, questions: the game to start.
+                parent: MenuWindow.
+                engine: GameEngine of a game to carry on instead, e.g. one
+                    rebuilt by Program_files/journal.py.
+                autosave: False to not journal the game.
+                buzzer: BuzzerServer to take buzzes from the players' devices.
+                spectator_feed: SpectatorFeed to show the game to spectators.
+                round_loader: function called as round_loader(rounds played)
+                    in a background thread, returning the next round's
+                    (questions, category_names), or None after the last round.
+        '''
         super(GameWindow, self).__init__(parent=parent)
-        uic.loadUi('UI_Files/game_window.ui', self)
-        self.showMaximized()
-
-        self.team_names = team_names
-        self.team_objects = self.make_teams()
+        with tracing.span('load_ui'):
+            load_ui('game_window', self)
+        with tracing.span('apply_theme'):
+            apply_theme()
+        with tracing.span('showMaximized'):
+            self.showMaximized()
+
+        # game state, the windows only display it.
+        if engine is None:
+            engine = GameEngine(
+                questions=questions,
+                category_names=category_names,
+                team_names=team_names
+            )
+        self.engine = engine
+        team_names = engine.team_names
+        category_names = engine.category_names
+        questions = engine.all_questions
+        self.team_objects = self.engine.teams
 
         # variables to store and keep track of things
         self.team_names = team_names
         self.category_names = category_names
         self.all_questions = questions
-        self.question_window = None
         self.music_muted = False
 
-        # Main Frame
-        self.main_frame = self.findChild(QtWidgets.QFrame, 'main_frame')
-
-        # toolbar
-        self.action_toggle_mute = self.findChild(
-            QtWidgets.QAction, "actionMute"
-        )
+        # toolbar, the widgets named in the .ui file are attributes set by load_ui.
+        self.action_toggle_mute = self.actionMute
         self.action_toggle_mute.triggered.connect(self.toggle_mute)
+        self.action_undo = self.actionUndo
+        self.action_undo.triggered.connect(self.undo_points)
+        self.action_redo = self.actionRedo
+        self.action_redo.triggered.connect(self.redo_points)
+        self.action_next_round = self.actionNextRound
+        self.action_next_round.triggered.connect(self.start_next_round)
 
-        # Column (Category) Headers
-        self.category_header_1 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_1'
-        )
-        self.category_header_2 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_2'
-        )
-        self.category_header_3 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_3'
-        )
-        self.category_header_4 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_4'
-        )
-        self.category_header_5 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_5'
-        )
-        self.category_header_6 = self.findChild(
-            QtWidgets.QPushButton, 'category_header_6'
-        )
-        self.category_headers = [
-            self.category_header_1, self.category_header_2, self.category_header_3, self.category_header_4, self.category_header_5, self.category_header_6
-        ]
+        # chores done on this thread when it's idle, so they never delay a click.
+        self.idle = IdleScheduler(self)
 
         # setting buttons and headers
-        self.set_up_buttons()
-        self.set_category_names(category_names)
-        self.show()
+        with tracing.span('build_board'):
+            self.build_board()
+            self.set_category_names(category_names)
+            self.show()
 
         # showing team window
-        self.team_window = TeamWindow(
-            team_names=team_names, team_objects=self.team_objects, parent=self)
-        self.team_window.show()
-
-        # object to play song
-        self.media_player = QMediaPlayer()
-        self.media_player.setMedia(
-            QMediaContent(
-                QUrl.fromLocalFile('Program_files/Jeopardy-theme-song.mp3')
-            )
-        )
+        with tracing.span('TeamWindow'):
+            self.scoreboard = ScoreboardModel(self.engine, parent=self)
+            self.engine.add_listener(self.scoreboard.on_engine_event)
+            self.team_window = TeamWindow(scoreboard=self.scoreboard, parent=self)
+            self.team_window.show()
+
+        # question window, built hidden now and reused for every question.
+        with tracing.span('QuestionWindow'):
+            self.question_window = QuestionWindow(parent=self)
+        self.prefetch_task = self.idle.schedule(self.prefetch_pictures(), LOW)
+
+        self.engine.add_listener(self.on_engine_event)
+        # a resumed game can have changes to undo already.
+        self.action_undo.setEnabled(self.engine.ledger.can_undo())
+        self.action_redo.setEnabled(self.engine.ledger.can_redo())
+
+        # every change is saved, so the game can be resumed after a crash.
+        with tracing.span('GameJournal'):
+            self.journal = GameJournal(self.engine) if autosave else None
+
+        # theme song and sound effects
+        with tracing.span('audio'):
+            self.audio = get_audio_engine()
+
+        # network buzzers, armed each time a new question is opened.
+        self.buzzer = None
+        if buzzer is not None:
+            self.start_buzzer(buzzer)
+
+        # board and scores served to other screens.
+        self.spectator_feed = None
+        if spectator_feed is not None:
+            self.start_spectator_feed(spectator_feed)
+
+        # next round, loaded and laid out while this one is played, so
+        # starting it only swaps the board shown.
+        self.round_loader = round_loader
+        self.next_round = None  # (questions, category_names, BoardPage) or Exception
+        self.next_round_task = None  # IdleTask laying out the next round
+        self.round_relay = RoundRelay(self)
+        self.round_relay.loaded.connect(self.build_next_round)
+        if round_loader is not None:
+            QTimer.singleShot(0, self.preload_next_round)
 
     def closeEvent(self, event) -> None:
         '''
@@ -139,6 +145,14 @@ class GameWindow(QMainWindow):
         msg.setDefaultButton(QtWidgets.QMessageBox.Yes)
         user = msg.exec_()
         if user == QtWidgets.QMessageBox.Yes:
+            self.idle.stop()
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            if self.buzzer is not None:
+                self.buzzer.stop()
+            if self.spectator_feed is not None:
+                self.spectator_feed.stop()
             if self.parent().isVisible():
                 self.parent().close()
             event.accept()
@@ -153,387 +167,436 @@ class GameWindow(QMainWindow):
         Function to toggle the music volume.
         '''
         self.music_muted = not self.music_muted  # switches bool state.
-        self.media_player.setMuted(self.music_muted)
+        self.audio.set_muted(self.music_muted)
 
         if self.music_muted:
             self.action_toggle_mute.setText('Unmute Music')
         else:
             self.action_toggle_mute.setText('Mute Music')
 
-    def make_teams(self) -> None:
+    def undo_points(self) -> None:
+        '''
+        Function to undo the last change to a team's points.
+        '''
+        with tracing.span('GameWindow.undo_points'):
+            self.engine.undo()
+
+    def redo_points(self) -> None:
+        '''
+        Function to redo the last undone change to a team's points.
+        '''
+        with tracing.span('GameWindow.redo_points'):
+            self.engine.redo()
+
+    def on_engine_event(self, event: str, **data) -> None:
+        '''
+        Function to update the undo/redo actions when the points change.
+        '''
+        if event == 'points_changed':
+            self.action_undo.setEnabled(self.engine.ledger.can_undo())
+            self.action_redo.setEnabled(self.engine.ledger.can_redo())
+        elif event == 'round_started':
+            self.show_next_round()
+        elif self.buzzer is None:
+            return
+        elif event == 'question_opened':
+            if not self.engine.is_opened(data['col'], data['row']):
+                self.buzzer.arm()
+        elif event == 'answer_revealed':
+            self.buzzer.close()
+
+    def start_buzzer(self, buzzer) -> None:
+        '''
+        Function to start the buzzer server, the game is played without it
+            if it can't be started.
+
+            Parameters:
+                buzzer: BuzzerServer, not started yet.
+        '''
+        # the server's thread emits the signal, so the slot runs in this one.
+        self.buzzer_relay = BuzzerRelay(self)
+        self.buzzer_relay.buzzed.connect(self.question_window.show_buzz)
+        try:
+            buzzer.start(self.engine.team_names, self.buzzer_relay.buzzed.emit)
+        except OSError as error:
+            self.show_not_started('buzzers', buzzer.port, error)
+            return
+        self.buzzer = buzzer
+
+    def start_spectator_feed(self, feed) -> None:
         '''
-        Function to make the teams
+        Function to start serving the game to spectators, the game is played
+            without it if it can't be started.
+
+            Parameters:
+                feed: SpectatorFeed, not started yet.
         '''
-        teams = {}
-        for name in self.team_names:
-            teams[name] = Team(name)
-        return teams
+        try:
+            feed.start(self.engine)
+        except OSError as error:
+            self.show_not_started('spectator feed', feed.port, error)
+            return
+        self.spectator_feed = feed
 
-    def toggle_header_btns(self, enabled=False) -> None:
+    def show_not_started(self, name: str, port: int, error: OSError) -> None:
+        '''
+        Function to tell the host a network service couldn't be started.
+        '''
+        msg = QtWidgets.QMessageBox(self)
+        msg.setWindowTitle(f"Jeopardy! - {name.capitalize()} Not Started")
+        pixmapi = getattr(QtWidgets.QStyle, "SP_MessageBoxWarning")
+        icon = self.style().standardIcon(pixmapi)
+        msg.setWindowIcon(icon)
+        msg.setText(f"\nCould not start the {name} on port {port}:\n\n{error}\n")
+        msg.setStandardButtons(
+            QtWidgets.QMessageBox.Ok
+        )
+        msg.exec_()
+
+    def toggle_header_btns(self, enabled=False, headers=None) -> None:
         '''
         Function to toggle the header buttons, used in editting mode.
 
             Parameters:
                 enabled: True -  button is activated.
+                headers: header buttons, the shown board's by default.
         '''
-        for cat in self.category_headers:
+        if headers is None:
+            headers = self.category_headers
+        for cat in headers:
             cat.setEnabled(enabled)
 
-    def set_category_names(self, names: list) -> None:
+    def set_category_names(self, names: list, headers=None) -> None:
         '''
         Function set the  column (category) label text
 
             Parameters:
                 names: list of names for each column (category).
+                headers: header buttons to set, the shown board's by default.
         '''
-        self.toggle_header_btns()
+        if headers is None:
+            headers = self.category_headers
+        self.toggle_header_btns(headers=headers)
         for index, name in enumerate(names):
-            self.category_headers[index].setText(name)
-
-        for cat in self.category_headers:
-            cat.setStyleSheet(
-                '''
-                QPushButton {
-                    color: white;
-                    font-size: 45px;
-                    background-color: rgb(50, 50, 255);
-                    padding: 5px;
-                }
-                '''
-            )
+            headers[index].setText(name)
 
-    def set_up_buttons(self) -> None:
+        mark(headers, 'category_header')
+
+    def build_board(self) -> None:
         '''
-        Function to set up buttons and add styles.
+        Function to make a header for each category and a button for each
+        question, in the shape of the loaded board.
         '''
+        self.set_board(self.make_board(self.main_frame, self.all_questions))
 
-        for btn in self.findChildren(QtWidgets.QPushButton):
-            if btn not in self.category_headers:
-                btn.setStyleSheet(
-                    '''
-                QPushButton {
-                    background-color: rgb(50, 50, 255);
-                    color: rgb(255, 170, 0);
-                    font: Arial Bold;
-                    font-size: 40px;
-                }
+        # questions already answered in a resumed game.
+        mark([
+            btn for col, buttons in enumerate(self.board_buttons)
+            for row, btn in enumerate(buttons) if self.engine.is_opened(col, row)
+        ], 'opened')
 
-                QPushButton:hover {
-                    background-color: rgb(100, 100, 255);
-                }
+    def new_board_frame(self) -> QtWidgets.QFrame:
+        '''
+        Function to add a frame for another board to board_stack, set up
+            like the one shown.
+        '''
+        frame = QtWidgets.QFrame(self.board_stack)
+        frame.setFrameShape(self.main_frame.frameShape())
+        frame.setFrameShadow(self.main_frame.frameShadow())
+        layout = QtWidgets.QGridLayout(frame)
+        shown = self.main_frame.layout()
+        layout.setContentsMargins(shown.contentsMargins())
+        layout.setHorizontalSpacing(shown.horizontalSpacing())
+        layout.setVerticalSpacing(shown.verticalSpacing())
+        self.board_stack.addWidget(frame)
+        return frame
 
-                '''
-                )
+    def make_board(self, frame: QtWidgets.QFrame, questions: list):
+        '''
+        Function to fill a frame with the headers and question buttons of a board.
 
-        self.findChild(QtWidgets.QPushButton, 'question_1').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_2').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_3').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_4').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_5').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_6').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[0][5])
-        )
+            Parameters:
+                frame: frame with a grid layout, in board_stack.
+                questions: list of columns (categories) of Question objects.
 
-        self.findChild(QtWidgets.QPushButton, 'question_7').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_8').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_9').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_10').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_11').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_12').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[1][5])
-        )
+            Returns:
+                BoardPage with the widgets.
+        '''
+        layout = frame.layout()
+        page = BoardPage(frame)
 
-        self.findChild(QtWidgets.QPushButton, 'question_13').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_14').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_15').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_16').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_17').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_18').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[2][5])
+        # one group for every question button, its id is its place in
+        # cell_positions, so a click goes straight to the (col, row).
+        page.cell_group = QtWidgets.QButtonGroup(frame)
+        page.cell_group.idClicked.connect(
+            lambda cell_id: self.open_question_window(*page.cell_positions[cell_id])
         )
 
-        self.findChild(QtWidgets.QPushButton, 'question_19').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_20').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_21').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_22').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_23').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_24').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[3][5])
-        )
+        for col, column in enumerate(questions):
+            header = QtWidgets.QPushButton('Category', frame)
+            header.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+            layout.addWidget(header, 0, col)
+            page.category_headers.append(header)
 
-        self.findChild(QtWidgets.QPushButton, 'question_25').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_26').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_27').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_28').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_29').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_30').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[4][5])
-        )
+            buttons = []
+            for row in range(len(column)):
+                points = column_points(column, row)
+                btn = QtWidgets.QPushButton('{:.0f}'.format(points), frame)
+                btn.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+                layout.addWidget(btn, row + 1, col)
+                page.cell_group.addButton(btn, len(page.cell_positions))
+                page.cell_positions.append((col, row))
+                buttons.append(btn)
+            page.board_buttons.append(buttons)
 
-        self.findChild(QtWidgets.QPushButton, 'question_31').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][0])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_32').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][1])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_33').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][2])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_34').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][3])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_35').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][4])
-        )
-        self.findChild(QtWidgets.QPushButton, 'question_36').clicked.connect(
-            lambda: self.open_question_window(
-                self.all_questions[5][5])
-        )
+        # every column and row of questions gets the same space.
+        for col in range(len(questions)):
+            layout.setColumnStretch(col, 1)
+        for row in range(max(map(len, questions), default=0)):
+            layout.setRowStretch(row + 1, 1)
 
-    def make_teams(self) -> None:
+        mark(page.cell_group.buttons(), 'cell')
+        return page
+
+    def set_board(self, page) -> None:
         '''
-        Function to make the teams
+        Function to make a board the one played and shown.
+
+            Parameters:
+                page: BoardPage from make_board().
         '''
-        teams = {}
-        for name in self.team_names:
-            teams[name] = Team(name)
-        return teams
+        self.main_frame = page.frame
+        self.category_headers = page.category_headers
+        self.board_buttons = page.board_buttons  # [col][row]
+        self.cell_group = page.cell_group
+        self.cell_positions = page.cell_positions
+        self.board_stack.setCurrentWidget(page.frame)
 
-    def open_question_window(self, questionObj: Question) -> None:
+    def preload_next_round(self) -> None:
+        '''
+        Function to start loading the next round's board in a background thread.
+        '''
+        self.next_round = None
+        self.action_next_round.setEnabled(False)
+        played = self.engine.round + 1
+        relay = self.round_relay
+        loader = self.round_loader
+
+        def load() -> None:
+            try:
+                board = loader(played)
+            except Exception as error:
+                board = error
+            relay.loaded.emit(played, board)
+
+        threading.Thread(target=load, name='round loader', daemon=True).start()
+
+    def build_next_round(self, played: int, board) -> None:
+        '''
+        Function to have the widgets of the next round's board made, hidden
+            behind the board being played, once it has been loaded.
+
+            Parameters:
+                played: rounds played before it.
+                board: (questions, category_names), None if there's no next
+                    round, or the Exception raised loading it.
+        '''
+        if played != self.engine.round + 1 or board is None:
+            return
+        if isinstance(board, Exception):
+            # told to the host when they try to start it.
+            self.next_round = board
+            self.action_next_round.setEnabled(True)
+            return
+
+        self.next_round_task = self.idle.schedule(self.lay_out_next_round(*board), NORMAL)
+
+    def lay_out_next_round(self, questions: list, category_names: list):
+        '''
+        Function to make, style and lay out the next round's board, a step at a
+            time, run by the idle scheduler.
+        '''
+        frame = self.new_board_frame()
+        try:
+            with tracing.span('GameWindow.build_next_round'):
+                page = self.make_board(frame, questions)
+                self.set_category_names(category_names, page.category_headers)
+            yield
+
+            # styled and laid out now, so the swap only has to show it.
+            page.frame.setGeometry(self.main_frame.geometry())
+            widgets = page.category_headers + page.cell_group.buttons()
+            for start in range(0, len(widgets), POLISH_STEP):
+                for widget in widgets[start:start + POLISH_STEP]:
+                    widget.ensurePolished()
+                yield
+            page.frame.layout().activate()
+        except GeneratorExit:
+            # cancelled, the round was started before it was laid out.
+            self.board_stack.removeWidget(frame)
+            frame.deleteLater()
+            raise
+
+        self.next_round = (questions, category_names, page)
+        self.next_round_task = None
+        self.action_next_round.setEnabled(True)
+
+    def start_next_round(self) -> None:
+        '''
+        Function to play the next round, the teams keep their points.
+        '''
+        if isinstance(self.next_round, Exception):
+            msg = QtWidgets.QMessageBox(self)
+            msg.setWindowTitle("Jeopardy! - Next Round Not Loaded")
+            pixmapi = getattr(QtWidgets.QStyle, "SP_MessageBoxWarning")
+            icon = self.style().standardIcon(pixmapi)
+            msg.setWindowIcon(icon)
+            msg.setText(f"\nCould not load the next round:\n\n{self.next_round}\n")
+            msg.setStandardButtons(
+                QtWidgets.QMessageBox.Ok
+            )
+            msg.exec_()
+            return
+        if self.next_round is None:
+            return
+
+        with tracing.span('GameWindow.start_next_round'):
+            self.question_window.hide()
+            self.audio.stop_theme()
+            questions, category_names, _ = self.next_round
+            # the engine's 'round_started' event swaps the board.
+            self.engine.next_round(questions, category_names)
+
+    def show_next_round(self) -> None:
+        '''
+        Function to show the board of the round the engine has started.
+        '''
+        if self.buzzer is not None:
+            self.buzzer.close()
+        if self.next_round_task is not None:
+            self.next_round_task.cancel()
+            self.next_round_task = None
+        self.prefetch_task.cancel()
+
+        old = self.main_frame
+        if self.next_round is not None and self.next_round[0] is self.engine.all_questions:
+            page = self.next_round[2]
+        else:
+            # started without being preloaded, built now.
+            page = self.make_board(self.new_board_frame(), self.engine.all_questions)
+            self.set_category_names(self.engine.category_names, page.category_headers)
+        self.set_board(page)
+        self.all_questions = self.engine.all_questions
+        self.category_names = self.engine.category_names
+
+        self.board_stack.removeWidget(old)
+        old.deleteLater()
+
+        self.next_round = None
+        self.action_next_round.setEnabled(False)
+        self.prefetch_task = self.idle.schedule(self.prefetch_pictures(), LOW)
+        if self.round_loader is not None:
+            self.preload_next_round()
+
+    def prefetch_pictures(self):
+        '''
+        Function to have the pictures of the questions not opened yet decoded
+            before they're clicked, one question a step, run by the idle scheduler.
+            Only as many as fit in the media loader's cache are fetched.
+        '''
+        media = self.question_window.media
+        size = display_size(self.question_window.screen())
+        room = media.cache.max_bytes // max(1, size.width() * size.height() * 4)
+        for col, column in enumerate(self.engine.all_questions):
+            for row in range(len(column)):
+                if room <= 0:
+                    return
+                if self.engine.is_opened(col, row):
+                    continue
+                path = column[row].get_image()
+                if path:
+                    media.request(path, size, PREFETCH_PRIORITY)
+                    room -= 1
+                yield
+
+    def open_question_window(self, col: int, row: int) -> None:
         '''
         Function to open the question window
+
+            Parameters:
+                col: column (category) of the question.
+                row: row of the question in the column.
         '''
-        btn = self.sender()
-        btn_name = btn.objectName()
-        clicked_btn = self.findChild(QtWidgets.QPushButton, btn_name)
+        with tracing.span('GameWindow.open_question_window', col=col, row=row):
+            clicked_btn = self.board_buttons[col][row]
 
-        self.question_window = QuestionWindow(
-            parent=self,
-            questionObj=questionObj,
-            clicked_btn=clicked_btn
-        )
-        self.question_window.show()
-        self.media_player.play()
+            questionObj = self.engine.open_question(col, row)
+            with tracing.span('QuestionWindow.open_question'):
+                self.question_window.open_question(
+                    questionObj=questionObj,
+                    clicked_btn=clicked_btn
+                )
+            with tracing.span('play_theme'):
+                self.audio.play_theme()
 
 
-class TeamWindow(QMainWindow):
+class BoardPage():
     '''
-    Class to run the team window for add points
+    Class with the widgets of one round's board.
     '''
 
-    def __init__(self, team_names: list, team_objects: dict, parent=None):
-        super(TeamWindow, self).__init__(parent=parent)
-        uic.loadUi('UI_Files/team_window.ui', self)
+    def __init__(self, frame: QtWidgets.QFrame):
+        self.frame = frame
+        self.category_headers = []
+        self.board_buttons = []  # [col][row]
+        self.cell_group = None
+        self.cell_positions = []
 
-        self.team_names = team_names
-        self.team_objects = team_objects
 
-        ''' Finding Widgets '''
+class RoundRelay(QObject):
+    '''
+    Class to pass the next round's board from the loading thread to the GUI thread.
+    '''
 
-        self.team_frame_1 = self.findChild(
-            QtWidgets.QFrame, "team_frame_1"
-        )
-        self.team_frame_2 = self.findChild(
-            QtWidgets.QFrame, "team_frame_2"
-        )
-        self.team_frame_3 = self.findChild(
-            QtWidgets.QFrame, "team_frame_3"
-        )
-        self.team_frame_4 = self.findChild(
-            QtWidgets.QFrame, "team_frame_4"
-        )
-        self.team_frame_5 = self.findChild(
-            QtWidgets.QFrame, "team_frame_5"
-        )
-        self.team_frame_6 = self.findChild(
-            QtWidgets.QFrame, "team_frame_6"
-        )
-        self.team_frame_7 = self.findChild(
-            QtWidgets.QFrame, "team_frame_7"
-        )
-        self.team_frame_8 = self.findChild(
-            QtWidgets.QFrame, "team_frame_8"
-        )
-        self.team_frame_9 = self.findChild(
-            QtWidgets.QFrame, "team_frame_9"
-        )
-        self.team_frame_10 = self.findChild(
-            QtWidgets.QFrame, "team_frame_10"
-        )
-        self.team_frames = [self.team_frame_1, self.team_frame_2, self.team_frame_3,
-                            self.team_frame_4, self.team_frame_5, self.team_frame_6, self.team_frame_7, self.team_frame_8, self.team_frame_9, self.team_frame_10]
-        self.hide_frames(self.team_frames)
+    # rounds played before it, (questions, category_names) / None / Exception
+    loaded = pyqtSignal(int, object)
 
-        self.lineEdit1 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_1"
-        )
-        self.lineEdit2 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_2"
-        )
-        self.lineEdit3 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_3"
-        )
-        self.lineEdit4 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_4"
-        )
-        self.lineEdit5 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_5"
-        )
-        self.lineEdit6 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_6"
-        )
-        self.lineEdit7 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_7"
-        )
-        self.lineEdit8 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_8"
-        )
-        self.lineEdit9 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_9"
-        )
-        self.lineEdit10 = self.findChild(
-            QtWidgets.QLineEdit, "lineEdit_10"
-        )
 
-        # setting lineEdit to allow only numbers.
-        for lineEdit in self.findChildren(QtWidgets.QLineEdit):
-            lineEdit.setValidator(QIntValidator())
-
-        ''' Attaching Functions to spinBox '''
-        self.lineEdit1.returnPressed.connect(self.user_change)
-        self.lineEdit2.returnPressed.connect(self.user_change)
-        self.lineEdit3.returnPressed.connect(self.user_change)
-        self.lineEdit4.returnPressed.connect(self.user_change)
-        self.lineEdit5.returnPressed.connect(self.user_change)
-        self.lineEdit6.returnPressed.connect(self.user_change)
-        self.lineEdit7.returnPressed.connect(self.user_change)
-        self.lineEdit8.returnPressed.connect(self.user_change)
-        self.lineEdit9.returnPressed.connect(self.user_change)
-        self.lineEdit10.returnPressed.connect(self.user_change)
-
-        # Showing N Teams frames
-        self.frames_to_show = []
-        for index, team_name in enumerate(self.team_names):
-            self.frames_to_show.append(self.team_frames[index])
-        self.show_frames(self.frames_to_show)
-        self.set_team_names()
-
-        # styling
-        for frame in self.team_frames:
-            frame.setStyleSheet(
-                '''
-                QFrame {
-                    border: 1px solid;
-                    background-color: rgb(50, 50, 255);
-                }
-
-                QLabel {
-                    border: none;
-                    padding: 5px;
-                    font-size: 40px;
-                    font-style: Times;
-                    color: rgb(250, 170, 0);
-                }
-
-                QLineEdit {
-                    background-color: white;
-                    font-size: 30px;
-                }
-                '''
-            )
-        self.setStyleSheet(
-            '''
-            background-color: black;
-            '''
-        )
+class BuzzerRelay(QObject):
+    '''
+    Class to pass the buzzer server's results from its thread to the GUI thread.
+    '''
+
+    # team_index, reaction time in seconds
+    buzzed = pyqtSignal(int, float)
 
-        # showing window
-        self.adjustSize()
+
+class TeamWindow(QMainWindow):
+    '''
+    Class to run the team window for add points
+    '''
+
+    def __init__(self, scoreboard: ScoreboardModel, parent=None):
+        '''
+            Parameters:
+                scoreboard: model with the teams and their points.
+                parent: the game window.
+        '''
+        super(TeamWindow, self).__init__(parent=parent)
+        load_ui('team_window', self)
+        apply_theme()
+
+        self.scoreboard = scoreboard
+        self.scoreboard.confirm = self.confirm_change
+
+        self.scoreboard_view.setModel(self.scoreboard)
+        set_up_team_view(self.scoreboard_view)
+
+        # showing window, tall enough for every team if the screen allows it.
+        header = self.height() - self.scoreboard_view.height()
+        rows = self.scoreboard_view.verticalHeader().length()
+        available = self.screen().availableGeometry().height()
+        self.resize(self.width(), min(header + rows + 2, available))
         self.show()
 
     def closeEvent(self, event) -> None:
@@ -546,38 +609,16 @@ class TeamWindow(QMainWindow):
         else:
             event.ignore()
 
-    def hide_frames(self, frames: list) -> None:
+    def confirm_change(self, team_index: int, points: float) -> bool:
         '''
-        Function to hide team sub frames.
+        Function to check before the host's edit overwrites a team's points.
 
             Parameters:
-                frames: list of frames to hide.
-        '''
-        for frame in frames:
-            frame.hide()
-
-    def show_frames(self, frames: list) -> None:
-        '''
-        Function to show team sub frames.
+                team_index: position of the team.
+                points: the team's new points.
 
-            Parameters:
-                frames: list of frames to show.
-        '''
-        for frame in frames:
-            frame.show()
-
-    def set_team_names(self) -> None:
-        '''
-        Function to set labels with set names
-        '''
-        for frame, name, in zip(self.frames_to_show, self.team_names):
-            frame.findChildren(QtWidgets.QLabel)[0].setText(name)
-            points = self.team_objects[name].get_points()
-            frame.findChildren(QtWidgets.QLineEdit)[0].setText(str(points))
-
-    def user_change(self) -> None:
-        '''
-        Function to handle LineEdit values changing
+            Returns:
+                True if the points should be changed.
         '''
 
         # Popup warning user that manualling edit points will overwrite the team points.
@@ -595,58 +636,5 @@ class TeamWindow(QMainWindow):
         )
         msg.setDefaultButton(QtWidgets.QMessageBox.Ok)
         user = msg.exec_()
+        return user == QtWidgets.QMessageBox.Ok
 
-        # checking user's response
-        sender = self.sender()
-        sender_name = sender.objectName()
-        lineEdit = self.findChild(QtWidgets.QLineEdit, sender_name)
-        team_objects = self.parent().team_objects
-        match user:
-            case QtWidgets.QMessageBox.Ok:
-                # getting what lineEdit has been editted.
-
-                points = lineEdit.text()  # user typed points.
-                lineEdit.setText(points)
-
-                # updating Team Object's points:
-                for index, frame in enumerate(self.frames_to_show):
-                    if lineEdit in frame.findChildren(QtWidgets.QLineEdit):
-                        team_name = list(team_objects)[index]
-                        team_objects[team_name].set_points(float(points))
-            case _:  # user cancels
-                for index, frame in enumerate(self.frames_to_show):
-                    if lineEdit in frame.findChildren(QtWidgets.QLineEdit):
-                        team_name = list(team_objects)[index]
-                        points = team_objects[team_name].get_points()
-                        lineEdit.setText("{:.0f}".format(points))
-
-    def points_changed(self, points=0) -> None:
-        '''
-        Function to update team points
-        '''
-
-        sender = self.sender()
-        sender_name = sender.objectName()
-
-        name_dict = {
-            1: 'lineEdit_1',
-            2: 'lineEdit_2',
-            3: 'lineEdit_3',
-            4: 'lineEdit_4',
-            5: 'lineEdit_5',
-            6: 'lineEdit_6',
-            7: 'lineEdit_7',
-            8: 'lineEdit_8',
-            9: 'lineEdit_9',
-            10: 'lineEdit_10',
-        }
-
-        key = int(sender_name.split('_')[-1])
-        self.team_to_update = self.team_objects[list(self.team_objects)[key-1]]
-
-        self.team_to_update.add_points(points)
-
-        lineEdit = self.findChild(
-            QtWidgets.QLineEdit, name_dict[float(sender_name.split('_')[-1])]
-        )
-        lineEdit.setText(str(round(self.team_to_update.get_points())))
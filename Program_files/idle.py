@@ -0,0 +1,237 @@
+'''
+Script to run background chores on the GUI thread while it is idle.
+
+Some work has to be done on the GUI thread (making widgets, turning pictures
+into pixmaps) but isn't needed right away, e.g. laying out the next round's
+board. Done in one go it would delay a click that comes in meanwhile. Instead
+each chore is a generator that does a small step of the work each time it's
+resumed, and is queued on an IdleScheduler.
+
+The scheduler runs the queued chores in slices of at most `budget` seconds
+(4 ms by default) from a 0 ms timer, which Qt only fires once the events waiting
+in the window system's queue have been handled, so clicks and key presses are
+always handled first. Nothing is run while a mouse button is held down. Chores
+of a higher priority (lower number) run first, chores of the same priority in
+the order they were queued. A step isn't started unless the slice has time left
+for it (as long as the longest step of the slice so far), a step that runs past
+the end of its slice anyway makes the slice an overrun: make the steps of that
+chore smaller.
+
+    task = scheduler.schedule(chore(), priority=LOW, name='prefetch')
+    task.cancel()
+'''
+
+import heapq
+import sys
+import time
+import traceback
+
+from PyQt5.QtCore import QObject, Qt, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from . import tracing
+
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+BUDGET = 0.004  # seconds per slice
+WAIT = 10  # ms to wait while a mouse button is held down
+
+
+def _call(function):
+    # a function is run as a chore of one step.
+    yield function()
+
+
+class IdleTask():
+    '''
+    Class for a chore queued on an IdleScheduler.
+    '''
+
+    __slots__ = ('scheduler', 'work', 'priority', 'name', 'done', 'cancelled')
+
+    def __init__(self, scheduler, work, priority: int, name: str):
+        self.scheduler = scheduler
+        self.work = work  # generator, each next() is one step
+        self.priority = priority
+        self.name = name
+        self.done = False  # if it ran to the end (or raised)
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        '''
+        Function to stop the chore, it isn't resumed again.
+        '''
+        self.scheduler.cancel(self)
+
+
+class IdleScheduler(QObject):
+    '''
+    Class to run chores in short slices while the GUI thread is idle.
+    '''
+
+    def __init__(self, parent=None, budget=BUDGET):
+        '''
+            Parameters:
+                parent: QObject the scheduler is deleted with, e.g. the game window.
+                budget: seconds each slice runs chores for.
+        '''
+        super(IdleScheduler, self).__init__(parent)
+        self.budget = budget
+
+        self.queue = []  # heap of (priority, order queued, IdleTask)
+        self.order = 0
+        self.depth = 0  # chores queued and not done or cancelled
+
+        # stats, see stats()
+        self.max_depth = 0
+        self.slices = 0
+        self.overruns = 0
+        self.longest = 0.0
+        self.steps = 0
+        self.finished = 0
+        self.cancelled = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.run_slice)
+
+    def schedule(self, work, priority=NORMAL, name='') -> IdleTask:
+        '''
+        Function to queue a chore.
+
+            Parameters:
+                work: generator doing a step of the chore each time it's resumed,
+                    or a function to run as a single step.
+                priority: HIGH, NORMAL or LOW (any int, lower runs first).
+                name: name shown in traces.
+
+            Returns:
+                IdleTask, to cancel the chore.
+        '''
+        if callable(work):
+            work = _call(work)
+        task = IdleTask(self, work, priority, name or getattr(work, '__name__', 'chore'))
+        heapq.heappush(self.queue, (priority, self.order, task))
+        self.order += 1
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        if not self.timer.isActive():
+            self.timer.start(0)
+        return task
+
+    def cancel(self, task: IdleTask) -> None:
+        '''
+        Function to stop a chore. It's removed from the queue when it comes up.
+        '''
+        if task.done or task.cancelled:
+            return
+        task.cancelled = True
+        self.depth -= 1
+        self.cancelled += 1
+        try:
+            task.work.close()  # runs its finally blocks
+        except ValueError:
+            pass  # cancelled by its own step, it isn't resumed again
+
+    def stop(self) -> None:
+        '''
+        Function to cancel every chore, e.g. when the game closes.
+        '''
+        for _, _, task in self.queue:
+            self.cancel(task)
+        self.queue.clear()
+        self.timer.stop()
+
+    def run_slice(self) -> None:
+        '''
+        Function to run the queued chores until the slice's budget is spent.
+            Called by the timer when the GUI thread is idle.
+        '''
+        if QApplication.mouseButtons() != Qt.NoButton:
+            # a click or a drag is going on.
+            self.timer.start(WAIT)
+            return
+
+        with tracing.span('IdleScheduler.run_slice'):
+            start = time.perf_counter()
+            deadline = start + self.budget
+            queue = self.queue
+            now = start
+            step = 0.0  # longest step so far, one isn't started if it wouldn't fit
+            while queue and now + step < deadline:
+                # taken off the queue while it runs, as a step can queue chores.
+                entry = heapq.heappop(queue)
+                task = entry[2]
+                if task.cancelled:
+                    continue
+                try:
+                    next(task.work)
+                except StopIteration:
+                    self._finish(task)
+                except Exception:
+                    # a broken chore mustn't stop the game or the other chores.
+                    print(f'idle chore {task.name!r} failed:', file=sys.stderr)
+                    traceback.print_exc()
+                    self._finish(task)
+                else:
+                    if not task.cancelled:
+                        heapq.heappush(queue, entry)
+                self.steps += 1
+                step = max(step, time.perf_counter() - now)
+                now = time.perf_counter()
+
+        elapsed = now - start
+        self.slices += 1
+        self.longest = max(self.longest, elapsed)
+        if elapsed > self.budget:
+            self.overruns += 1
+
+        if not self.depth:
+            self.queue.clear()
+        else:
+            # started again, not repeated, so timers that came due during the
+            # slice (e.g. a click's) are run before the next slice.
+            self.timer.start(0)
+
+    def _finish(self, task: IdleTask) -> None:
+        task.done = True
+        self.depth -= 1
+        self.finished += 1
+
+    def stats(self) -> dict:
+        '''
+        Function to get how the scheduler has done so far.
+
+            Returns: dict
+                depth: chores queued now. max_depth: most queued at once.
+                slices: slices run. overruns: slices that ran past the budget.
+                longest: seconds of the longest slice.
+                steps: chore steps run. finished, cancelled: chores.
+        '''
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'slices': self.slices,
+            'overruns': self.overruns,
+            'longest': self.longest,
+            'steps': self.steps,
+            'finished': self.finished,
+            'cancelled': self.cancelled,
+        }
+
+    def report(self, file=None) -> None:
+        '''
+        Function to print the scheduler's stats.
+
+            Parameters:
+                file: where to print, stderr by default.
+        '''
+        file = file or sys.stderr
+        stats = self.stats()
+        print(f'idle chores: {stats["finished"]} finished, {stats["cancelled"]} cancelled, '
+              f'{stats["depth"]} queued (at most {stats["max_depth"]})', file=file)
+        print(f'{stats["slices"]} slices of {stats["steps"]} steps, {stats["overruns"]} '
+              f'over {self.budget * 1000:.0f} ms, longest {stats["longest"] * 1000:.1f} ms',
+              file=file)
@@ -0,0 +1,391 @@
+'''
+Script with the autosave journal.
+
+While a game is played every change to its state (a question opened, an answer
+shown, points changed) is appended to a journal file, so the game can be resumed
+if the game or the computer stops in the middle of it. The files are written by
+a background thread, which fsyncs the records it has in small batches, so the
+windows never wait on the disk.
+
+Every `snapshot_every` records the whole state of the game is written to a
+snapshot file instead and the journal starts over. Resuming reads the snapshot
+and replays the few records after it, so it takes the same time however long
+the game went on.
+
+Files, in AUTOSAVE_DIR:
+    snapshot.json   {'version', 'game', 'seq', 'teams', 'categories', 'board',
+                    'opened', 'current', 'ledger'}, written to a temporary file
+                    and renamed, so it is never half written. 'board' is the
+                    questions, or {'pack', 'round'} for a round of a board pack.
+    journal.jsonl   first line {'game', 'seq'} naming the snapshot it follows,
+                    then one record per line:
+                        {'seq', 'event': 'open', 'col', 'row'}
+                        {'seq', 'event': 'reveal', 'col', 'row'}
+                        {'seq', 'event': 'points', 'entry': [ledger Entry]}
+
+The journal is removed when the host quits the game, so there is only something
+to resume after a crash.
+'''
+
+import json
+import os
+import queue
+import sys
+import threading
+import uuid
+
+from .board_pack import load_pack, pack_source
+from .engine import GameEngine
+from .ledger import Entry, ScoreLedger
+from .models import BoardFlags, Question
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AUTOSAVE_DIR = os.path.join(ROOT, 'autosave')
+SNAPSHOT_FILE = 'snapshot.json'
+JOURNAL_FILE = 'journal.jsonl'
+
+VERSION = 1
+
+
+class JournalWriter():
+    '''
+    Class to write the journal and snapshots from a background thread.
+    '''
+
+    def __init__(self, directory=AUTOSAVE_DIR, batch_size=64):
+        '''
+            Parameters:
+                directory: folder to write the files in.
+                batch_size: most records written per fsync.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.batch_size = batch_size
+        self.failed = False
+
+        self.queue = queue.SimpleQueue()
+        self.file = None
+        self.thread = threading.Thread(
+            target=self._run, name='autosave journal', daemon=True
+        )
+        self.thread.start()
+
+    def write(self, record: dict) -> None:
+        '''
+        Function to add a record to the journal.
+            The record must not be changed after, it is written later.
+        '''
+        self.queue.put(('record', record))
+
+    def write_snapshot(self, state: dict) -> None:
+        '''
+        Function to replace the snapshot, the journal starts over after it.
+            The state must not be changed after, it is written later.
+        '''
+        self.queue.put(('snapshot', state))
+
+    def close(self, discard=False) -> None:
+        '''
+        Function to write what is left and stop the thread.
+
+            Parameters:
+                discard: True to remove the files, nothing is left to resume.
+        '''
+        self.queue.put(('close', discard))
+        self.thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                done = self._write_batch(batch)
+            except OSError as error:
+                if not self.failed:
+                    print(f'autosave stopped: {error}', file=sys.stderr)
+                self.failed = True
+                done = any(kind == 'close' for kind, _ in batch)
+            if done:
+                if self.file is not None:
+                    self.file.close()
+                return
+
+    def _write_batch(self, batch: list) -> bool:
+        lines = []
+        for kind, item in batch:
+            if self.failed and kind != 'close':
+                continue
+            if kind == 'record':
+                lines.append(json.dumps(item, separators=(',', ':')))
+            elif kind == 'snapshot':
+                # the snapshot has every record before it, so they aren't written.
+                self._write_snapshot(item)
+                lines = []
+            else:
+                self._flush(lines)
+                if item:
+                    self._remove()
+                return True
+        self._flush(lines)
+        return False
+
+    def _flush(self, lines: list) -> None:
+        if not lines or self.file is None:
+            return
+        self.file.write('\n'.join(lines) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _write_snapshot(self, state: dict) -> None:
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file, ensure_ascii=False, separators=(',', ':'))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # a crash before the journal is emptied leaves records the snapshot
+        # already has, resuming skips them by their seq.
+        if self.file is None:
+            self.file = open(self.journal_path, 'w', encoding='utf-8')
+        else:
+            self.file.seek(0)
+            self.file.truncate()
+        header = {'game': state['game'], 'seq': state['seq']}
+        self._flush([json.dumps(header, separators=(',', ':'))])
+
+    def _remove(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        for path in (self.journal_path, self.snapshot_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def board_state(engine: GameEngine):
+    '''
+    Function to get the board of a game as lists, to save in the snapshot.
+        Made once per round, the board doesn't change while it's played.
+        A question with a picture or video also has their paths.
+        A round of a board pack is saved as the pack's path and the round, so
+        its questions are still only made when they're clicked.
+    '''
+    source = pack_source(engine.all_questions)
+    if source is not None:
+        return {'pack': source[0], 'round': source[1]}
+    return [
+        [[q.get_question(), q.get_answer(), q.get_points()]
+         + ([q.get_image(), q.get_video()] if q.get_image() or q.get_video() else [])
+         for q in column]
+        for column in engine.all_questions
+    ]
+
+
+def engine_state(engine: GameEngine, board: list, game: str, seq: int) -> dict:
+    '''
+    Function to get everything needed to resume a game.
+
+        Parameters:
+            engine: GameEngine of the game.
+            board: board_state() of the game.
+            game: id of the game, changes every time a game is started.
+            seq: seq of the last journal record the state includes.
+    '''
+    return {
+        'version': VERSION,
+        'game': game,
+        'seq': seq,
+        'teams': list(engine.team_names),
+        'categories': list(engine.category_names),
+        'round': engine.round,
+        'board': board,
+        'opened': [
+            ''.join('1' if opened else '0' for opened in column)
+            for column in engine.opened.to_lists()
+        ],
+        'current': engine.current,
+        'ledger': engine.ledger.snapshot(),
+    }
+
+
+class GameJournal():
+    '''
+    Class to journal a game's engine events.
+    '''
+
+    def __init__(self, engine: GameEngine, writer=None, snapshot_every=200):
+        '''
+            Parameters:
+                engine: GameEngine of the game.
+                writer: JournalWriter, one writing to AUTOSAVE_DIR by default.
+                snapshot_every: records written between two snapshots.
+        '''
+        self.engine = engine
+        self.writer = writer if writer is not None else JournalWriter()
+        self.snapshot_every = snapshot_every
+
+        self.game = uuid.uuid4().hex
+        self.board = board_state(engine)
+        self.seq = 0
+        self.since_snapshot = 0
+
+        # the first snapshot has the board and replaces the last game's files.
+        self.snapshot()
+        engine.add_listener(self.on_engine_event)
+
+    def on_engine_event(self, event: str, **data) -> None:
+        '''
+        Function to journal a change to the game.
+        '''
+        if event == 'question_opened':
+            record = {'event': 'open', 'col': data['col'], 'row': data['row']}
+        elif event == 'answer_revealed':
+            record = {'event': 'reveal', 'col': data['col'], 'row': data['row']}
+        elif event == 'points_changed':
+            record = {'event': 'points', 'entry': data['entry']}
+        elif event == 'round_started':
+            # a new board, the snapshot has it and the records after it.
+            self.board = board_state(self.engine)
+            self.snapshot()
+            return
+        else:
+            return
+        self.seq += 1
+        record['seq'] = self.seq
+        self.writer.write(record)
+
+        self.since_snapshot += 1
+        if self.since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        '''
+        Function to save the whole state of the game.
+        '''
+        self.writer.write_snapshot(engine_state(self.engine, self.board, self.game, self.seq))
+        self.since_snapshot = 0
+
+    def close(self, discard=True) -> None:
+        '''
+        Function to stop journaling the game.
+
+            Parameters:
+                discard: True to remove the files, e.g. when the host quits.
+        '''
+        self.engine.remove_listener(self.on_engine_event)
+        self.writer.close(discard)
+
+
+def has_autosave(directory=AUTOSAVE_DIR) -> bool:
+    '''
+    Function to check if there is a game to resume.
+    '''
+    return os.path.exists(os.path.join(directory, SNAPSHOT_FILE))
+
+
+def load_autosave(directory=AUTOSAVE_DIR):
+    '''
+    Function to read the last game's snapshot and the journal records after it.
+
+        Returns:
+            the snapshot dict, with the records in 'records'.
+            None if there is no snapshot or it can't be read.
+    '''
+    try:
+        with open(os.path.join(directory, SNAPSHOT_FILE), encoding='utf-8') as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get('version') != VERSION:
+        return None
+
+    records = []
+    try:
+        with open(os.path.join(directory, JOURNAL_FILE), encoding='utf-8') as file:
+            lines = iter(file)
+            header = json.loads(next(lines, 'null'))
+            if isinstance(header, dict) and header.get('game') == state['game']:
+                for line in lines:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # the last line was cut off by the crash
+                    if record['seq'] > state['seq']:
+                        records.append(record)
+    except (OSError, ValueError):
+        pass
+    state['records'] = records
+    return state
+
+
+def _entry(values: list) -> Entry:
+    entry = Entry(*values)
+    if entry.question is not None:
+        entry = entry._replace(question=tuple(entry.question))
+    return entry
+
+
+def restore_engine(state: dict) -> GameEngine:
+    '''
+    Function to rebuild the GameEngine of a game from load_autosave().
+    '''
+    board = state['board']
+    if isinstance(board, dict):
+        questions, _ = load_pack(board['pack'], board['round'])
+    else:
+        questions = [[Question(*values) for values in column] for column in board]
+    engine = GameEngine(
+        questions=questions,
+        category_names=state['categories'],
+        team_names=state['teams']
+    )
+    engine.round = state.get('round', 0)
+
+    ledger = state['ledger']
+    engine.ledger = ScoreLedger.restore({
+        'next_seq': ledger['next_seq'],
+        'totals': ledger['totals'],
+        'undo': [_entry(entry) for entry in ledger['undo']],
+        'redo': [_entry(entry) for entry in ledger['redo']],
+    })
+    engine.opened = BoardFlags.from_lists(
+        [[flag == '1' for flag in column] for column in state['opened']]
+    )
+    if state['current'] is not None:
+        engine.current = tuple(state['current'])
+
+    for record in state['records']:
+        event = record['event']
+        if event == 'open':
+            engine.current = (record['col'], record['row'])
+        elif event == 'reveal':
+            engine.opened.set(record['col'], record['row'])
+        else:
+            engine.ledger.apply(_entry(record['entry']))
+
+    for team_index, team in enumerate(engine.team_list):
+        team.set_points(engine.get_points(team_index))
+    return engine
+
+
+def resume(directory=AUTOSAVE_DIR):
+    '''
+    Function to rebuild the last game, if there is one.
+
+        Returns:
+            GameEngine of the game, None if there is nothing to resume.
+    '''
+    state = load_autosave(directory)
+    if state is None:
+        return None
+    try:
+        return restore_engine(state)
+    except (KeyError, IndexError, TypeError, ValueError, OSError):
+        # OSError: the board pack of the game can't be opened anymore.
+        return None
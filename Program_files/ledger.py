@@ -0,0 +1,199 @@
+'''
+Script with the score ledger.
+
+Every change to a team's points is appended to the ledger as an Entry, and
+nothing in it is ever changed or removed. The team totals are kept up to date as
+entries are added, so getting a score is O(1) and the totals can always be
+rebuilt by replaying the entries (see ScoreLedger.replay).
+
+Undo and redo are entries too: undoing appends an 'undo' entry with the
+opposite delta of the entry it undoes, and redoing appends a 'redo' entry with
+the original delta. Only the last `history` entries can be undone.
+'''
+
+import time
+from array import array
+from collections import deque, namedtuple
+
+# one entry of the ledger.
+#   seq: position of the entry in the ledger.
+#   kind: 'award', 'deduct', 'override', 'undo' or 'redo'.
+#   team_index: team whose points changed.
+#   points: points given for 'award'/'deduct', the new total for 'override',
+#       seq of the entry undone/redone for 'undo'/'redo'.
+#   delta: change to the team's total.
+#   question: (col, row) of the question, None if not tied to a question.
+#   time: time.monotonic() when the entry was added.
+Entry = namedtuple(
+    'Entry', ['seq', 'kind', 'team_index', 'points', 'delta', 'question', 'time']
+)
+
+KINDS = ('award', 'deduct', 'override', 'undo', 'redo')
+
+
+class ScoreLedger():
+    '''
+    Class to keep the append-only log of score changes and each team's total.
+    '''
+
+    def __init__(self, team_count: int, history=100):
+        self.entries = []
+        # one float per team, in one block of memory however many teams play.
+        self.totals = array('d', bytes(8 * team_count))
+
+        # seq of entries[0], more than 0 when the ledger was restored from a
+        # snapshot that only kept the totals and the undo/redo stacks.
+        self.first_seq = 0
+
+        # entries that can be undone/redone, most recent last.
+        self.undo_stack = deque(maxlen=history)
+        self.redo_stack = deque(maxlen=history)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _append(self, kind: str, team_index: int, points, delta, question) -> Entry:
+        entry = Entry(
+            self.first_seq + len(self.entries), kind, team_index, points, delta, question,
+            time.monotonic()
+        )
+        self.entries.append(entry)
+        self.totals[team_index] += delta
+        return entry
+
+    def total(self, team_index: int) -> float:
+        '''
+        Function to get a team's points.
+        '''
+        return self.totals[team_index]
+
+    # Scoring
+
+    def award(self, team_index: int, points: float, question=None) -> Entry:
+        '''
+        Function to give points to a team.
+            Negative points are recorded as a deduction.
+
+            Parameters:
+                team_index: position of the team.
+                points: points to add.
+                question: (col, row) of the question the points are for.
+        '''
+        kind = 'deduct' if points < 0 else 'award'
+        entry = self._append(kind, team_index, points, points, question)
+        self.undo_stack.append(entry)
+        self.redo_stack.clear()
+        return entry
+
+    def deduct(self, team_index: int, points: float, question=None) -> Entry:
+        '''
+        Function to take points away from a team.
+        '''
+        return self.award(team_index, -abs(points), question)
+
+    def override(self, team_index: int, points: float) -> Entry:
+        '''
+        Function to set a team's points (manual edit by the host).
+
+            Parameters:
+                team_index: position of the team.
+                points: the team's new total.
+        '''
+        delta = points - self.totals[team_index]
+        entry = self._append('override', team_index, points, delta, None)
+        self.undo_stack.append(entry)
+        self.redo_stack.clear()
+        return entry
+
+    # Undo / Redo
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def undo(self):
+        '''
+        Function to undo the last score change.
+
+            Returns:
+                the 'undo' Entry, None if there is nothing to undo.
+        '''
+        if not self.undo_stack:
+            return None
+        undone = self.undo_stack.pop()
+        self.redo_stack.append(undone)
+        return self._append(
+            'undo', undone.team_index, undone.seq, -undone.delta, undone.question
+        )
+
+    def redo(self):
+        '''
+        Function to redo the last undone score change.
+
+            Returns:
+                the 'redo' Entry, None if there is nothing to redo.
+        '''
+        if not self.redo_stack:
+            return None
+        redone = self.redo_stack.pop()
+        self.undo_stack.append(redone)
+        return self._append(
+            'redo', redone.team_index, redone.seq, redone.delta, redone.question
+        )
+
+    # Saving / Restoring
+
+    def apply(self, entry: Entry) -> None:
+        '''
+        Function to add an entry made by another ledger, e.g. one read back
+        from the autosave journal.
+        '''
+        if entry.kind not in KINDS:
+            raise ValueError(f'unknown ledger entry kind {entry.kind!r}')
+        self.entries.append(entry)
+        self.totals[entry.team_index] += entry.delta
+        if entry.kind in ('award', 'deduct', 'override'):
+            self.undo_stack.append(entry)
+            self.redo_stack.clear()
+        elif entry.kind == 'undo':
+            self.redo_stack.append(self.undo_stack.pop())
+        else:
+            self.undo_stack.append(self.redo_stack.pop())
+
+    @classmethod
+    def replay(cls, entries: list, team_count: int, history=100):
+        '''
+        Function to rebuild a ledger, with its totals and undo/redo stacks,
+        from its entries.
+        '''
+        ledger = cls(team_count, history)
+        for entry in entries:
+            ledger.apply(entry)
+        return ledger
+
+    def snapshot(self) -> dict:
+        '''
+        Function to get the smallest state the ledger can be restored from:
+        the totals and the entries that can still be undone/redone.
+            The other entries are left out, so the size doesn't grow with the game.
+        '''
+        return {
+            'next_seq': self.first_seq + len(self.entries),
+            'totals': list(self.totals),
+            'undo': list(self.undo_stack),
+            'redo': list(self.redo_stack),
+        }
+
+    @classmethod
+    def restore(cls, snapshot: dict, history=100):
+        '''
+        Function to rebuild a ledger from ScoreLedger.snapshot().
+        '''
+        ledger = cls(len(snapshot['totals']), history)
+        ledger.first_seq = snapshot['next_seq']
+        ledger.totals = array('d', snapshot['totals'])
+        ledger.undo_stack.extend(snapshot['undo'])
+        ledger.redo_stack.extend(snapshot['redo'])
+        return ledger
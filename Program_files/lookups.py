@@ -0,0 +1,149 @@
+'''
+Script to count searches of the widget tree (findChild / findChildren).
+
+The windows keep every widget they use: the widgets named in the .ui files are
+attributes set by load_ui, the board buttons are in GameWindow.board_buttons and
+the teams are rows of the scoreboard model. So once a window is built nothing
+should search for a widget, and this checks it.
+
+    with count_lookups() as lookups:
+        with lookups.action('open question'):
+            window.board_buttons[0][0].click()
+    assert lookups.total() == 0
+
+Run *"python Jeopardy.py --count-lookups"* to count them for every click and key
+press while playing, printed when the game closes.
+'''
+
+import sys
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QEvent, QObject
+
+_METHODS = ('findChild', 'findChildren')
+
+
+class LookupCounter():
+    '''
+    Class counting the findChild/findChildren calls made by each action.
+    '''
+
+    def __init__(self):
+        self.counts = Counter()  # action -> number of searches
+        self.callers = {}  # action -> Counter of 'file:line' that searched
+        self.current = 'startup'
+        self._originals = {}
+
+    def install(self) -> None:
+        '''
+        Function to start counting.
+        '''
+        if self._originals:
+            return
+        for name in _METHODS:
+            original = getattr(QObject, name)
+            self._originals[name] = original
+            setattr(QObject, name, self._wrap(original))
+
+    def uninstall(self) -> None:
+        '''
+        Function to stop counting.
+        '''
+        for name, original in self._originals.items():
+            setattr(QObject, name, original)
+        self._originals = {}
+
+    def _wrap(self, original):
+        counter = self
+
+        def counted(*args, **kwargs):
+            counter.counts[counter.current] += 1
+            caller = traceback.extract_stack(limit=2)[0]
+            counter.callers.setdefault(counter.current, Counter())[
+                f'{caller.filename}:{caller.lineno}'
+            ] += 1
+            return original(*args, **kwargs)
+
+        return counted
+
+    @contextmanager
+    def action(self, name: str):
+        '''
+        Function to count the searches made in a with block as one action.
+        '''
+        previous, self.current = self.current, name
+        self.counts.setdefault(name, 0)
+        try:
+            yield self
+        finally:
+            self.current = previous
+
+    def total(self, exclude=('startup',)) -> int:
+        '''
+        Function to get the number of searches made by the actions.
+        '''
+        return sum(count for action, count in self.counts.items()
+                   if action not in exclude)
+
+    def report(self, file=None) -> None:
+        '''
+        Function to print the searches made by each action.
+        '''
+        file = file or sys.stderr
+        print('findChild/findChildren calls per action', file=file)
+        for action, count in self.counts.items():
+            print(f'{count:6} {action}', file=file)
+            for caller, calls in self.callers.get(action, {}).items():
+                print(f'{calls:10} {caller}', file=file)
+
+
+@contextmanager
+def count_lookups():
+    '''
+    Function to count searches of the widget tree in a with block.
+    '''
+    counter = LookupCounter()
+    counter.install()
+    try:
+        yield counter
+    finally:
+        counter.uninstall()
+
+
+class ActionFilter(QObject):
+    '''
+    Class to start a new action in a LookupCounter on every click or key press.
+    '''
+
+    EVENTS = {
+        QEvent.MouseButtonPress: 'click',
+        QEvent.MouseButtonDblClick: 'double click',
+        QEvent.KeyPress: 'key',
+    }
+
+    def __init__(self, counter: LookupCounter):
+        super(ActionFilter, self).__init__()
+        self.counter = counter
+
+    def eventFilter(self, obj, event) -> bool:
+        kind = self.EVENTS.get(event.type())
+        if kind is not None and obj.isWidgetType():
+            name = obj.objectName() or type(obj).__name__
+            self.counter.current = f'{kind} on {name}'
+            self.counter.counts.setdefault(self.counter.current, 0)
+        return False
+
+
+def watch(app) -> LookupCounter:
+    '''
+    Function to count the searches made by each click and key press in the app.
+        The counts are printed when the app quits.
+    '''
+    counter = LookupCounter()
+    counter.install()
+    app.lookup_filter = ActionFilter(counter)
+    app.installEventFilter(app.lookup_filter)
+    app.aboutToQuit.connect(counter.report)
+    return counter
@@ -0,0 +1,253 @@
+'''
+Script to load the pictures and videos of picture and video clues.
+
+Pictures are decoded by QImageReader in a QThreadPool worker, scaled down to the
+size they are shown at while they are decoded, so a 4K photo never stops the
+GUI thread and never sits in memory at full size. The worker hands the QImage
+back to the GUI thread, which turns it into a QPixmap once and keeps it in an
+LRU cache bounded in bytes. Pictures bigger than a quarter of the cache aren't
+kept: they are freed as soon as their clue closes.
+
+Videos are played by QMediaPlayer from their file, which it streams from the
+disk as it plays. If QtMultimedia can't be loaded videos can't be played.
+'''
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, QUrl, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+CACHE_BYTES = 64 * 1024 * 1024
+PREFETCH_PRIORITY = -1  # thread pool priority of pictures decoded before they're needed
+
+# part of the screen a picture is scaled to fit, the rest is for the header,
+# the answer and the teams.
+DISPLAY_WIDTH = 0.9
+DISPLAY_HEIGHT = 0.45
+
+
+def display_size(screen=None) -> QSize:
+    '''
+    Function to get the size pictures are scaled to fit in the question window.
+
+        Parameters:
+            screen: QScreen the window is on, the primary screen by default.
+    '''
+    screen = screen or QApplication.primaryScreen()
+    size = screen.availableGeometry().size()
+    return QSize(int(size.width() * DISPLAY_WIDTH), int(size.height() * DISPLAY_HEIGHT))
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    '''
+    Function to get the memory a pixmap's pixels take.
+    '''
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class PixmapCache():
+    '''
+    Class to keep the pictures used last, up to a number of bytes.
+    '''
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0  # bytes in the cache
+        self.pixmaps = OrderedDict()  # key -> QPixmap, used last at the end
+
+    def get(self, key):
+        '''
+        Function to get a picture, None if it isn't in the cache.
+        '''
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap: QPixmap) -> bool:
+        '''
+        Function to add a picture, removing the ones used longest ago to make room.
+
+            Returns:
+                if the picture was kept, pictures over a quarter of the cache aren't.
+        '''
+        size = pixmap_bytes(pixmap)
+        if size > self.max_bytes // 4:
+            return False
+        self.remove(key)
+        self.pixmaps[key] = pixmap
+        self.size += size
+        while self.size > self.max_bytes:
+            _, old = self.pixmaps.popitem(last=False)
+            self.size -= pixmap_bytes(old)
+        return True
+
+    def remove(self, key) -> None:
+        '''
+        Function to remove a picture from the cache.
+        '''
+        pixmap = self.pixmaps.pop(key, None)
+        if pixmap is not None:
+            self.size -= pixmap_bytes(pixmap)
+
+    def clear(self) -> None:
+        '''
+        Function to remove every picture.
+        '''
+        self.pixmaps.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self.pixmaps)
+
+
+class DecodeTask(QRunnable):
+    '''
+    Class to decode one picture in a thread pool.
+    '''
+
+    def __init__(self, loader, key: tuple, priority: int):
+        super(DecodeTask, self).__init__()
+        self.loader = loader
+        self.key = key
+        self.priority = priority
+        self.wanted = 1  # requests for the picture that weren't cancelled
+        self.started = False
+
+    def run(self) -> None:
+        if self.loader.pending.get(self.key) is not self:
+            return  # cancelled, or replaced by a task of a higher priority
+        self.started = True
+
+        path, width, height = self.key
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and (size.width() > width or size.height() > height):
+            # decoding at the display size, e.g. JPEGs are decoded at a smaller scale.
+            reader.setScaledSize(size.scaled(width, height, Qt.KeepAspectRatio))
+        image = reader.read()
+        self.loader.decoded.emit(self.key, image, reader.errorString() if image.isNull() else '')
+
+
+class MediaLoader(QObject):
+    '''
+    Class to load pictures in the background, with a cache of the ones shown.
+    '''
+
+    # (path, width, height), QImage, error. Sent by the workers.
+    decoded = pyqtSignal(object, object, str)
+    # (path, width, height), QPixmap (null if it couldn't be loaded), error.
+    loaded = pyqtSignal(object, object, str)
+
+    def __init__(self, cache_bytes=CACHE_BYTES, pool=None):
+        super(MediaLoader, self).__init__()
+        self.cache = PixmapCache(cache_bytes)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.pending = {}  # key -> DecodeTask decoding it
+        self.decoded.connect(self._decoded)
+
+    def request(self, path: str, size: QSize, priority=0) -> tuple:
+        '''
+        Function to get a picture scaled to fit a size.
+            A picture that isn't in the cache is decoded in the background and
+            sent with the loaded signal. A picture asked for again while it's
+            decoded is decoded once, at the higher of the two priorities if
+            its decode hasn't started.
+
+            Parameters:
+                path: picture file.
+                size: size the picture is shown at.
+                priority: of the decode in the thread pool, pictures fetched
+                    before they're needed get a lower one than a clue's.
+
+            Returns: tuple
+                key: (path, width, height), sent with the picture.
+                pixmap: the picture if it was in the cache, otherwise None.
+        '''
+        key = (path, size.width(), size.height())
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return key, pixmap
+
+        task = self.pending.get(key)
+        if task is None or (priority > task.priority and not task.started):
+            # a queued task can't be moved up the pool's queue, so a new one
+            # takes its place and the old one does nothing when it comes up.
+            new_task = DecodeTask(self, key, priority)
+            if task is not None:
+                new_task.wanted += task.wanted
+            self.pending[key] = new_task
+            self.pool.start(new_task, priority)
+        else:
+            task.wanted += 1
+        return key, None
+
+    def cancel(self, key: tuple) -> None:
+        '''
+        Function to stop waiting for a picture requested while it wasn't in the
+            cache. It isn't decoded if it hasn't started and nothing else
+            asked for it, e.g. the prefetch, which doesn't cancel.
+        '''
+        task = self.pending.get(key)
+        if task is not None:
+            task.wanted -= 1
+            if not task.wanted:
+                del self.pending[key]
+
+    def _decoded(self, key: tuple, image: QImage, error: str) -> None:
+        if self.pending.pop(key, None) is None:
+            return
+        # QPixmap can only be made on the GUI thread.
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            self.cache.put(key, pixmap)
+        self.loaded.emit(key, pixmap, error)
+
+
+class VideoPlayer():
+    '''
+    Class to play videos in a video widget, streamed from their file.
+    '''
+
+    def __init__(self, parent=None):
+        from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
+        from PyQt5.QtMultimediaWidgets import QVideoWidget
+        self.QMediaContent = QMediaContent
+
+        self.widget = QVideoWidget(parent)
+        self.widget.setObjectName('video_widget')
+        self.widget.hide()
+        self.player = QMediaPlayer(parent)
+        self.player.setVideoOutput(self.widget)
+
+    def play(self, path: str) -> None:
+        '''
+        Function to play a video file from the start.
+        '''
+        self.player.setMedia(self.QMediaContent(QUrl.fromLocalFile(path)))
+        self.widget.show()
+        self.player.play()
+
+    def stop(self) -> None:
+        '''
+        Function to stop the video and close its file.
+        '''
+        self.player.stop()
+        self.player.setMedia(self.QMediaContent())
+        self.widget.hide()
+
+
+# media loader shared by the question windows, made by get_media_loader()
+_media_loader = None
+
+
+def get_media_loader() -> MediaLoader:
+    '''
+    Function to get the game's media loader, making it the first time.
+    '''
+    global _media_loader
+    if _media_loader is None:
+        _media_loader = MediaLoader()
+    return _media_loader
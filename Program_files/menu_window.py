@@ -1,6 +1,9 @@
 from PyQt5.QtWidgets import QMainWindow
-from PyQt5 import QtWidgets, uic
-from .game_window import GameWindow
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QTimer
+from .ui_loader import load_ui
+from .theme import apply_theme
+from . import startup_profile, tracing
 
 
 class MenuWindow(QMainWindow):
@@ -8,31 +11,41 @@ class MenuWindow(QMainWindow):
     Class to handle the main window
     '''
 
-    def __init__(self, questions: list, category_names: list):
+    def __init__(self, questions=None, category_names=None, board_loader=None,
+                 autosave=True, buzzer=None, spectator_feed=None, round_loader=None):
+        '''
+            Parameters:
+                questions: list of columns (categories) of Question objects.
+                category_names: list of category names.
+                board_loader: function returning (questions, category_names),
+                    used instead of questions/category_names to load the board
+                    after the menu is showing.
+                autosave: False to not save the game to resume after a crash.
+                buzzer: BuzzerServer started with the game, for network buzzers.
+                spectator_feed: SpectatorFeed started with the game.
+                round_loader: function loading the rounds after the first, see
+                    GameWindow.
+        '''
         super(MenuWindow, self).__init__()
-        uic.loadUi("UI_Files/jeopardy_menu_window.ui", self)
+        load_ui("jeopardy_menu_window", self)
+        apply_theme()
 
         self.category_names = category_names
         self.all_questions = questions
+        self.board_loader = board_loader
+        self.autosave = autosave
+        self.buzzer = buzzer
+        self.spectator_feed = spectator_feed
+        self.round_loader = round_loader
 
         # Variables to keep track of states
         self.team_count = 2
 
         ''' Defining widgets '''
-        self.title = self.findChild(
-            QtWidgets.QLabel, 'title'
-        )
-        self.spinBox_num_teams = self.findChild(
-            QtWidgets.QSpinBox, 'how_many_teams_spinBox'
-        )
-        self.team_name_frame = self.findChild(
-            QtWidgets.QFrame, 'team_name_frame'
-        )
+        # the widgets named in the .ui file are attributes set by load_ui.
+        self.spinBox_num_teams = self.how_many_teams_spinBox
         self.layout_team_frame = QtWidgets.QVBoxLayout(self.team_name_frame)
         self.team_name_frame.setLayout(self.layout_team_frame)
-        self.btn_play = self.findChild(
-            QtWidgets.QPushButton, 'btn_play'
-        )
 
         ''' Connecting Widgets to functions '''
         self.spinBox_num_teams.valueChanged.connect(
@@ -40,43 +53,6 @@ class MenuWindow(QMainWindow):
         )
         self.btn_play.clicked.connect(self.open_game_window)
 
-        ''' Styling '''
-        self.title.setStyleSheet(
-            '''
-            QLabel {
-                font-size: 40px;
-                padding: 15px;
-            }
-            '''
-        )
-        self.spinBox_num_teams.setStyleSheet(
-            '''
-            QSpinBox {
-                background-color: white;
-                max-width: 100px;
-            }
-            '''
-        )
-        self.team_name_frame.setStyleSheet(
-            '''
-            QLineEdit {
-                background-color: white;
-                padding: 5px;
-                font-size: 16px;
-            }
-            '''
-        )
-        self.btn_play.setStyleSheet(
-            '''
-            QPushButton:focus {
-                border: 1px solid blue;
-            }
-            QPushButton:hover {
-                border: 1px solid blue;
-            }
-            '''
-        )
-
         for num in range(self.team_count):
             lineEdit = QtWidgets.QLineEdit(self)
             lineEdit.setPlaceholderText("Team Name...")
@@ -89,6 +65,55 @@ class MenuWindow(QMainWindow):
         self.setTabOrder(self.team_name_frame, self.btn_play)
         self.setTabOrder(self.btn_play, self.spinBox_num_teams)
         self.show()
+        startup_profile.mark('menu shown')
+
+        # loading everything else once the menu has been drawn.
+        QTimer.singleShot(0, self.preload)
+
+    def preload(self) -> None:
+        '''
+        Function to load the board, the game window and the music player
+            in the background, while the team names are being typed.
+        '''
+        startup_profile.mark('menu first frame')
+
+        if self.all_questions is None and not self.load_board():
+            return
+        startup_profile.mark('board loaded')
+
+        from . import game_window
+        startup_profile.mark('game window imported')
+        from .audio import get_audio_engine
+        get_audio_engine()
+        startup_profile.mark('audio loaded')
+
+        startup_profile.finish()
+
+    def load_board(self) -> bool:
+        '''
+        Function to load the board with the board_loader.
+
+            Returns:
+                True if the board was loaded.
+        '''
+        if self.all_questions is not None:
+            return True
+        try:
+            self.all_questions, self.category_names = self.board_loader()
+        except Exception as error:
+            self.btn_play.setEnabled(False)
+            msg = QtWidgets.QMessageBox(self)
+            msg.setWindowTitle("Jeopardy! - Board Not Loaded")
+            pixmapi = getattr(QtWidgets.QStyle, "SP_MessageBoxWarning")
+            icon = self.style().standardIcon(pixmapi)
+            msg.setWindowIcon(icon)
+            msg.setText(f"\nCould not load the board:\n\n{error}\n")
+            msg.setStandardButtons(
+                QtWidgets.QMessageBox.Ok
+            )
+            msg.exec_()
+            return False
+        return True
 
     def show_lineEdits(self) -> None:
         '''
@@ -96,16 +121,15 @@ class MenuWindow(QMainWindow):
             Triggered by spinBox itemChanged.
         '''
 
-        lineEdit = QtWidgets.QLineEdit()
-        lineEdit.setPlaceholderText("Team Name...")
-
-        previous = self.team_count
         current = self.spinBox_num_teams.value()
 
-        if current > previous:
+        # the value can jump by more than one when it's typed in.
+        while self.layout_team_frame.count() < current:
+            lineEdit = QtWidgets.QLineEdit()
+            lineEdit.setPlaceholderText("Team Name...")
             self.layout_team_frame.addWidget(lineEdit)
-        else:
-            last = self.layout_team_frame.itemAt(
+        while self.layout_team_frame.count() > current:
+            last = self.layout_team_frame.takeAt(
                 self.layout_team_frame.count() - 1).widget()
             last.deleteLater()
 
@@ -116,7 +140,8 @@ class MenuWindow(QMainWindow):
         Function to get team names from the lineEdits.
         '''
         team_names = []
-        for lineEdit in self.team_name_frame.findChildren(QtWidgets.QLineEdit):
+        for index in range(self.layout_team_frame.count()):
+            lineEdit = self.layout_team_frame.itemAt(index).widget()
             team_names.append(lineEdit.text())
 
         if any(name == '' for name in team_names):
@@ -137,12 +162,39 @@ class MenuWindow(QMainWindow):
         '''
         Function to open the game window
         '''
-        team_names = self.get_team_names()
-        if team_names:
-            self.btn_play.setEnabled(False)
+        with tracing.span('MenuWindow.open_game_window'):
+            team_names = self.get_team_names()
+            if team_names and self.load_board():
+                from .game_window import GameWindow
+
+                self.btn_play.setEnabled(False)
+                with tracing.span('GameWindow.__init__', teams=len(team_names)):
+                    self.game_window = GameWindow(
+                        parent=self,
+                        team_names=team_names,
+                        category_names=self.category_names,
+                        questions=self.all_questions,
+                        autosave=self.autosave,
+                        buzzer=self.buzzer,
+                        spectator_feed=self.spectator_feed,
+                        round_loader=self.round_loader,
+                    )
+
+    def resume_game(self, engine) -> None:
+        '''
+        Function to open the game window on a game rebuilt from the autosave.
+
+            Parameters:
+                engine: GameEngine of the game.
+        '''
+        from .game_window import GameWindow
+
+        # the board of the game is used, so the background load is skipped.
+        self.all_questions = engine.all_questions
+        self.category_names = engine.category_names
+        self.btn_play.setEnabled(False)
+        with tracing.span('GameWindow.__init__', resumed=True):
             self.game_window = GameWindow(
-                parent=self,
-                team_names=team_names,
-                category_names=self.category_names,
-                questions=self.all_questions,
+                parent=self, engine=engine, autosave=self.autosave, buzzer=self.buzzer,
+                spectator_feed=self.spectator_feed, round_loader=self.round_loader
             )
@@ -0,0 +1,232 @@
+'''
+Script with the game's data classes.
+
+These don't use PyQt5, so they can be used by the game engine without the GUI.
+They use __slots__, as a loaded bank or board pack can hold a very large number
+of questions.
+'''
+
+from array import array
+
+
+class Question():
+    '''
+    Class to store question and answer.
+    '''
+
+    __slots__ = ('question', 'answer', 'points', 'opened', 'image', 'video')
+
+    def __init__(self, question='', answer='', points=0, image='', video=''):
+        self.question = question
+        self.answer = answer
+        self.points = points
+        self.opened = False  # if question has been opened.
+        # paths of a picture/video shown with the question, '' for none.
+        self.image = image
+        self.video = video
+
+    def set_question(self, question: str) -> None:
+        '''
+        Function to set the question.
+
+            Parameter:
+                question: question to ask
+        '''
+        self.question = question
+
+    def set_answer(self, answer: str) -> None:
+        '''
+        Function to set the answer.
+
+            Parameter: answer
+        '''
+        self.answer = answer
+
+    def set_points(self, points: float) -> None:
+        '''
+        Function to set the points
+
+            Parameter:
+                points: how points.
+        '''
+        self.points = points
+
+    def get_question(self) -> str:
+        '''
+        Function to get the question.
+
+            Parameters: None
+
+            Returns:
+                question in a string.
+        '''
+        return self.question
+
+    def get_answer(self) -> str:
+        '''
+        Function to get the answer.
+
+            Parameters: None
+
+            Returns:
+                answer in a string.
+        '''
+        return self.answer
+
+    def get_points(self) -> float:
+        '''
+        Function to get the amount of points the question is worth.
+
+            Parameter:
+                None
+
+            Return:
+                float
+        '''
+        return self.points
+
+    def get_image(self) -> str:
+        '''
+        Function to get the path of the question's picture.
+
+            Returns:
+                path in a string, '' if the question has no picture.
+        '''
+        return self.image
+
+    def get_video(self) -> str:
+        '''
+        Function to get the path of the question's video.
+
+            Returns:
+                path in a string, '' if the question has no video.
+        '''
+        return self.video
+
+
+class Team():
+    '''
+    Team Class
+    '''
+
+    __slots__ = ('name', 'points')
+
+    def __init__(self, name: str, points=0):
+        self.name = name  # team name
+        self.points = points  # points
+
+    def get_name(self) -> str:
+        '''
+        Function to get team name.
+        '''
+        return self.name
+
+    def get_points(self) -> float:
+        '''
+        Function to get points.
+        '''
+        return self.points
+
+    def set_points(self, points: float) -> None:
+        '''
+        Function to set points.
+
+            Parameter:
+                points: how many points to set
+        '''
+        self.points = points
+
+    def add_points(self, points: float) -> None:
+        '''
+        Function to add points.
+
+            Parameter:
+                points: how many points to add.
+        '''
+        self.points = self.points + points
+
+    def remove_points(self, points: float) -> None:
+        '''
+        Function to remove points.
+
+            Parameter:
+                points: how many points to remove.
+        '''
+        self.points = self.points - points
+
+
+class BoardFlags():
+    '''
+    Class to store one flag per question of a board (e.g. if it has been
+    opened) in a bitset, indexed [col][row] like the board.
+    '''
+
+    __slots__ = ('starts', 'lengths', 'bits')
+
+    def __init__(self, lengths: list):
+        '''
+            Parameters:
+                lengths: number of questions in each column.
+        '''
+        self.lengths = array('q', lengths)
+        # bit of the first question of each column.
+        self.starts = array('q', bytes(8 * len(self.lengths)))
+        total = 0
+        for col, length in enumerate(self.lengths):
+            self.starts[col] = total
+            total += length
+        self.bits = bytearray((total + 7) // 8)
+
+    @classmethod
+    def from_lists(cls, columns: list):
+        '''
+        Function to make the flags from a list of columns of bools.
+        '''
+        flags = cls(map(len, columns))
+        for col, column in enumerate(columns):
+            for row, flag in enumerate(column):
+                if flag:
+                    flags.set(col, row)
+        return flags
+
+    def get(self, col: int, row: int) -> bool:
+        '''
+        Function to get the flag of a question.
+        '''
+        if not 0 <= row < self.lengths[col]:
+            raise IndexError(f'no question {col},{row}')
+        bit = self.starts[col] + row
+        return bool(self.bits[bit >> 3] & (1 << (bit & 7)))
+
+    def set(self, col: int, row: int, flag=True) -> None:
+        '''
+        Function to set (or with flag=False clear) the flag of a question.
+        '''
+        if not 0 <= row < self.lengths[col]:
+            raise IndexError(f'no question {col},{row}')
+        bit = self.starts[col] + row
+        if flag:
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self.bits[bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+
+    def count(self) -> int:
+        '''
+        Function to count the questions whose flag is set.
+        '''
+        return int.from_bytes(self.bits, 'little').bit_count()
+
+    def __len__(self) -> int:
+        return sum(self.lengths)
+
+    def to_lists(self) -> list:
+        '''
+        Function to get the flags as a list of columns of bools.
+        '''
+        return [[self.get(col, row) for row in range(length)]
+                for col, length in enumerate(self.lengths)]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BoardFlags):
+            return NotImplemented
+        return self.lengths == other.lengths and self.bits == other.bits
@@ -0,0 +1,386 @@
+'''
+Script to keep a large bank of questions in a SQLite database.
+
+Questions are indexed by category, points, difficulty and tag, and the question
+and answer text is searchable with an FTS5 full text index. Boards are picked
+out of the bank with build_board().
+
+Command line use:
+    python -m Program_files.question_bank BANK import FILE [FILE ...]
+    python -m Program_files.question_bank BANK search "TEXT"
+    python -m Program_files.question_bank BANK categories
+
+Import files are csv/tsv with a header row. The columns used are category,
+points, question, answer, tags and difficulty; the column names of the common
+J! Archive dumps (clue_value, value, ...) are understood too. Files are read row
+by row and written in batches, so memory use doesn't grow with the file size.
+'''
+
+import argparse
+import csv
+import random
+import sqlite3
+import sys
+
+from .models import Question
+
+BOARD_POINTS = (100, 200, 400, 600, 800, 1000)  # points of each row on a board
+BATCH_SIZE = 10000  # rows written per transaction when importing
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS clues (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    points NUMERIC NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    difficulty INTEGER
+);
+CREATE INDEX IF NOT EXISTS clues_category ON clues (category, points);
+CREATE INDEX IF NOT EXISTS clues_points ON clues (points);
+CREATE INDEX IF NOT EXISTS clues_difficulty ON clues (difficulty, points);
+
+CREATE TABLE IF NOT EXISTS clue_tags (
+    tag TEXT NOT NULL,
+    clue_id INTEGER NOT NULL REFERENCES clues (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, clue_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS clue_tags_clue ON clue_tags (clue_id);
+
+-- new rows are added to the search index by the code (in one statement per
+-- batch when importing, which is much faster than a trigger per row).
+CREATE VIRTUAL TABLE IF NOT EXISTS clues_fts USING fts5 (
+    question, answer, content='clues', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS clues_fts_delete AFTER DELETE ON clues BEGIN
+    INSERT INTO clues_fts (clues_fts, rowid, question, answer)
+    VALUES ('delete', old.id, old.question, old.answer);
+END;
+CREATE TRIGGER IF NOT EXISTS clues_fts_update AFTER UPDATE ON clues BEGIN
+    INSERT INTO clues_fts (clues_fts, rowid, question, answer)
+    VALUES ('delete', old.id, old.question, old.answer);
+    INSERT INTO clues_fts (rowid, question, answer)
+    VALUES (new.id, new.question, new.answer);
+END;
+'''
+
+# other names used for the import columns
+COLUMN_ALIASES = {
+    'category': ('category', 'category_name'),
+    'points': ('points', 'value', 'clue_value'),
+    'question': ('question', 'clue'),
+    'answer': ('answer', 'response'),
+    'tags': ('tags', 'tag'),
+    'difficulty': ('difficulty', 'level'),
+}
+
+
+class BankError(ValueError):
+    '''
+    Error raised when the bank can't give what was asked for.
+    '''
+
+
+class QuestionBank():
+    '''
+    Class to store and query questions in a SQLite database.
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        '''
+        Function to close the database.
+        '''
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Adding questions
+
+    def add(self, category: str, points: float, question: str, answer: str, tags=(), difficulty=None) -> int:
+        '''
+        Function to add one question to the bank.
+
+            Returns:
+                id of the new question.
+        '''
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO clues (category, points, question, answer, difficulty) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (category, points, question, answer, difficulty)
+            )
+            clue_id = cursor.lastrowid
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO clue_tags (tag, clue_id) VALUES (?, ?)',
+                [(tag, clue_id) for tag in tags]
+            )
+            self.connection.execute(
+                'INSERT INTO clues_fts (rowid, question, answer) VALUES (?, ?, ?)',
+                (clue_id, question, answer)
+            )
+        return clue_id
+
+    def import_file(self, path: str, batch_size=BATCH_SIZE) -> int:
+        '''
+        Function to import questions from a csv or tsv file.
+            The file is streamed and written batch_size rows per transaction.
+
+            Parameters:
+                path: csv/tsv file, with a header row.
+                batch_size: rows per transaction.
+
+            Returns:
+                number of questions imported.
+        '''
+        csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+        delimiter = '\t' if path.lower().endswith('.tsv') else ','
+        count = 0
+
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            reader = csv.reader(file, delimiter=delimiter)
+            columns = _match_columns(next(reader, []), path)
+
+            # writes are unsafe until the import finishes, like a bulk load should be.
+            self.connection.execute('PRAGMA synchronous = OFF')
+            try:
+                batch = []
+                for row in reader:
+                    clue = _parse_row(row, columns)
+                    if clue is not None:
+                        batch.append(clue)
+                    if len(batch) >= batch_size:
+                        count += self._write_batch(batch)
+                        batch = []
+                count += self._write_batch(batch)
+            finally:
+                self.connection.execute('PRAGMA synchronous = NORMAL')
+        return count
+
+    def _write_batch(self, batch: list) -> int:
+        if not batch:
+            return 0
+        with self.connection:
+            cursor = self.connection.execute('SELECT COALESCE(MAX(id), 0) FROM clues')
+            first_id = cursor.fetchone()[0] + 1
+            self.connection.executemany(
+                'INSERT INTO clues (id, category, points, question, answer, difficulty) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(first_id + index, *clue[:5])
+                 for index, clue in enumerate(batch)]
+            )
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO clue_tags (tag, clue_id) VALUES (?, ?)',
+                [(tag, first_id + index)
+                 for index, clue in enumerate(batch) for tag in clue[5]]
+            )
+            self.connection.execute(
+                'INSERT INTO clues_fts (rowid, question, answer) '
+                'SELECT id, question, answer FROM clues WHERE id >= ?',
+                (first_id,)
+            )
+        return len(batch)
+
+    # Queries
+
+    def count(self) -> int:
+        '''
+        Function to get the number of questions in the bank.
+        '''
+        return self.connection.execute('SELECT COUNT(*) FROM clues').fetchone()[0]
+
+    def search(self, text: str, limit=20) -> list:
+        '''
+        Function to full text search the questions and answers.
+
+            Parameters:
+                text: FTS5 query, e.g. 'volcano' or 'answer: "mount st helens"'.
+                limit: most results to return.
+
+            Returns:
+                list of (id, category, points, question, answer), best match first.
+        '''
+        try:
+            return self.connection.execute(
+                'SELECT clues.id, category, points, clues.question, clues.answer '
+                'FROM clues_fts JOIN clues ON clues.id = clues_fts.rowid '
+                'WHERE clues_fts MATCH ? ORDER BY rank LIMIT ?',
+                (text, limit)
+            ).fetchall()
+        except sqlite3.OperationalError as error:
+            raise BankError(f'bad search "{text}": {error}') from None
+
+    def categories(self, points=BOARD_POINTS, tags=(), difficulty=None) -> list:
+        '''
+        Function to get the categories that have a question for every point value.
+
+            Parameters:
+                points: point values a category needs.
+                tags: only count questions with all of these tags.
+                difficulty: only count questions of this difficulty.
+        '''
+        where, params = _filters(points, tags, difficulty)
+        return [
+            row[0] for row in self.connection.execute(
+                f'SELECT category FROM clues WHERE {where} GROUP BY category '
+                'HAVING COUNT(DISTINCT points) = ? ORDER BY category',
+                (*params, len(points))
+            )
+        ]
+
+    def build_board(self, category_names=None, count=6, points=BOARD_POINTS, tags=(), difficulty=None, rng=None) -> tuple:
+        '''
+        Function to put together a board from the bank.
+
+            Parameters:
+                category_names: categories to use, picked at random if None.
+                count: number of categories to pick at random.
+                points: point value of each row.
+                tags: only use questions with all of these tags.
+                difficulty: only use questions of this difficulty.
+                rng: random.Random used to pick, for repeatable boards.
+
+            Returns: tuple
+                all_questions: list of columns (categories), each a list of Question.
+                category_names: list of str.
+        '''
+        rng = rng or random.Random()
+        if category_names is None:
+            available = self.categories(points, tags, difficulty)
+            if len(available) < count:
+                raise BankError(
+                    f'only {len(available)} categories have every point value, need {count}'
+                )
+            category_names = rng.sample(available, count)
+
+        where, params = _filters(points, tags, difficulty)
+        all_questions = []
+        for name in category_names:
+            column = []
+            for value in points:
+                # counted, then only the picked row is read, so a cell never
+                # loads every matching clue.
+                match = f'FROM clues WHERE category = ? AND points = ? AND {where}'
+                (matches,), = self.connection.execute(
+                    f'SELECT COUNT(*) {match}', (name, value, *params)
+                )
+                if not matches:
+                    raise BankError(f'category "{name}" has no {value} point question')
+                question, answer, value = self.connection.execute(
+                    f'SELECT question, answer, points {match} ORDER BY id LIMIT 1 OFFSET ?',
+                    (name, value, *params, rng.randrange(matches))
+                ).fetchone()
+                column.append(Question(question=question, answer=answer, points=value))
+            all_questions.append(column)
+        return all_questions, [sys.intern(name) for name in category_names]
+
+
+def _filters(points, tags, difficulty) -> tuple:
+    '''
+    Function to make the WHERE clause shared by the board queries.
+    '''
+    # "+points" stops SQLite from using the points index, the queries group or
+    # filter by category so the (category, points) index is the better one.
+    clauses = [f'+points IN ({", ".join("?" * len(points))})']
+    params = list(points)
+    for tag in tags:
+        clauses.append(
+            'EXISTS (SELECT 1 FROM clue_tags WHERE tag = ? AND clue_id = clues.id)'
+        )
+        params.append(tag)
+    if difficulty is not None:
+        clauses.append('difficulty = ?')
+        params.append(difficulty)
+    return ' AND '.join(clauses), params
+
+
+def _match_columns(header: list, path: str) -> dict:
+    '''
+    Function to find which column of the file holds each field.
+    '''
+    names = [name.strip().lower() for name in header]
+    columns = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in names:
+                columns[field] = names.index(alias)
+                break
+    missing = [field for field in ('category', 'points', 'question', 'answer')
+               if field not in columns]
+    if missing:
+        raise BankError(f'{path}: header row is missing column(s): {", ".join(missing)}')
+    return columns
+
+
+def _parse_row(row: list, columns: dict):
+    '''
+    Function to turn a row of an import file into a clue tuple.
+        Rows without a usable point value are skipped.
+
+        Returns:
+            (category, points, question, answer, difficulty, tags) or None.
+    '''
+    def cell(field):
+        index = columns.get(field)
+        return row[index].strip() if index is not None and index < len(row) else ''
+
+    text = cell('points').replace('$', '').replace(',', '')
+    try:
+        points = int(text)
+    except ValueError:
+        try:
+            points = float(text)
+        except ValueError:
+            return None
+
+    difficulty = cell('difficulty')
+    difficulty = int(difficulty) if difficulty.isdigit() else None
+    tags = [tag.strip() for tag in cell('tags').replace(';', ',').split(',') if tag.strip()]
+    return (cell('category'), points, cell('question'), cell('answer'), difficulty, tags)
+
+
+def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(prog='python -m Program_files.question_bank')
+    parser.add_argument('bank', help='SQLite question bank file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='import csv/tsv files')
+    import_parser.add_argument('files', nargs='+')
+    import_parser.add_argument('--batch', type=int, default=BATCH_SIZE)
+
+    search_parser = commands.add_parser('search', help='full text search')
+    search_parser.add_argument('text')
+    search_parser.add_argument('--limit', type=int, default=20)
+
+    commands.add_parser('categories', help='list categories with a full column')
+
+    args = parser.parse_args(argv)
+    with QuestionBank(args.bank) as bank:
+        try:
+            if args.command == 'import':
+                for path in args.files:
+                    count = bank.import_file(path, batch_size=args.batch)
+                    print(f'{path}: imported {count} questions')
+                print(f'{args.bank}: {bank.count()} questions')
+            elif args.command == 'search':
+                for clue_id, category, points, question, answer in bank.search(args.text, args.limit):
+                    print(f'[{clue_id}] {category} ({points}): {question} -> {answer}')
+            elif args.command == 'categories':
+                for category in bank.categories():
+                    print(category)
+        except BankError as error:
+            sys.exit(str(error))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
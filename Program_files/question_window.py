@@ -1,78 +1,12 @@
 from PyQt5.QtWidgets import QMainWindow, QWidget, QSizePolicy
-from PyQt5 import QtWidgets, uic
+from PyQt5 import QtWidgets
+from .ui_loader import load_ui
+from .theme import apply_theme, set_state
+from .scoreboard import set_up_team_view
 from PyQt5.QtCore import Qt
-
-
-class Question():
-    '''
-    Class to store question and answer.
-    '''
-
-    def __init__(self, question='', answer='', points=0):
-        self.question = question
-        self.answer = answer
-        self.points = points
-        self.opened = False  # if question has been opened.
-
-    def set_question(self, question: str) -> None:
-        '''
-        Function to set the question.
-
-            Parameter:
-                question: question to ask
-        '''
-        self.question = question
-
-    def set_answer(self, answer: str) -> None:
-        '''
-        Function to set the answer.
-
-            Parameter: answer
-        '''
-        self.answer = answer
-
-    def set_points(self, points: float) -> None:
-        '''
-        Function to set the points
-
-            Parameter:
-                points: how points.
-        '''
-        self.points = points
-
-    def get_question(self) -> str:
-        '''
-        Function to get the question.
-
-            Parameters: None
-
-            Returns:
-                question in a string.
-        '''
-        return self.question
-
-    def get_answer(self) -> str:
-        '''
-        Function to get the answer.
-
-            Parameters: None
-
-            Returns:
-                answer in a string.
-        '''
-        return self.answer
-
-    def get_points(self) -> float:
-        '''
-        Function to get the amount of points the question is worth.
-
-            Parameter:
-                None
-
-            Return:
-                float
-        '''
-        return self.points
+from .models import Question
+from .media import VideoPlayer, display_size, get_media_loader
+from . import tracing
 
 
 class QuestionWindow(QMainWindow):
@@ -80,11 +14,10 @@ class QuestionWindow(QMainWindow):
     Class to handle questions
     '''
 
-    def __init__(self,  questionObj=None,  parent=None, clicked_btn=None):
+    def __init__(self, parent=None):
         super(QuestionWindow, self).__init__(parent=parent)
-        uic.loadUi('UI_Files/question_window.ui', self)
-        self.showMaximized()
-
+        load_ui('question_window', self)
+        apply_theme()
 
         # parent window
         self.parent = parent
@@ -92,7 +25,49 @@ class QuestionWindow(QMainWindow):
         # if points have been added to the team.
         self.points_added = False
 
-        # button that was clicked
+        # button that was clicked, and the question being shown.
+        # Both are set each time the window is opened with open_question().
+        self.clicked_btn = None
+        self.questionObj = None
+        self.question = ''
+        self.answer = ''
+        self.points = 0
+
+        # widgets named in the .ui file (header, buzz_label, media_label,
+        # btn_question, answer_label, team_view) are attributes set by load_ui.
+
+        # picture of the question, decoded in the background by the media
+        # loader, and the video player, made for the first video question.
+        self.media = get_media_loader()
+        self.media.loaded.connect(self.show_picture)
+        self.picture_key = None
+        self.picture_waiting = False  # if the picture is being decoded for it
+        self.video_player = None
+
+        # teams, clicking a team gives it the question's points.
+        self.team_view.setModel(self.parent.scoreboard)
+        set_up_team_view(self.team_view)
+        self.team_view.clicked.connect(
+            lambda index: self.update_points(index.row())
+        )
+
+        # Attaching Functions
+        self.btn_question.clicked.connect(self.show_answer)
+
+        self.answer_label.hide()
+        self.buzz_label.hide()
+        self.media_label.hide()
+
+    def open_question(self, questionObj: Question, clicked_btn: QtWidgets.QPushButton) -> None:
+        '''
+        Function to show the window for a question.
+            The window is built once by the game window and reused for every question.
+
+            Parameters:
+                questionObj: question to show.
+                clicked_btn: board button that was clicked.
+        '''
+        self.points_added = False
         self.clicked_btn = clicked_btn
 
         # questionObj parameters
@@ -101,198 +76,32 @@ class QuestionWindow(QMainWindow):
         self.answer = questionObj.get_answer()
         self.points = questionObj.get_points()
 
-        self.team_frames = self.findChild(
-            QtWidgets.QFrame, 'team_frames'
-        )
-        self.team_frame1 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_1'
-        )
-        self.team_frame2 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_2'
-        )
-        self.team_frame3 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_3'
-        )
-        self.team_frame4 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_4'
-        )
-        self.team_frame5 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_5'
-        )
-        self.team_frame6 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_6'
-        )
-        self.team_frame7 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_7'
-        )
-        self.team_frame8 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_8'
-        )
-        self.team_frame9 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_9'
-        )
-        self.team_frame10 = self.findChild(
-            QtWidgets.QFrame, 'team_frame_10'
-        )
-        self.team_frames_list = [
-            self.team_frame1, self.team_frame2, self.team_frame3, self.team_frame4, self.team_frame5, self.team_frame6, self.team_frame7, self.team_frame8, self.team_frame9, self.team_frame10]
-        self.hide_frames(self.team_frames_list)
-
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_1'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_2'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_3'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_4'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_5'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_6'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_7'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_8'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_9'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        self.findChild(
-            QtWidgets.QPushButton, 'name_btn_10'
-        ).clicked.connect(
-            lambda: self.update_points(self.points)
-        )
-        # Finding Widgets
-        self.header = self.findChild(
-            QtWidgets.QLabel, 'header'
-        )
-        self.btn_question = self.findChild(
-            QtWidgets.QPushButton
-        )
-        self.answer_label = self.findChild(
-            QtWidgets.QLabel, 'answer_label'
-        )
-
-        # Attaching Functions and setting text
-        self.btn_question.clicked.connect(self.show_answer)
         header_text = 'For {:.0f} Points'.format(self.points)
         self.header.setText(header_text)
         self.btn_question.setText(self.question)
+        if not self.btn_question.isEnabled():
+            # last question was revealed, restoring the question button.
+            self.btn_question.setEnabled(True)
+            set_state(self.btn_question, 'revealed', False)
+        self.answer_label.hide()
+        self.buzz_label.hide()
+        with tracing.span('load_media'):
+            self.load_media(questionObj)
 
-        # What frames to show
-        self.frames_to_show = []
-        for index, team_name in enumerate(parent.team_names):
-            self.frames_to_show.append(self.team_frames_list[index])
-        self.show_frames(self.frames_to_show)
         self.toggle_team_btns()
 
-        # setting team frame info
-        for index, frame in enumerate(self.frames_to_show):
-            team = parent.team_objects[list(parent.team_objects)[index]]
-            self.set_team_frame_info(
-                frame=frame,
-                name=team.get_name(),
-                points=team.get_points()
-            )
-
-        # Styling
-        self.header.setStyleSheet(
-            '''
-            QLabel {
-                color: rgb(255, 170, 0);
-                font-size: 75px;
-            }
-            '''
-        )
-        self.setStyleSheet(
-            '''
-            background-color: rgb(0, 0, 255);
-            '''
-        )
-        self.btn_question.setStyleSheet(
-            '''
-            QPushButton {
-                background-color: rgb(25, 25, 255);
-                color: white;
-                border: 2px solid black;
-                font-size: 50px;
-                margin: 20px 0px 20px 10px;
-                padding: 15px;
-            }
-
-            QPushButton:hover {
-                background-color: rgb(50, 50, 255);
-            }
-            '''
-        )
-        self.answer_label.setStyleSheet(
-            '''
-            QLabel {
-                background-color: rgb(25, 25, 255);
-                color: white;
-                border: 2px solid black;
-                font-size: 50px;
-                padding: 20px;
-                min-height: 200px;
-            }
-            '''
-        )
-        self.answer_label.hide()
-        for frame in (self.team_frames_list):
-            frame.setStyleSheet(
-                '''
-                QFrame {
-                    border: 2px solid black;
-                    padding: 10px;
-                }
-
-                QPushButton {
-                    color: rgb(255, 170, 0);
-                    font-size: 20px;
-                    padding: 5px;
-                }
-
-                QLabel {
-                    border: none;
-                    font-size: 20px;
-                    color: rgb(255, 170, 0);
-                }
-                '''
-            )
-
-        if self.questionObj.opened:
+        engine = self.parent.engine
+        if engine.is_opened(*engine.current):
             self.show_answer()
 
+        self.showMaximized()
+        self.raise_()
+        self.activateWindow()
+
     def closeEvent(self, event) -> None:
         if self.points_added:
             event.accept()
-            self.parent.media_player.stop()
+            self.parent.audio.stop_theme()
 
         else:
             # pop up telling user points haven't been added.
@@ -314,148 +123,136 @@ class QuestionWindow(QMainWindow):
             match user:
                 case QtWidgets.QMessageBox.Ok:
                     event.accept()
-                    self.parent.media_player.stop()
+                    self.parent.audio.stop_theme()
+                    self.parent.audio.play_cue('times_up')
                 case _:
                     event.ignore()
 
-    def show_frames(self, frames: list) -> None:
+    def hideEvent(self, event) -> None:
+        # the question's picture and video are only kept while it's shown.
+        self.clear_media()
+        super(QuestionWindow, self).hideEvent(event)
+
+    def load_media(self, questionObj: Question) -> None:
+        '''
+        Function to show the question's picture and play its video.
+            A picture that isn't in the cache is shown once it's decoded.
         '''
-        Function to show team sub frames.
+        self.clear_media()
+        if questionObj.get_image():
+            self.picture_key, pixmap = self.media.request(
+                questionObj.get_image(), display_size(self.screen())
+            )
+            if pixmap is not None:
+                self.show_picture(self.picture_key, pixmap, '')
+            else:
+                self.picture_waiting = True
+        if questionObj.get_video():
+            self.play_video(questionObj.get_video())
+
+    def show_picture(self, key: tuple, pixmap, error: str) -> None:
+        '''
+        Function to show a picture from the media loader, if it's the question's.
 
             Parameters:
-                frames: list of frames to show.
+                key: (path, width, height) of the picture.
+                pixmap: QPixmap, null if the picture couldn't be loaded.
+                error: why the picture couldn't be loaded.
         '''
-        for frame in frames:
-            frame.show()
+        if key != self.picture_key:
+            return  # picture of a question that was closed
+        self.picture_waiting = False
+        if pixmap.isNull():
+            self.media_label.setText(f'Picture not loaded: {error}')
+        else:
+            self.media_label.setPixmap(pixmap)
+        self.media_label.show()
 
-    def hide_frames(self, frames: list) -> None:
+    def play_video(self, path: str) -> None:
         '''
-        Function to hide team sub frames.
+        Function to play the question's video under its picture.
+        '''
+        if self.video_player is None:
+            try:
+                self.video_player = VideoPlayer(self)
+            except ImportError as error:
+                self.media_label.setText(f'Video not played, QtMultimedia not available: {error}')
+                self.media_label.show()
+                return
+            layout = self.frame_2.layout()
+            layout.insertWidget(layout.indexOf(self.media_label) + 1, self.video_player.widget)
+        self.video_player.play(path)
+
+    def clear_media(self) -> None:
+        '''
+        Function to stop showing the question's picture and video, and free them.
+            Pictures too big for the media loader's cache are freed here.
+        '''
+        if self.picture_waiting:
+            self.media.cancel(self.picture_key)
+        self.picture_key = None
+        self.picture_waiting = False
+        self.media_label.clear()
+        self.media_label.hide()
+        if self.video_player is not None:
+            self.video_player.stop()
+
+    def show_buzz(self, team_index: int, reaction_time: float) -> None:
+        '''
+        Function to show which team buzzed in first on the network buzzers.
 
             Parameters:
-                frames: list of frames to hide.
+                team_index: position of the team.
+                reaction_time: seconds from the question opening to the buzz.
         '''
-        for frame in frames:
-            frame.hide()
+        name = self.parent.engine.get_team(team_index).get_name()
+        self.buzz_label.setText(f'{name} buzzed in ({reaction_time:.2f} s)')
+        self.buzz_label.show()
+        self.team_view.scrollTo(self.parent.scoreboard.index(team_index, 0))
 
     def toggle_team_btns(self, enabled=False):
         '''
-        Function to toggle team pushbutton.
+        Function to toggle giving points to the teams.
 
             Parameter:
                 enabled: False - disabled button, True - enabled button.
         '''
 
-        for frame in self.frames_to_show:
-            btn = frame.findChildren(QtWidgets.QPushButton)[0]
-            btn.setEnabled(enabled)
+        self.team_view.setEnabled(enabled)
 
     def show_answer(self) -> None:
         '''
         Function to show the answer, when the button is clicked
         '''
-        if self.questionObj.opened:
-            self.toggle_team_btns(False)
-        else:
-            self.toggle_team_btns(True)
-
-        self.questionObj.opened = True
-        self.btn_question.setEnabled(False)
-        self.btn_question.setStyleSheet(
-            '''
-            QPushButton {
-                background-color: rgb(50, 50, 255);
-                color: white;
-                font-size: 50px;
-                margin: 20px 0px 20px 10px;
-                padding: 15px;
-
-            }
-            '''
-        )
-
-        text = f'Answer:\n\n{self.answer}\n'
-        self.answer_label.setText(text)
-        self.answer_label.show()
-        self.parent.media_player.stop()
-
-        self.clicked_btn.setStyleSheet(
-            '''
-            QPushButton {
-                color: rgb(255, 170, 0);
-                background-color: rgb(50, 50, 255);
-                text-decoration: line-through;
-                font-size: 40px;
-
-            }
-            '''
-        )
-
-    def set_team_frame_info(self, frame: QtWidgets.QFrame, name: str, points: int | float) -> None:
-        '''
-        Function to set a team frame's name and points.
-
-            Parameter:
-                frame: what frame to look in.
-
-            Returns: tuple
-                name: str of team name.
-                points: float of points.
-
-        '''
-
-        if type(points) == str:
-            points = float(points)
-            points = "Points: {:.0f}".format(points)
-        else:
-            points = "Points: {:.0f}".format(points)
-
-        frame.findChild(QtWidgets.QPushButton).setText(name)
-        frame.findChild(QtWidgets.QLabel).setText(points)
-
-    def get_team_frame_info(self, frame: QtWidgets.QFrame) -> tuple:
+        with tracing.span('QuestionWindow.show_answer'):
+            engine = self.parent.engine
+            if engine.is_opened(*engine.current):
+                self.toggle_team_btns(False)
+            else:
+                self.toggle_team_btns(True)
+
+            engine.reveal_answer()
+            self.btn_question.setEnabled(False)
+            set_state(self.btn_question, 'revealed')
+
+            text = f'Answer:\n\n{self.answer}\n'
+            self.answer_label.setText(text)
+            self.answer_label.show()
+            with tracing.span('stop_theme'):
+                self.parent.audio.stop_theme()
+
+            set_state(self.clicked_btn, 'opened')
+
+    def update_points(self, team_index: int) -> None:
         '''
-        Function to get a team frame name and points.
-
-            Parameter:
-                frame: what frame to look in.
-
-            Returns: tuple
-                name: str of team name.
-                points: float of points.
-
-        '''
-        name = frame.findChild(QtWidgets.QPushButton).text()
-        points = frame.findChild(QtWidgets.QLabel).text()
-        points = points.split(':')[-1]
-
-        return name, float(points)
-
-    def update_points(self, points: int | float) -> None:
-        '''
-        Function to update the team points
+        Function to give the question's points to a team.
 
             Parameters:
-                points: int or float of points.
+                team_index: position of the team that was clicked.
         '''
-
-        # getting the what team button was clicked
-        sender = self.sender()
-        sender_name = sender.objectName()
-        btn = self.findChild(
-            QtWidgets.QPushButton, sender_name
-        )
-
-        # going through team frames to find what team the clicked button belongs to:
-        for frame in self.frames_to_show:
-            if btn in frame.findChildren(QtWidgets.QPushButton):
-                # updating QLabel:
-                points_label = frame.findChildren(QtWidgets.QLabel)[0]
-                prev_points = float(points_label.text().split(":")[-1])
-                points_label.setText(
-                    "Points: {:.0f}".format(self.points + prev_points)
-                )
-
-        # calling function in parent window to update points in the TeamWindow Class.
-        self.points_added = True
-        self.parent.team_window.points_changed(points)
+        with tracing.span('QuestionWindow.update_points', team_index=team_index):
+            # the engine tells the scoreboard to show the new points.
+            self.points_added = True
+            with tracing.span('play_cue'):
+                self.parent.audio.play_cue('buzz_in')
+            self.parent.engine.award(team_index, self.points)
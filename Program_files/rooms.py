@@ -0,0 +1,454 @@
+'''
+Script with the game room server.
+
+One process hosts many games ("rooms") at once, for events where lots of games
+are played at the same time. Each room has its own GameEngine (board, teams,
+score ledger), and is run by a host client and watched by any number of player
+clients over TCP. There are no windows; the server only runs the engines.
+
+The board is loaded once when the server starts and shared by every room, rooms
+only read it. With a question bank, every room gets its own board picked from
+the one open bank.
+
+Protocol, one JSON object per line:
+    client -> server: {'op': ..., 'id': any, ...}, the reply has the same 'id'.
+        {'op': 'create', 'teams': [names]}      make a room, the client is its host.
+        {'op': 'join', 'room': code}            watch a room.
+        host only:
+        {'op': 'open', 'col', 'row'}            replies with the question.
+        {'op': 'reveal'}                        replies with the answer.
+        {'op': 'award', 'team', 'points'}       points default to the question's.
+        {'op': 'deduct', 'team', 'points'}
+        {'op': 'set_points', 'team', 'points'}
+        {'op': 'undo'} / {'op': 'redo'}
+        {'op': 'close'}                         end the room.
+    server -> client
+        {'reply': id, 'ok': true, ...} or {'reply': id, 'ok': false, 'error': str}
+        {'event': name, 'room': code, 'seq': n, ...}   every change to a room the
+            client is in, the engine's events (see Program_files/engine.py),
+            numbered from 1 in each room.
+        {'event': 'closed', 'room': code, 'seq': n}
+
+To start a server type:
+    python -m Program_files.rooms [--board PATH | --bank PATH] [--port 8766]
+'''
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import sys
+import threading
+
+from .engine import GameEngine
+
+DEFAULT_PORT = 8766
+MAX_LINE = 64 * 1024
+
+
+class RoomError(ValueError):
+    '''
+    Error sent back to a client whose request can't be done.
+    '''
+
+
+def _encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class Room():
+    '''
+    Class for one game hosted by the server.
+    '''
+
+    def __init__(self, code: str, engine: GameEngine, host):
+        self.code = code
+        self.engine = engine
+        self.host = host
+        self.members = {host}  # connections sent the room's events
+        self.seq = 0
+        engine.add_listener(self.on_engine_event)
+
+    def on_engine_event(self, event: str, **data) -> None:
+        '''
+        Function to send a change to the game to everyone in the room.
+        '''
+        self.seq += 1
+        message = {'event': event, 'room': self.code, 'seq': self.seq}
+        message.update(data)
+        if 'entry' in data:
+            message['entry'] = data['entry']._asdict()
+        self.broadcast(_encode(message))
+
+    def broadcast(self, line: bytes) -> None:
+        # encoded once for every member.
+        for member in self.members:
+            member.write(line)
+
+    def state(self) -> dict:
+        '''
+        Function to get what a client needs to show the room.
+        '''
+        engine = self.engine
+        return {
+            'room': self.code,
+            'seq': self.seq,
+            'teams': engine.team_names,
+            'scores': engine.scores(),
+            'categories': engine.category_names,
+            'points': [
+                [engine.question_points(col, row) for row in range(len(column))]
+                for col, column in enumerate(engine.all_questions)
+            ],
+            'opened': engine.opened.to_lists(),
+            'current': engine.current,
+        }
+
+
+class _ClientConnection(asyncio.Protocol):
+    '''
+    Class for the connection of one host or player client.
+    '''
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b''
+        self.rooms = set()
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc) -> None:
+        self.server.disconnected(self)
+
+    def write(self, line: bytes) -> None:
+        if not self.transport.is_closing():
+            self.transport.write(line)
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(b'\n')
+        if len(self.buffer) > MAX_LINE:
+            self.transport.close()
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise RoomError('requests are JSON objects')
+                request_id = request.get('id')
+                reply = self.server.handle(self, request)
+            except (RoomError, ValueError, KeyError, IndexError, TypeError) as error:
+                reply = {'ok': False, 'error': str(error) or type(error).__name__}
+            else:
+                reply['ok'] = True
+            reply['reply'] = request_id
+            self.write(_encode(reply))
+
+
+class RoomServer():
+    '''
+    Class to host many game rooms in one asyncio event loop.
+    '''
+
+    def __init__(self, board_loader, host='0.0.0.0', port=DEFAULT_PORT, seed=None):
+        '''
+            Parameters:
+                board_loader: function returning (questions, category_names) for
+                    a new room. Rooms don't change the questions, so it can
+                    return the same board every time.
+                host: address to listen on, all of them by default.
+                port: TCP port to listen on, 0 for any free port.
+                seed: seed of the room codes, for repeatable tests.
+        '''
+        self.board_loader = board_loader
+        self.host = host
+        self.port = port
+        self.rooms = {}
+        self.rng = random.Random(seed)
+
+        self.loop = None
+        self.server = None
+        self.thread = None
+
+    # Requests
+
+    def handle(self, client: _ClientConnection, request: dict) -> dict:
+        '''
+        Function to do a client's request.
+
+            Returns:
+                dict sent back to the client.
+        '''
+        op = request.get('op')
+        if op == 'create':
+            return self.create_room(client, request['teams'])
+        if op == 'join':
+            room = self._room(request)
+            room.members.add(client)
+            client.rooms.add(room.code)
+            return room.state()
+
+        room = self._room(request) if 'room' in request else self._hosted_room(client)
+        if room.host is not client:
+            raise RoomError('only the host can do that')
+        engine = room.engine
+        if op == 'open':
+            col, row = self._cell(engine, request)
+            question = engine.open_question(col, row)
+            return {'question': question.get_question(), 'points': question.get_points()}
+        if op == 'reveal':
+            if engine.current is None:
+                raise RoomError('no question is open')
+            engine.reveal_answer()
+            return {'answer': engine.get_question(*engine.current).get_answer()}
+        if op in ('award', 'deduct'):
+            if request.get('points') is None and engine.current is None:
+                raise RoomError('no question is open')
+            team = self._team(engine, request)
+            getattr(engine, op)(team, self._points(request, required=False))
+            return {}
+        if op == 'set_points':
+            engine.set_points(self._team(engine, request), self._points(request))
+            return {}
+        if op in ('undo', 'redo'):
+            return {'changed': getattr(engine, op)()}
+        if op == 'close':
+            self.close_room(room)
+            return {}
+        raise RoomError(f'unknown op {op!r}')
+
+    def _room(self, request: dict) -> Room:
+        room = self.rooms.get(request['room'])
+        if room is None:
+            raise RoomError(f'no room {request["room"]!r}')
+        return room
+
+    def _hosted_room(self, client: _ClientConnection) -> Room:
+        hosted = [code for code in client.rooms if self.rooms[code].host is client]
+        if len(hosted) != 1:
+            raise RoomError('say which room')
+        return self.rooms[hosted[0]]
+
+    @staticmethod
+    def _cell(engine: GameEngine, request: dict) -> tuple:
+        col, row = request['col'], request['row']
+        if not (isinstance(col, int) and 0 <= col < len(engine.all_questions)
+                and isinstance(row, int) and 0 <= row < len(engine.all_questions[col])):
+            raise RoomError(f'no question at col {col!r}, row {row!r}')
+        return col, row
+
+    @staticmethod
+    def _points(request: dict, required=True):
+        points = request.get('points')
+        if points is None and not required:
+            return None
+        if isinstance(points, bool) or not isinstance(points, (int, float)):
+            raise RoomError(f'points must be a number, not {points!r}')
+        return points
+
+    @staticmethod
+    def _team(engine: GameEngine, request: dict) -> int:
+        team = request['team']
+        if not isinstance(team, int) or not 0 <= team < len(engine.team_list):
+            raise RoomError(f'no team {team!r}')
+        return team
+
+    def create_room(self, host: _ClientConnection, team_names: list) -> dict:
+        '''
+        Function to start a new game.
+        '''
+        if not team_names or not all(isinstance(name, str) for name in team_names):
+            raise RoomError('a room needs a list of team names')
+        questions, category_names = self.board_loader()
+        code = self._new_code()
+        room = Room(code, GameEngine(questions, category_names, team_names), host)
+        self.rooms[code] = room
+        host.rooms.add(code)
+        return room.state()
+
+    def _new_code(self) -> str:
+        while True:
+            code = ''.join(self.rng.choices(string.ascii_uppercase, k=5))
+            if code not in self.rooms:
+                return code
+
+    def close_room(self, room: Room) -> None:
+        '''
+        Function to end a game and tell everyone in its room.
+        '''
+        room.seq += 1
+        room.broadcast(_encode({'event': 'closed', 'room': room.code, 'seq': room.seq}))
+        room.engine.remove_listener(room.on_engine_event)
+        for member in room.members:
+            member.rooms.discard(room.code)
+        del self.rooms[room.code]
+
+    def disconnected(self, client: _ClientConnection) -> None:
+        # a room is closed when its host leaves.
+        for code in list(client.rooms):
+            room = self.rooms.get(code)
+            if room is None:
+                continue
+            room.members.discard(client)
+            if room.host is client:
+                self.close_room(room)
+
+    # Running
+
+    async def serve(self, ready=None) -> None:
+        '''
+        Function to run the server in the running event loop until cancelled.
+        '''
+        self.loop = asyncio.get_running_loop()
+        self.server = await self.loop.create_server(
+            lambda: _ClientConnection(self), self.host, self.port, backlog=1024
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        if ready is not None:
+            ready()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def start(self) -> None:
+        '''
+        Function to start the server in a background thread.
+            Raises OSError if the port can't be used.
+        '''
+        started = threading.Event()
+        error = []
+
+        def run() -> None:
+            try:
+                asyncio.run(self.serve(ready=started.set))
+            except asyncio.CancelledError:
+                pass
+            except OSError as exc:
+                error.append(exc)
+                started.set()
+
+        self.thread = threading.Thread(target=run, name='room server', daemon=True)
+        self.thread.start()
+        started.wait()
+        if error:
+            self.thread = None
+            raise error[0]
+
+    def stop(self) -> None:
+        '''
+        Function to stop a server started with start().
+        '''
+        if self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.thread.join()
+        self.thread = None
+
+
+class RoomClient():
+    '''
+    Class for a host or player client of a RoomServer, used with asyncio.
+    '''
+
+    def __init__(self, on_event=None):
+        '''
+            Parameters:
+                on_event: function called with every event dict from the server.
+        '''
+        self.on_event = on_event
+        self.reader = None
+        self.writer = None
+        self.replies = {}
+        self.next_id = 0
+        self.task = None
+
+    async def connect(self, host: str, port: int) -> None:
+        self.reader, self.writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        self.task = asyncio.ensure_future(self._read())
+
+    async def _read(self) -> None:
+        async for line in self.reader:
+            message = json.loads(line)
+            if 'reply' in message:
+                self.replies.pop(message['reply']).set_result(message)
+            elif self.on_event is not None:
+                self.on_event(message)
+        for future in self.replies.values():
+            future.set_exception(ConnectionError('server closed the connection'))
+
+    async def request(self, op: str, **arguments) -> dict:
+        '''
+        Function to send a request and wait for its reply.
+            Raises RoomError if the server couldn't do it.
+        '''
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.replies[self.next_id] = future
+        self.writer.write(_encode({'op': op, 'id': self.next_id, **arguments}))
+        reply = await future
+        if not reply['ok']:
+            raise RoomError(reply['error'])
+        return reply
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.task
+
+
+def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m Program_files.rooms', description='Jeopardy! game room server'
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--board', metavar='PATH', help='board file every room plays')
+    source.add_argument('--bank', metavar='PATH',
+                        help='question bank to pick a board from for each room')
+    parser.add_argument('--round', default='0', metavar='ROUND',
+                        help='round of the board file to play (default: 0)')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    if args.bank is not None:
+        from .question_bank import QuestionBank
+
+        # one connection, only read from, is shared by the rooms.
+        bank = QuestionBank(args.bank)
+        board_loader = bank.build_board
+    else:
+        if args.board is not None:
+            from .board_loader import load_board
+
+            round_key = int(args.round) if args.round.isdigit() else args.round
+            board = load_board(args.board, round=round_key)
+        else:
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            from questions import all_questions, category_names
+            board = (all_questions, category_names)
+        board_loader = lambda: board
+
+    server = RoomServer(board_loader, host=args.host, port=args.port)
+
+    def ready() -> None:
+        print(f'listening on port {server.port}', flush=True)
+
+    try:
+        asyncio.run(server.serve(ready=ready))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    from .board_loader import BoardError
+    from .question_bank import BankError
+
+    try:
+        main(sys.argv[1:])
+    except (BoardError, BankError, OSError) as error:
+        sys.exit(str(error))
@@ -0,0 +1,114 @@
+'''
+Script with the scoreboard model.
+
+The teams and their points are shown by item views (QTableView) over one
+ScoreboardModel, so any number of teams can be shown and a change to one team's
+points only redraws that one cell.
+'''
+
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from . import tracing
+
+
+class ScoreboardModel(QAbstractTableModel):
+    '''
+    Class to show the game engine's teams in a table: one row per team,
+    columns are the team name and its points.
+    '''
+
+    NAME = 0
+    POINTS = 1
+    HEADERS = ['Team', 'Points']
+
+    def __init__(self, engine, parent=None):
+        '''
+            Parameters:
+                engine: GameEngine with the teams.
+                parent: QObject owning the model.
+        '''
+        super(ScoreboardModel, self).__init__(parent)
+        self.engine = engine
+
+        # function called as confirm(team_index, points) before the host's
+        # edit overwrites a team's points, returns False to cancel the edit.
+        self.confirm = None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.engine.team_list)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if column == self.NAME:
+                return self.engine.get_team(row).get_name()
+            return '{:.0f}'.format(self.engine.get_points(row))
+        if role == Qt.EditRole and column == self.POINTS:
+            return self.engine.get_points(row)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super(ScoreboardModel, self).headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex):
+        flags = super(ScoreboardModel, self).flags(index)
+        if index.isValid() and index.column() == self.POINTS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        '''
+        Function called when the host edits a team's points in a view.
+        '''
+        if role != Qt.EditRole or index.column() != self.POINTS:
+            return False
+        with tracing.span('ScoreboardModel.setData', team_index=index.row()):
+            try:
+                points = float(value)
+            except (TypeError, ValueError):
+                return False
+            # the host answering the warning isn't the game's time.
+            with tracing.span('confirm'):
+                if self.confirm is not None and not self.confirm(index.row(), points):
+                    return False
+            # the engine's 'points_changed' event redraws the cell.
+            self.engine.set_points(index.row(), points)
+            return True
+
+    def on_engine_event(self, event: str, **data) -> None:
+        '''
+        Function to tell the views which cell changed when the game engine changes.
+        '''
+        if event == 'points_changed':
+            index = self.index(data['team_index'], self.POINTS)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+
+def set_up_team_view(view: QtWidgets.QTableView) -> None:
+    '''
+    Function to size the columns and rows of a view of the scoreboard.
+        Every row is the same height, so the view never measures its rows.
+
+        Parameters:
+            view: view showing a ScoreboardModel.
+    '''
+    view.ensurePolished()  # the theme sets the font
+    header = view.horizontalHeader()
+    header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+    rows = view.verticalHeader()
+    rows.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+    rows.setDefaultSectionSize(view.fontMetrics().height() * 3 // 2)
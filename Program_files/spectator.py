@@ -0,0 +1,381 @@
+'''
+Script with the spectator feed.
+
+A small HTTP server, run in a background thread, that lets any number of
+browsers or hall displays follow the game without screen sharing:
+    GET /           page showing the board and the scores.
+    GET /snapshot   the whole state of the game as JSON, with its 'seq'.
+    GET /events     Server-Sent Events stream. The first event is the snapshot,
+                    after it every change is sent as a small delta. A viewer
+                    reconnecting with Last-Event-ID only gets what it missed.
+
+Deltas, numbered by 'seq' (also the SSE id):
+    {'seq', 't': 'clue', 'c': col, 'r': row, 'q': question, 'p': points}
+    {'seq', 't': 'open', 'c': col, 'r': row, 'a': answer}
+    {'seq', 't': 'score', 'i': team index, 's': points}
+    {'seq', 't': 'round', 'categories', 'points', 'opened'}   the next round's board
+
+The game only hands each engine event to the server's thread, everything else
+(encoding, the state kept for /snapshot, sending) is done there. Each viewer has
+at most `buffer_size` bytes waiting to be sent; a viewer too slow to keep up is
+disconnected instead of holding up the game or the other viewers. Deltas made
+at the same time (e.g. a click that opens a cell and changes a score) are sent
+to each viewer in one write.
+'''
+
+import asyncio
+import json
+import socket
+import threading
+from collections import deque
+
+DEFAULT_PORT = 8080
+BUFFER_SIZE = 64 * 1024
+FANOUT = 100  # viewers written to between two passes of the event loop
+HISTORY = 1024  # deltas kept for viewers that reconnect
+
+PAGE = '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Jeopardy!</title>
+<style>
+body { background: black; color: rgb(250, 170, 0); font: 24px Arial; margin: 0; }
+table { width: 100%; border-collapse: collapse; }
+td, th { background: rgb(0, 0, 255); border: 2px solid black; text-align: center; padding: 12px; }
+td.opened { background: rgb(50, 50, 255); text-decoration: line-through; }
+#clue { color: white; text-align: center; font-size: 40px; padding: 20px; }
+</style></head>
+<body><table id="board"></table><div id="clue"></div><table id="scores"></table>
+<script>
+let state = null;
+function cell(tag, text, cls) {
+    const td = document.createElement(tag);
+    td.textContent = text;
+    if (cls) td.className = cls;
+    return td;
+}
+function draw() {
+    const board = document.getElementById('board');
+    board.replaceChildren();
+    const head = board.insertRow();
+    state.categories.forEach(name => head.appendChild(cell('th', name)));
+    const rows = Math.max(...state.points.map(column => column.length));
+    for (let r = 0; r < rows; r++) {
+        const row = board.insertRow();
+        state.points.forEach((column, c) => row.appendChild(
+            cell('td', r < column.length ? column[r] : '', state.opened[c][r] ? 'opened' : '')));
+    }
+    const scores = document.getElementById('scores');
+    scores.replaceChildren();
+    state.teams.forEach((name, i) => {
+        const row = scores.insertRow();
+        row.appendChild(cell('td', name));
+        row.appendChild(cell('td', state.scores[i]));
+    });
+}
+const events = new EventSource('/events');
+events.addEventListener('snapshot', e => { state = JSON.parse(e.data); draw(); });
+events.onmessage = e => {
+    const d = JSON.parse(e.data);
+    if (d.t === 'clue') document.getElementById('clue').textContent = d.q;
+    if (d.t === 'open') { state.opened[d.c][d.r] = true; document.getElementById('clue').textContent = d.a; }
+    if (d.t === 'score') state.scores[d.i] = d.s;
+    if (d.t === 'round') {
+        Object.assign(state, {categories: d.categories, points: d.points, opened: d.opened});
+        document.getElementById('clue').textContent = '';
+    }
+    draw();
+};
+</script></body></html>
+'''
+
+
+def board_state(engine) -> dict:
+    '''
+    Function to get the board a spectator sees, from the game engine.
+    '''
+    return {
+        'categories': list(engine.category_names),
+        'points': [
+            [engine.question_points(col, row) for row in range(len(column))]
+            for col, column in enumerate(engine.all_questions)
+        ],
+        'opened': engine.opened.to_lists(),
+    }
+
+
+def game_state(engine) -> dict:
+    '''
+    Function to get the state a spectator sees, from the game engine.
+    '''
+    state = {
+        'seq': 0,
+        'teams': list(engine.team_names),
+        'scores': engine.scores(),
+        'clue': None,
+    }
+    state.update(board_state(engine))
+    return state
+
+
+class _Viewer():
+    '''
+    Class for the connection of one spectator.
+    '''
+
+    def __init__(self, transport: asyncio.Transport, seq: int):
+        self.transport = transport
+        self.seq = seq  # last delta the viewer has
+
+
+class SpectatorFeed():
+    '''
+    Class to serve the game to spectators over HTTP.
+    '''
+
+    def __init__(self, host='0.0.0.0', port=DEFAULT_PORT, buffer_size=BUFFER_SIZE):
+        '''
+            Parameters:
+                host: address to listen on, all of them by default.
+                port: TCP port to listen on, 0 for any free port.
+                buffer_size: most bytes waiting to be sent to one viewer.
+        '''
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+
+        # only used in the server's thread.
+        self.state = None
+        self.history = deque(maxlen=HISTORY)  # (seq, encoded delta)
+        self.pending = []  # (seq, encoded delta) not sent yet
+        self.wake = None  # asyncio.Event set when there is something to send
+        self.viewers = set()
+        self.dropped = 0
+
+        self.engine = None
+        self.loop = None
+        self.stopped = None  # future set to stop the server
+        self.server = None
+        self.thread = None
+
+    # Game side, called from the GUI thread
+
+    def start(self, engine) -> None:
+        '''
+        Function to start serving a game in a background thread.
+            Raises OSError if the port can't be used.
+
+            Parameters:
+                engine: GameEngine of the game, its events are sent to the viewers.
+        '''
+        self.state = game_state(engine)
+        started = threading.Event()
+        error = []
+
+        async def run_server() -> None:
+            self.loop = asyncio.get_running_loop()
+            self.stopped = self.loop.create_future()
+            try:
+                self.server = await asyncio.start_server(
+                    self._serve, self.host, self.port, backlog=1024
+                )
+            except OSError as exc:
+                error.append(exc)
+                started.set()
+                return
+            self.port = self.server.sockets[0].getsockname()[1]
+            self.wake = asyncio.Event()
+            sender = asyncio.ensure_future(self._send())
+            started.set()
+            async with self.server:
+                await self.stopped
+                sender.cancel()
+                for viewer in list(self.viewers):
+                    viewer.transport.abort()
+            # asyncio.run() cancels what is left of the viewers' streams.
+
+        def run() -> None:
+            asyncio.run(run_server())
+
+        self.thread = threading.Thread(target=run, name='spectator feed', daemon=True)
+        self.thread.start()
+        started.wait()
+        if error:
+            self.thread = None
+            raise error[0]
+        self.engine = engine
+        engine.add_listener(self.on_engine_event)
+
+    def stop(self) -> None:
+        '''
+        Function to disconnect the viewers and stop the server.
+        '''
+        if self.thread is None:
+            return
+        self.engine.remove_listener(self.on_engine_event)
+        self.loop.call_soon_threadsafe(self.stopped.set_result, None)
+        self.thread.join()
+        self.thread = None
+
+    def on_engine_event(self, event: str, **data) -> None:
+        '''
+        Function to pass an engine event to the server's thread.
+        '''
+        if event == 'question_opened':
+            question = self.engine.get_question(data['col'], data['row'])
+            delta = {'t': 'clue', 'c': data['col'], 'r': data['row'],
+                     'q': question.get_question(), 'p': question.get_points()}
+        elif event == 'answer_revealed':
+            question = self.engine.get_question(data['col'], data['row'])
+            delta = {'t': 'open', 'c': data['col'], 'r': data['row'],
+                     'a': question.get_answer()}
+        elif event == 'points_changed':
+            delta = {'t': 'score', 'i': data['team_index'], 's': data['points']}
+        elif event == 'round_started':
+            delta = {'t': 'round'}
+            delta.update(board_state(self.engine))
+        else:
+            return
+        self.loop.call_soon_threadsafe(self._publish, delta)
+
+    # Server side, run in the server's thread
+
+    def _publish(self, delta: dict) -> None:
+        state = self.state
+        state['seq'] += 1
+        delta['seq'] = state['seq']
+        if delta['t'] == 'clue':
+            state['clue'] = [delta['c'], delta['r']]
+        elif delta['t'] == 'open':
+            state['opened'][delta['c']][delta['r']] = True
+        elif delta['t'] == 'round':
+            state.update((key, delta[key]) for key in ('categories', 'points', 'opened'))
+            state['clue'] = None
+        else:
+            state['scores'][delta['i']] = delta['s']
+
+        message = _event(delta['seq'], None, json.dumps(delta, separators=(',', ':')))
+        self.history.append((delta['seq'], message))
+        self.pending.append((delta['seq'], message))
+        self.wake.set()
+
+    async def _send(self) -> None:
+        # the deltas published since the last pass are sent in one write per
+        # viewer, FANOUT viewers at a time so the loop (and the GIL) isn't
+        # held for the whole pass.
+        while True:
+            await self.wake.wait()
+            self.wake.clear()
+            pending, self.pending = self.pending, []
+            first_seq = pending[0][0]
+            data = b''.join(message for _, message in pending)
+            viewers = list(self.viewers)
+            for start in range(0, len(viewers), FANOUT):
+                for viewer in viewers[start:start + FANOUT]:
+                    transport = viewer.transport
+                    if transport.is_closing():
+                        continue
+                    if transport.get_write_buffer_size() > self.buffer_size:
+                        self._drop(viewer)
+                    elif viewer.seq < first_seq:
+                        transport.write(data)
+                    else:
+                        # joined after some of the deltas, the snapshot had them.
+                        transport.write(b''.join(
+                            message for seq, message in pending if seq > viewer.seq
+                        ))
+                await asyncio.sleep(0)
+
+    def _drop(self, viewer: _Viewer) -> None:
+        self.viewers.discard(viewer)
+        self.dropped += 1
+        viewer.transport.abort()
+
+    def _snapshot(self) -> bytes:
+        return json.dumps(self.state, separators=(',', ':')).encode('utf-8')
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode('latin-1').split('\r\n')
+        method, _, rest = lines[0].partition(' ')
+        path = rest.partition(' ')[0].partition('?')[0]
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if method != 'GET':
+            _respond(writer, '405 Method Not Allowed', 'text/plain', b'GET only\n')
+        elif path == '/':
+            _respond(writer, '200 OK', 'text/html; charset=utf-8', PAGE.encode('utf-8'))
+        elif path == '/snapshot':
+            _respond(writer, '200 OK', 'application/json', self._snapshot())
+        elif path == '/events':
+            await self._stream(reader, writer, headers.get('last-event-id'))
+            return
+        else:
+            _respond(writer, '404 Not Found', 'text/plain', b'not found\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                      last_event_id) -> None:
+        writer.write(
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: text/event-stream\r\n'
+            b'Cache-Control: no-cache\r\n'
+            b'Access-Control-Allow-Origin: *\r\n'
+            b'\r\n'
+        )
+        # a viewer that reconnects gets the deltas it missed, if they are
+        # still kept, otherwise the whole state again. An id past the last
+        # message is from before the feed restarted (or a stale tab), so the
+        # viewer gets the whole state too.
+        missed = None
+        since = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        if since is not None and since <= self.state['seq']:
+            if self.history and self.history[0][0] <= since + 1:
+                missed = [message for seq, message in self.history if seq > since]
+            elif not self.history and since == self.state['seq']:
+                missed = []
+        if missed is None:
+            writer.write(_event(self.state['seq'], 'snapshot', self._snapshot().decode('utf-8')))
+        else:
+            writer.writelines(missed)
+
+        # the kernel's buffer for the viewer is kept small too, so a stalled
+        # viewer's bytes pile up where buffer_size sees them.
+        writer.get_extra_info('socket').setsockopt(
+            socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size
+        )
+        viewer = _Viewer(writer.transport, self.state['seq'])
+        self.viewers.add(viewer)
+        # viewers don't send anything, this waits for them to disconnect.
+        try:
+            while await reader.read(1024):
+                pass
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # also cancelled when the server stops
+        finally:
+            self.viewers.discard(viewer)
+            writer.close()
+
+
+def _event(seq: int, name, data: str) -> bytes:
+    lines = [f'id: {seq}']
+    if name is not None:
+        lines.append(f'event: {name}')
+    lines.append(f'data: {data}')
+    return ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+
+def _respond(writer: asyncio.StreamWriter, status: str, content_type: str, body: bytes) -> None:
+    writer.write(
+        f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+        f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body
+    )
@@ -0,0 +1,146 @@
+'''
+Script to measure how long the game takes to start.
+
+Run *"python Jeopardy.py --startup-profile"* to print, to stderr:
+    - the time taken by each import, in the same format as python -X importtime.
+    - wall clock time of each startup phase, up to the first frame of the menu
+      and then the background loading done after it.
+The game quits by itself once it has started.
+
+Nothing is recorded unless enable() was called, so mark() is safe to leave in
+the startup code.
+'''
+
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+enabled = False
+
+_start = None
+_marks = []  # (phase name, perf_counter)
+_imports = []  # (module name, self us, cumulative us, nesting level)
+
+
+class _TimingLoader():
+    '''
+    Class wrapping a module loader to time how long the module takes to import.
+    '''
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._stack = _ImportTimer.stack
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        if create is None:
+            return None
+        self._start = time.perf_counter()
+        self._children = 0.0
+        self._stack.append(self)
+        try:
+            return create(spec)
+        finally:
+            self._stack.pop()
+            self._create_time = time.perf_counter() - self._start
+
+    def exec_module(self, module):
+        # restore the real loader so importlib.resources etc. see it.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        create_time = getattr(self, '_create_time', 0.0)
+        children = getattr(self, '_children', 0.0)
+        start = time.perf_counter()
+        self._children = children
+        self._stack.append(self)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._stack.pop()
+            cumulative = create_time + time.perf_counter() - start
+            if self._stack:
+                self._stack[-1]._children += cumulative
+            _imports.append((
+                module.__name__,
+                (cumulative - self._children) * 1e6,
+                cumulative * 1e6,
+                len(self._stack)
+            ))
+
+
+class _ImportTimer(MetaPathFinder):
+    '''
+    Class put first on sys.meta_path to wrap the loader of every new import.
+    '''
+
+    stack = []
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimingLoader(spec.loader)
+                return spec
+        return None
+
+
+def enable() -> None:
+    '''
+    Function to start recording imports and startup phases.
+    '''
+    global enabled, _start
+    if enabled:
+        return
+    enabled = True
+    _start = time.perf_counter()
+    sys.meta_path.insert(0, _ImportTimer())
+    mark('profiling started')
+
+
+def mark(phase: str) -> None:
+    '''
+    Function to record that a startup phase has finished.
+    '''
+    if enabled:
+        _marks.append((phase, time.perf_counter()))
+
+
+def report(file=None) -> None:
+    '''
+    Function to print the import times and startup phases.
+    '''
+    file = file or sys.stderr
+    print('import time: self [us] | cumulative | imported package', file=file)
+    for name, self_us, cumulative_us, level in _imports:
+        print(f'import time: {self_us:9.0f} | {cumulative_us:10.0f} | '
+              f'{"  " * level}{name}', file=file)
+
+    print('', file=file)
+    print('startup phase                            phase [ms]   total [ms]', file=file)
+    previous = _start
+    for phase, when in _marks:
+        print(f'{phase:<40} {(when - previous) * 1000:10.1f} '
+              f'{(when - _start) * 1000:12.1f}', file=file)
+        previous = when
+
+
+def finish() -> None:
+    '''
+    Function called once startup is over.
+        When profiling, prints the report and quits the game.
+    '''
+    if not enabled:
+        return
+    mark('startup finished')
+    report()
+
+    from PyQt5.QtWidgets import QApplication
+    QApplication.quit()
@@ -0,0 +1,63 @@
+'''
+Script to apply the application theme (UI_Files/jeopardy.qss).
+
+The whole game is styled by one application stylesheet, loaded once, instead of
+a stylesheet on each widget. Widgets are matched by object name and by dynamic
+properties, so a state change (e.g. a board cell being opened) only sets a
+property with set_state() and repolishes that one widget.
+'''
+
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+THEME_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'UI_Files', 'jeopardy.qss'
+)
+
+_theme = None  # text of the theme file, read once
+
+
+def apply_theme(app=None) -> None:
+    '''
+    Function to set the theme as the application stylesheet.
+        Does nothing if it is already set, so every window can call it.
+    '''
+    global _theme
+    app = app or QApplication.instance()
+    if _theme is None:
+        with open(THEME_PATH, 'r', encoding='utf-8') as file:
+            _theme = file.read()
+    if app.styleSheet() != _theme:
+        app.setStyleSheet(_theme)
+
+
+def set_state(widget, name: str, value=True) -> None:
+    '''
+    Function to change a widget's style state.
+
+        Parameters:
+            widget: widget to change.
+            name: name of the dynamic property the theme checks, e.g. 'opened'.
+            value: new value of the property.
+    '''
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        # only widgets that have been styled already need styling again.
+        # The theme never matches on a parent's state, so the children don't.
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+
+def mark(widgets, name: str, value=True) -> None:
+    '''
+    Function to set the same style state on a list of widgets.
+    '''
+    for widget in widgets:
+        set_state(widget, name, value)
@@ -0,0 +1,103 @@
+'''
+Script to trace where the time of each click goes.
+
+Run *"python Jeopardy.py --trace trace.json"* to write, when the game closes, a
+trace of the game in the Chrome trace format: open it in Perfetto
+(https://ui.perfetto.dev) or chrome://tracing. Every handler of a click (opening
+the game, a question, showing the answer, giving or editing points) is a span,
+with spans inside it for its phases (e.g. building the game window's board) and
+for each listener the game engine told about the change.
+
+Nothing is recorded unless enable() was called: span() then returns the same
+do-nothing context manager every time, so spans are safe to leave in the code.
+'''
+
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+enabled = False
+
+_start = 0.0
+_events = []  # Chrome trace events, appended from any thread
+_thread_names = {}  # thread id -> name
+
+_NO_SPAN = nullcontext()
+
+
+class _Span():
+    '''
+    Class to record one span as a Chrome trace complete ("X") event.
+    '''
+
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        thread = threading.get_ident()
+        if thread not in _thread_names:
+            _thread_names[thread] = threading.current_thread().name
+        event = {
+            'name': self.name,
+            'ph': 'X',
+            'ts': (self.start - _start) * 1e6,
+            'dur': (end - self.start) * 1e6,
+            'pid': os.getpid(),
+            'tid': thread,
+        }
+        if self.args:
+            event['args'] = self.args
+        _events.append(event)
+        return False
+
+
+def enable() -> None:
+    '''
+    Function to start recording spans.
+    '''
+    global enabled, _start
+    if enabled:
+        return
+    _start = time.perf_counter()
+    enabled = True
+
+
+def span(name: str, **args):
+    '''
+    Function to time a block of code, used as *"with tracing.span(name):"*.
+
+        Parameters:
+            name: name shown for the span.
+            args: values shown with the span, e.g. the question's col and row.
+    '''
+    if not enabled:
+        return _NO_SPAN
+    return _Span(name, args)
+
+
+def write(path: str) -> None:
+    '''
+    Function to write the spans recorded so far to a Chrome trace JSON file.
+
+        Parameters:
+            path: file to write.
+    '''
+    pid = os.getpid()
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                 'args': {'name': 'Jeopardy'}}]
+    for thread, name in list(_thread_names.items()):
+        metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread,
+                         'args': {'name': name}})
+
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'traceEvents': metadata + list(_events), 'displayTimeUnit': 'ms'}, file)
@@ -0,0 +1,173 @@
+'''
+Script to compile the Designer .ui files into cached Python modules.
+
+uic.loadUi re-parses the .ui XML every time a window is built. Instead each
+.ui file is compiled once with uic.compileUi into UI_Files/compiled/, and the
+windows build themselves from the compiled Ui_* class.
+
+A compiled module is rebuilt when its .ui file changes. The mtime is checked
+first, and only if it differs is the file hashed, so touching a .ui file without
+editing it doesn't trigger a recompile.
+
+To rebuild all the modules by hand run *"python -m Program_files.ui_loader"*.
+'''
+
+import importlib.util
+import io
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UI_DIR = os.path.join(ROOT_DIR, 'UI_Files')
+COMPILED_DIR = os.path.join(UI_DIR, 'compiled')
+
+# names of the .ui files (without extension) used by the windows
+UI_NAMES = ['game_window', 'jeopardy_menu_window',
+            'question_window', 'team_window']
+
+HEADER_PREFIX = '# ui-source: '
+
+# compiled Ui_* classes already imported in this process
+_ui_classes = {}
+
+
+def _source_path(name: str) -> str:
+    return os.path.join(UI_DIR, f'{name}.ui')
+
+
+def _compiled_path(name: str) -> str:
+    return os.path.join(COMPILED_DIR, f'ui_{name}.py')
+
+
+def _hash_file(path: str) -> str:
+    import hashlib  # only needed when a .ui file has changed
+
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _read_header(path: str) -> tuple:
+    '''
+    Function to read the mtime and hash stored in a compiled module.
+
+        Parameters:
+            path: path of the compiled module.
+
+        Returns: tuple
+            mtime_ns: int, or None if the module is missing or unreadable.
+            digest: str sha256 of the .ui file it was compiled from.
+    '''
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            line = file.readline()
+    except OSError:
+        return None, None
+    if not line.startswith(HEADER_PREFIX):
+        return None, None
+    try:
+        mtime, digest = line[len(HEADER_PREFIX):].split()
+        return int(mtime), digest
+    except ValueError:
+        return None, None
+
+
+def _write_module(path: str, code: str, mtime_ns: int, digest: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(f'{HEADER_PREFIX}{mtime_ns} {digest}\n')
+        file.write(code)
+    os.replace(tmp_path, path)
+
+
+def compile_ui(name: str, force=False) -> bool:
+    '''
+    Function to compile a .ui file if its compiled module is out of date.
+
+        Parameters:
+            name: name of the .ui file, without extension.
+            force: True - always recompile.
+
+        Returns:
+            True if the module was (re)compiled.
+    '''
+    source = _source_path(name)
+    target = _compiled_path(name)
+    mtime_ns = os.stat(source).st_mtime_ns
+    cached_mtime, cached_digest = _read_header(target)
+
+    if not force and cached_mtime == mtime_ns:
+        return False
+
+    digest = _hash_file(source)
+    if not force and cached_digest == digest:
+        # only the mtime moved, refresh the header so the next check is cheap.
+        with open(target, 'r', encoding='utf-8') as file:
+            file.readline()
+            code = file.read()
+        _write_module(target, code, mtime_ns, digest)
+        return False
+
+    from PyQt5 import uic
+
+    code = io.StringIO()
+    uic.compileUi(source, code)
+    _write_module(target, code.getvalue(), mtime_ns, digest)
+    return True
+
+
+def compile_all(force=False) -> list:
+    '''
+    Function to compile every .ui file used by the game.
+
+        Returns:
+            list of names that were (re)compiled.
+    '''
+    return [name for name in UI_NAMES if compile_ui(name, force=force)]
+
+
+def get_ui_class(name: str):
+    '''
+    Function to get the compiled Ui_* class of a .ui file.
+
+        Parameters:
+            name: name of the .ui file, without extension.
+    '''
+    ui_class = _ui_classes.get(name)
+    if ui_class is None:
+        compile_ui(name)
+        spec = importlib.util.spec_from_file_location(
+            f'_compiled_ui_{name}', _compiled_path(name)
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        ui_class = next(
+            value for key, value in vars(module).items() if key.startswith('Ui_')
+        )
+        _ui_classes[name] = ui_class
+    return ui_class
+
+
+def load_ui(name: str, widget) -> None:
+    '''
+    Function to build a window from its compiled .ui module.
+        Drop in replacement for uic.loadUi('UI_Files/<name>.ui', widget).
+
+        Parameters:
+            name: name of the .ui file, without extension.
+            widget: window to build the widgets into.
+    '''
+    ui = get_ui_class(name)()
+    ui.setupUi(widget)
+
+    # like uic.loadUi, expose the named child widgets as attributes.
+    for key, value in vars(ui).items():
+        setattr(widget, key, value)
+
+
+if __name__ == '__main__':
+    force = '--force' in sys.argv
+    compiled = compile_all(force=force)
+    for name in UI_NAMES:
+        state = 'compiled' if name in compiled else 'up to date'
+        print(f'{name}.ui: {state}')
@@ -0,0 +1,198 @@
+'''
+Script to find what blocks the GUI thread.
+
+A heartbeat timer runs on the GUI thread and a sampling thread checks that it
+keeps beating. When the GUI thread hasn't beaten for longer than the threshold
+(e.g. 16 ms, one frame, or 50 ms) the sampling thread records the GUI thread's
+Python stack every few ms until it beats again. Each stall is put down to the
+handler Qt called when it started (the first Python function below the event
+loop), e.g. GameWindow.open_question_window.
+
+Run *"python Jeopardy.py --watchdog"* (or *--watchdog 16* for a 16 ms threshold)
+to print, when the game closes, the handlers ranked by the time they blocked the
+GUI thread, with the lines the samples were taken in.
+
+Stalls inside C++ with no Python handler on the stack (layout, painting) are
+listed as "(Qt)". A modal dialog (QMessageBox.exec_) runs its own event loop, so
+waiting on one isn't a stall.
+'''
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from PyQt5.QtCore import Qt, QTimer
+
+DEFAULT_THRESHOLD = 0.05
+BEAT = 0.005  # seconds between heartbeats
+SAMPLE = 0.002  # seconds between checks of the heartbeat
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _stack(frame) -> list:
+    '''
+    Function to get a stack as a list of (function, file, line), outermost first.
+    '''
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((getattr(code, 'co_qualname', code.co_name), code.co_filename,
+                      frame.f_lineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _handler(stack: list, base: list) -> str:
+    # the event loop (app.exec_()) runs in a frame of the stack watching was
+    # started from, the handler is the first function Qt called from it,
+    # lambdas connected to signals are skipped for the function they call.
+    depth = 0
+    while (depth < len(stack) and depth < len(base)
+           and stack[depth][:2] == base[depth][:2]):
+        depth += 1
+    for function, _, _ in stack[depth:]:
+        if not function.endswith('<lambda>'):
+            return function
+    return '(Qt)'
+
+
+class StallWatchdog():
+    '''
+    Class to record the GUI thread's stack while it is blocked.
+    '''
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, beat=BEAT, sample=SAMPLE):
+        '''
+            Parameters:
+                threshold: seconds without a heartbeat that count as a stall.
+                beat: seconds between heartbeats.
+                sample: seconds between the sampling thread's checks.
+        '''
+        self.threshold = threshold
+        self.beat = beat
+        self.sample = sample
+
+        # handler -> [stall count, total seconds, longest seconds]
+        self.stalls = {}
+        # handler -> Counter of 'function (file:line)' sampled, '(Qt)' in C++
+        self.lines = {}
+
+        self.last_beat = time.perf_counter()
+        self.samples = []  # stacks sampled in the current stall
+        self.lock = threading.Lock()
+        self.timer = None
+        self.thread = None
+        self.running = False
+        self.gui_thread = None
+        self.base = []  # the GUI thread's stack when watching started
+
+    def start(self) -> None:
+        '''
+        Function to start watching, called from the GUI thread.
+        '''
+        if self.running:
+            return
+        self.running = True
+        self.gui_thread = threading.get_ident()
+        self.base = _stack(sys._getframe(1))
+        self.last_beat = time.perf_counter()
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._beat)
+        self.timer.start(int(self.beat * 1000))
+        self.thread = threading.Thread(target=self._watch, name='stall watchdog', daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        '''
+        Function to stop watching.
+        '''
+        if not self.running:
+            return
+        self.running = False
+        self.timer.stop()
+        self.thread.join()
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        gap = now - self.last_beat
+        with self.lock:
+            self.last_beat = now
+            samples, self.samples = self.samples, []
+        # the timer is only due every `beat` seconds, the rest of the gap is the stall.
+        if gap - self.beat > self.threshold and samples:
+            self._record(samples, gap - self.beat)
+
+    def _watch(self) -> None:
+        frames = sys._current_frames
+        while self.running:
+            time.sleep(self.sample)
+            with self.lock:
+                if time.perf_counter() - self.last_beat - self.beat <= self.threshold:
+                    continue
+                frame = frames().get(self.gui_thread)
+                if frame is not None:
+                    self.samples.append(_stack(frame))
+
+    def _record(self, samples: list, seconds: float) -> None:
+        handler = _handler(samples[0], self.base)
+        stall = self.stalls.setdefault(handler, [0, 0.0, 0.0])
+        stall[0] += 1
+        stall[1] += seconds
+        stall[2] = max(stall[2], seconds)
+
+        lines = self.lines.setdefault(handler, Counter())
+        for stack in samples:
+            if _handler(stack, self.base) == '(Qt)':
+                lines['(Qt)'] += 1
+                continue
+            function, filename, lineno = stack[-1]
+            if filename.startswith(ROOT):
+                filename = os.path.relpath(filename, ROOT)
+            lines[f'{function} ({filename}:{lineno})'] += 1
+
+    def ranked(self) -> list:
+        '''
+        Function to get the handlers that stalled, longest total first.
+
+            Returns:
+                list of (handler, stall count, total seconds, longest seconds).
+        '''
+        return sorted(
+            ((handler, *stall) for handler, stall in self.stalls.items()),
+            key=lambda stall: stall[2], reverse=True
+        )
+
+    def report(self, file=None, lines=3) -> None:
+        '''
+        Function to print the handlers that blocked the GUI thread.
+
+            Parameters:
+                file: where to print, stderr by default.
+                lines: most sampled lines printed per handler.
+        '''
+        file = file or sys.stderr
+        print(f'GUI thread stalls longer than {self.threshold * 1000:.0f} ms', file=file)
+        print('  total [ms]   longest [ms]  stalls  handler', file=file)
+        for handler, count, total, longest in self.ranked():
+            print(f'{total * 1000:12.1f} {longest * 1000:14.1f} {count:7}  {handler}',
+                  file=file)
+            for line, samples in self.lines[handler].most_common(lines):
+                print(f'{"":36}{samples:4} samples in {line}', file=file)
+
+
+def watch(app, threshold=DEFAULT_THRESHOLD) -> StallWatchdog:
+    '''
+    Function to watch the GUI thread of the app.
+        The stalls are printed when the app quits.
+    '''
+    watchdog = StallWatchdog(threshold)
+    watchdog.start()
+    app.stall_watchdog = watchdog
+    app.aboutToQuit.connect(watchdog.stop)
+    app.aboutToQuit.connect(watchdog.report)
+    return watchdog
@@ -0,0 +1,180 @@
+'''
+Benchmark for how long a sound takes to start after it is triggered.
+
+First uses the null audio sink, which records the time each sound is started
+instead of playing it, so this measures the game's own overhead between
+play_cue() / play_theme() and the sound being handed to the sink. It fails if
+the 99th percentile is over MAX_P99_MS. This always runs, QtMultimedia isn't
+needed.
+
+Then, if QtMultimedia can be loaded, loads the cues into QSoundEffects, the
+sounds the game plays, and triggers each cue QT_TRIGGERS times on the GUI
+thread, waiting for it to start before the next. Prints, for each cue:
+    - the time from play_cue() to QSoundEffect.play() being called (picking a
+      voice, stopping it if it's still playing).
+    - the time from play_cue() to the effect's playing state changing, which
+      also counts the backend starting the sound.
+It fails if the 99th percentile to play() is over MAX_P99_MS or a cue didn't
+start within TIMEOUT seconds. Without QtMultimedia this step is skipped.
+
+Run from the repository root:
+    python benchmarks/audio_latency.py
+'''
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Program_files.audio import CUES, AudioEngine, NullAudioSink, QtAudioSink
+
+TRIGGERS = 10000
+QT_TRIGGERS = 200
+MAX_P99_MS = 0.5
+TIMEOUT = 1.0  # seconds to wait for a cue to load or start
+
+
+def percentiles(latencies: list) -> tuple:
+    latencies = sorted(latencies)
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99)]
+
+
+# Null sink
+
+def measure(engine: AudioEngine, sink: NullAudioSink, trigger, name: str) -> list:
+    latencies = []
+    for _ in range(TRIGGERS):
+        start = time.perf_counter()
+        trigger()
+        started_name, started = sink.started[-1]
+        assert started_name == name
+        latencies.append((started - start) * 1000)
+    return latencies
+
+
+def measure_null_sink() -> bool:
+    '''
+    Function to time triggering each sound on the null sink.
+
+        Returns:
+            if every sound's p99 is within MAX_P99_MS.
+    '''
+    sink = NullAudioSink()
+    engine = AudioEngine(sink)
+    engine.load()
+    assert sink.prepared == set(CUES) | {'theme'}
+
+    results = {'theme': measure(engine, sink, engine.play_theme, 'theme')}
+    for name in CUES:
+        results[name] = measure(engine, sink, lambda: engine.play_cue(name), name)
+
+    passed = True
+    for name, latencies in results.items():
+        p50, p99 = percentiles(latencies)
+        print(f'{name:<14} p50 {p50 * 1000:6.2f} us   p99 {p99 * 1000:6.2f} us')
+        passed = passed and p99 <= MAX_P99_MS
+    return passed
+
+
+# QtMultimedia
+
+class TimedEffect():
+    '''
+    Class to note when the sink calls play() on a QSoundEffect.
+    '''
+
+    def __init__(self, effect, times: dict):
+        self.effect = effect
+        self.times = times
+
+    def isPlaying(self) -> bool:
+        return self.effect.isPlaying()
+
+    def stop(self) -> None:
+        self.effect.stop()
+
+    def play(self) -> None:
+        self.times['play'] = time.perf_counter()
+        self.effect.play()
+
+
+def wait(app, done) -> bool:
+    deadline = time.perf_counter() + TIMEOUT
+    while not done():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents()
+    return True
+
+
+def measure_qt_sink() -> bool:
+    '''
+    Function to time triggering each cue on QtMultimedia, on the GUI thread.
+
+        Returns:
+            if every cue started and its p99 to play() is within MAX_P99_MS,
+            True if QtMultimedia can't be loaded.
+    '''
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    try:
+        sink = QtAudioSink()
+    except ImportError as error:
+        print(f'QtMultimedia not available, skipping the QSoundEffect latency: {error}')
+        return True
+    engine = AudioEngine(sink)
+    engine.load()
+
+    times = {}
+    effects = [effect for name in CUES for effect in sink.effects[name]]
+    if not wait(app, lambda: all(effect.isLoaded() for effect in effects)):
+        print('the cues didn\'t load')
+        return False
+    for effect in effects:
+        effect.playingChanged.connect(
+            lambda effect=effect: effect.isPlaying() and times.setdefault('playing', time.perf_counter()))
+    for name in CUES:
+        sink.effects[name] = [TimedEffect(effect, times) for effect in sink.effects[name]]
+
+    passed = True
+    for name in CUES:
+        to_play, to_playing = [], []
+        for _ in range(QT_TRIGGERS):
+            times.clear()
+            start = time.perf_counter()
+            engine.play_cue(name)
+            to_play.append((times['play'] - start) * 1000)
+            if not wait(app, lambda: 'playing' in times):
+                print(f'{name}: didn\'t start within {TIMEOUT} s')
+                passed = False
+                break
+            to_playing.append((times['playing'] - start) * 1000)
+        if not to_playing:
+            continue
+
+        play_p50, play_p99 = percentiles(to_play)
+        playing_p50, playing_p99 = percentiles(to_playing)
+        print(f'{name:<14} to play() p50 {play_p50 * 1000:7.1f} us  p99 {play_p99 * 1000:7.1f} us   '
+              f'to playing p50 {playing_p50:6.2f} ms  p99 {playing_p99:6.2f} ms')
+        passed = passed and play_p99 <= MAX_P99_MS
+    return passed
+
+
+def main() -> None:
+    print('null sink, trigger to start:')
+    null_passed = measure_null_sink()
+    print('QSoundEffect, trigger to play() and to playing:')
+    qt_passed = measure_qt_sink()
+
+    if not null_passed:
+        sys.exit(f'trigger-to-start latency over {MAX_P99_MS} ms')
+    if not qt_passed:
+        sys.exit(f'cues should start, within {MAX_P99_MS} ms of being triggered')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+'''
+Benchmarks of the windows' hot paths, with pytest-benchmark.
+
+Times building the menu, game and team windows, a board click until the question
+window is showing, showing the answer, giving a team the points until the
+scoreboard shows them, and a scripted game of every question on the board.
+
+Run from the repository root (needs pytest-benchmark 5 or later):
+    python -m pytest benchmarks/bench_gui.py
+Save the results as a baseline, then check a later run against it:
+    python -m pytest benchmarks/bench_gui.py --benchmark-json=baseline.json
+    python -m pytest benchmarks/bench_gui.py --benchmark-json=result.json
+    python benchmarks/compare.py baseline.json result.json
+'''
+
+import pytest
+
+from conftest import TEAM_NAMES, dispose
+
+pytest.importorskip('pytest_benchmark')
+
+ROUNDS = 20  # for the benchmarks building windows
+CLICKS = 200  # for the benchmarks of one click
+
+
+def test_menu_window(benchmark, app, board):
+    from Program_files.menu_window import MenuWindow
+
+    questions, category_names = board
+    windows = []
+
+    def build():
+        windows.append(MenuWindow(questions=questions, category_names=category_names))
+        app.processEvents()  # the preload done after the first frame
+
+    benchmark.pedantic(build, rounds=ROUNDS, warmup_rounds=1)
+    for window in windows:
+        dispose(app, window)
+
+
+def test_game_window(benchmark, app, make_game_window):
+    def build():
+        make_game_window()
+        app.processEvents()
+
+    benchmark.pedantic(build, rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_team_window(benchmark, app, game_window):
+    from Program_files.game_window import TeamWindow
+
+    windows = []
+
+    def build():
+        windows.append(TeamWindow(scoreboard=game_window.scoreboard, parent=game_window))
+        app.processEvents()
+
+    benchmark.pedantic(build, rounds=ROUNDS, warmup_rounds=1)
+    for window in windows:
+        dispose(app, window)
+
+
+def test_open_question(benchmark, app, game_window):
+    question_window = game_window.question_window
+    button = game_window.board_buttons[2][3]
+
+    def setup():
+        question_window.hide()
+        app.processEvents()
+
+    def click():
+        button.click()
+        app.processEvents()  # until the window is showing
+
+    benchmark.pedantic(click, setup=setup, rounds=CLICKS, warmup_rounds=1)
+    assert question_window.isVisible()
+    assert game_window.engine.current == (2, 3)
+
+
+def test_show_answer(benchmark, app, game_window):
+    question_window = game_window.question_window
+    button = game_window.board_buttons[4][1]
+
+    def setup():
+        # an answered question opens with its answer showing.
+        game_window.engine.opened.set(4, 1, False)
+        button.click()
+        app.processEvents()
+
+    def reveal():
+        question_window.btn_question.click()
+        app.processEvents()
+
+    benchmark.pedantic(reveal, setup=setup, rounds=CLICKS, warmup_rounds=1)
+    assert question_window.answer_label.isVisible()
+    assert not question_window.btn_question.isEnabled()
+
+
+def test_update_points(benchmark, app, game_window):
+    question_window = game_window.question_window
+    scoreboard = game_window.scoreboard
+    game_window.board_buttons[0][0].click()
+    question_window.btn_question.click()
+    app.processEvents()
+
+    def award():
+        question_window.team_view.clicked.emit(scoreboard.index(1, 0))
+        app.processEvents()  # the scoreboard redraws the points
+
+    benchmark.pedantic(award, rounds=CLICKS, warmup_rounds=1)
+    points = game_window.engine.get_points(1)
+    assert points == 100 * len(game_window.engine.ledger.entries)
+    assert scoreboard.data(scoreboard.index(1, scoreboard.POINTS)) == f'{points:.0f}'
+
+
+def test_scripted_game(benchmark, app, make_game_window, board):
+    questions, _ = board
+
+    def play():
+        window = make_game_window()
+        question_window = window.question_window
+        for col, column in enumerate(questions):
+            for row in range(len(column)):
+                window.board_buttons[col][row].click()
+                question_window.btn_question.click()
+                question_window.team_view.clicked.emit(
+                    window.scoreboard.index((col + row) % len(TEAM_NAMES), 0)
+                )
+                question_window.hide()
+                app.processEvents()
+        return window
+
+    window = benchmark.pedantic(play, rounds=ROUNDS // 2, warmup_rounds=1)
+    clues = sum(map(len, questions))
+    assert clues == 36
+    assert len(window.engine.ledger.entries) == clues
@@ -0,0 +1,75 @@
+'''
+Benchmark for building and drawing boards of different shapes.
+
+Times building the board's headers and buttons (GameWindow.build_board) for
+boards from 6x6 to 20x20, and resizing + repainting the whole board window,
+offscreen.
+
+Run from the repository root:
+    python benchmarks/board_grid.py
+'''
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from Program_files.game_window import GameWindow
+from Program_files.models import Question
+
+SHAPES = [(6, 6), (8, 10), (12, 12), (20, 20)]
+RESIZES = 20
+SIZES = [(1920, 1080), (1280, 720)]
+
+
+def make_board(categories: int, rows: int) -> tuple:
+    questions = [
+        [Question(f'question {col}-{row}', f'answer {col}-{row}', 100 * (row + 1))
+         for row in range(rows)]
+        for col in range(categories)
+    ]
+    return questions, [f'Category {col + 1}' for col in range(categories)]
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+
+    for categories, rows in SHAPES:
+        questions, category_names = make_board(categories, rows)
+        window = GameWindow(
+            team_names=['Team 1', 'Team 2'],
+            category_names=category_names,
+            questions=questions,
+            autosave=False
+        )
+        app.processEvents()
+
+        # building the board again, on top of the one the window made.
+        start = time.perf_counter()
+        window.build_board()
+        window.set_category_names(category_names)
+        build = time.perf_counter() - start
+
+        times = []
+        for index in range(RESIZES):
+            start = time.perf_counter()
+            window.resize(*SIZES[index % len(SIZES)])
+            window.repaint()
+            times.append(time.perf_counter() - start)
+
+        cells = categories * rows
+        print(f'{categories:>2}x{rows:<2} ({cells:>3} cells): build {build * 1000:6.2f} ms '
+              f'({build / cells * 1e6:5.1f} us/cell), resize + repaint '
+              f'{statistics.median(times) * 1000:6.2f} ms')
+
+        window.team_window.hide()
+        window.hide()
+
+
+if __name__ == '__main__':
+    main()
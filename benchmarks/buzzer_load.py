@@ -0,0 +1,200 @@
+'''
+Load generator for the network buzzers.
+
+Connects hundreds of simulated player devices to a buzzer server and has every
+one of them buzz in each time the buzzers are armed.
+
+Without options it starts its own server next to a Qt event loop (offscreen),
+arms it once per round like the game window does and prints:
+    - how long the winning buzz takes to reach a slot in the GUI thread.
+    - the longest the GUI thread went without running its timer, i.e. how
+      much the server and the clients stalled it.
+    - that every round had exactly one winner.
+    - that a player who buzzes after a question is closed, before the next one
+      is armed, is locked out, also when the question had a winner.
+Exits with an error if a round didn't have exactly one winner or the early
+buzz wasn't locked out.
+
+With --connect it only runs the players, against a game started with
+*"python Jeopardy.py --buzzer-port PORT"*, until Ctrl+C.
+
+Run from the repository root:
+    python benchmarks/buzzer_load.py [--clients 500] [--rounds 50]
+    python benchmarks/buzzer_load.py --connect HOST:PORT [--clients 500]
+'''
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TEAMS = 8
+
+
+async def player(host: str, port: int, team: int, results: Counter) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'JOIN {team}\nBUZZ\n'.encode('utf-8'))  # the BUZZ is too early
+    async for line in reader:
+        message = line.decode('utf-8').split(' ', 1)[0].strip()
+        results[message] += 1
+        if message == 'ARMED':
+            # players don't all react at once.
+            await asyncio.sleep(random.uniform(0, 0.02))
+            writer.write(b'BUZZ\n')
+    writer.close()
+
+
+def run_players(host: str, port: int, clients: int, results: Counter, ready=None):
+    '''
+    Function to run the players in an asyncio loop in this thread.
+    '''
+    async def main() -> None:
+        tasks = []
+        for index in range(clients):
+            tasks.append(asyncio.ensure_future(
+                player(host, port, index % TEAMS + 1, results)
+            ))
+        while results['WELCOME'] < clients:
+            await asyncio.sleep(0.01)
+        if ready is not None:
+            ready.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def check_lockout() -> bool:
+    '''
+    Function to check that a buzz between questions is locked out:
+        arm, buzz (won), close, buzz again before the next arm.
+    '''
+    import socket
+
+    from Program_files.buzzer import BuzzerServer
+
+    server = BuzzerServer(host='127.0.0.1', port=0)
+    server.start(['Team 1'])
+    replies = []
+    try:
+        with socket.create_connection(('127.0.0.1', server.port)) as connection:
+            lines = connection.makefile(encoding='utf-8')
+            connection.sendall(b'JOIN 1\n')
+            lines.readline()  # WELCOME
+            server.arm()
+            lines.readline()  # ARMED
+            connection.sendall(b'BUZZ\n')
+            replies.append(lines.readline().split(' ')[0].strip())
+            server.close()
+            lines.readline()  # CLOSED
+            connection.sendall(b'BUZZ\n')
+            replies.append(lines.readline().split(' ')[0].strip())
+    finally:
+        server.stop()
+    print(f'buzz while armed, then after the question closed: {replies}')
+    return replies == ['WON', 'LOCKED']
+
+
+def self_test(clients: int, rounds: int) -> int:
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    from Program_files.buzzer import BuzzerServer
+    from Program_files.game_window import BuzzerRelay
+
+    app = QApplication(sys.argv)
+    server = BuzzerServer(host='127.0.0.1', port=0)
+    relay = BuzzerRelay()
+    server.start([f'Team {n + 1}' for n in range(TEAMS)], relay.buzzed.emit)
+
+    results = Counter()
+    ready = threading.Event()
+    threading.Thread(
+        target=run_players, args=('127.0.0.1', server.port, clients, results, ready),
+        daemon=True
+    ).start()
+    ready.wait()
+
+    latencies = []
+    stalls = []
+    state = {'round': 0, 'armed_at': 0.0, 'tick': time.perf_counter()}
+
+    def heartbeat() -> None:
+        now = time.perf_counter()
+        stalls.append(now - state['tick'])
+        state['tick'] = now
+
+    def next_round() -> None:
+        if state['round'] == rounds:
+            app.quit()
+            return
+        state['round'] += 1
+        state['armed_at'] = time.monotonic()
+        server.arm()
+
+    def on_buzz(team_index: int, reaction_time: float) -> None:
+        # the server stamped the buzz at about armed_at + reaction_time.
+        buzzed_at = server.armed_at + reaction_time
+        latencies.append(time.monotonic() - buzzed_at)
+        # closed once every player has buzzed, a buzz after that is early for
+        # the next question and locked out.
+        QTimer.singleShot(50, server.close)
+        QTimer.singleShot(100, next_round)
+
+    relay.buzzed.connect(on_buzz)
+    timer = QTimer()
+    timer.timeout.connect(heartbeat)
+    timer.start(1)
+    # the players' first BUZZ was too early, the first round waits out its lockout.
+    QTimer.singleShot(int(server.lockout * 1000) + 50, next_round)
+    app.exec_()
+    timer.stop()
+    time.sleep(0.1)  # last LATE/CLOSED messages
+    server.stop()
+
+    latencies.sort()
+    print(f'{clients} players, {rounds} rounds')
+    print(f'buzz to GUI thread: median {statistics.median(latencies) * 1000:.2f} ms, '
+          f'max {latencies[-1] * 1000:.2f} ms')
+    print(f'longest GUI thread stall: {max(stalls) * 1000:.1f} ms '
+          f'(timer every 1 ms)')
+    print(f'messages: {dict(results)}')
+    if results['WON'] != rounds or len(latencies) != rounds:
+        print('error: every round should have exactly one winner')
+        return 1
+    if not check_lockout():
+        print('error: a buzz after a question closed should be locked out')
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='network buzzer load generator')
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--connect', metavar='HOST:PORT',
+                        help='buzz in on a running game instead')
+    args = parser.parse_args()
+
+    if args.connect is None:
+        return self_test(args.clients, args.rounds)
+
+    host, _, port = args.connect.rpartition(':')
+    results = Counter()
+    try:
+        run_players(host, int(port), args.clients, results)
+    except KeyboardInterrupt:
+        pass
+    print(f'messages: {dict(results)}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
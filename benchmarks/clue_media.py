@@ -0,0 +1,177 @@
+'''
+Benchmark for picture clues.
+
+Makes PICTURES 4K JPEG pictures and opens a question window with each, then
+again, offscreen. Prints:
+    - how long decoding one picture on the GUI thread would block it.
+    - how long a click on a picture clue blocks the GUI thread when the picture
+      isn't in the cache (it's decoded in the background) and until the picture
+      is shown, and when it's already in the cache.
+    - the bytes in the picture cache against its bound.
+Then checks a picture prefetched and asked for by a clue: the clue moves it to
+the clue priority, and closing the clue before it's decoded keeps it for the
+cache.
+Exits with an error if the cache is over its bound, if a picture is still
+held by the window after its clue is closed, or if the shared picture check fails.
+
+Run from the repository root:
+    python benchmarks/clue_media.py
+'''
+
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QRunnable, QThreadPool
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+from Program_files import media
+from Program_files.audio import AudioEngine
+from Program_files.engine import GameEngine
+from Program_files.models import Question
+from Program_files.question_window import QuestionWindow
+from Program_files.scoreboard import ScoreboardModel
+
+PICTURES = 12
+WIDTH, HEIGHT = 3840, 2160
+CACHE_BYTES = 8 * 1024 * 1024  # holds every picture at the offscreen screen size
+
+
+class BoardStandIn(QMainWindow):
+    '''
+    Minimal parent window with the attributes QuestionWindow reads.
+    '''
+
+    def __init__(self, questions: list):
+        super(BoardStandIn, self).__init__()
+        self.engine = GameEngine(
+            questions=[questions],
+            category_names=['Pictures'],
+            team_names=['Team 1', 'Team 2']
+        )
+        self.scoreboard = ScoreboardModel(self.engine, parent=self)
+        self.audio = AudioEngine()
+
+
+def make_pictures(directory: str) -> list:
+    paths = []
+    for index in range(PICTURES):
+        image = QImage(WIDTH, HEIGHT, QImage.Format_RGB32)
+        image.fill(QColor.fromHsv(index * 30 % 360, 200, 200))
+        path = os.path.join(directory, f'picture_{index}.jpg')
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def ms(times: list) -> str:
+    return f'median {statistics.median(times) * 1000:7.2f} ms, max {max(times) * 1000:7.2f} ms'
+
+
+class Blocker(QRunnable):
+    '''
+    Class to keep a thread pool's thread busy until it's released.
+    '''
+
+    def __init__(self):
+        super(Blocker, self).__init__()
+        self.released = threading.Event()
+
+    def run(self) -> None:
+        self.released.wait()
+
+
+def check_shared_prefetch(app, path: str) -> bool:
+    '''
+    Function to prefetch a picture, ask for it for a clue and close the clue
+        before it's decoded.
+
+        Returns:
+            if the clue raised its priority and the picture was cached.
+    '''
+    loader = media.MediaLoader(cache_bytes=CACHE_BYTES, pool=QThreadPool())
+    loader.pool.setMaxThreadCount(1)
+    blocker = Blocker()
+    loader.pool.start(blocker)  # so both requests are queued
+    try:
+        size = media.display_size()
+        key, _ = loader.request(path, size, media.PREFETCH_PRIORITY)
+        loader.request(path, size)
+        raised = loader.pending[key].priority == 0
+        loader.cancel(key)
+    finally:
+        blocker.released.set()
+    loader.pool.waitForDone()
+    app.processEvents()
+    return raised and loader.cache.get(key) is not None
+
+
+def main() -> int:
+    app = QApplication(sys.argv)
+    media._media_loader = media.MediaLoader(cache_bytes=CACHE_BYTES)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_pictures(directory)
+        questions = [Question(f'Picture {n}', 'Answer', 100, image=path)
+                     for n, path in enumerate(paths)]
+        parent = BoardStandIn(questions)
+        window = QuestionWindow(parent=parent)
+        clicked_btn = QtWidgets.QPushButton()
+
+        blocking = []
+        for path in paths[:3]:
+            start = time.perf_counter()
+            QPixmap(path)
+            blocking.append(time.perf_counter() - start)
+        print(f'decode on the GUI thread:     {ms(blocking)}')
+
+        def play(row: int) -> tuple:
+            parent.engine.open_question(0, row)
+            start = time.perf_counter()
+            window.open_question(questions[row], clicked_btn)
+            click = time.perf_counter() - start
+            while window.media_label.pixmap() is None:
+                app.processEvents()
+            shown = time.perf_counter() - start
+            window.hide()
+            return click, shown
+
+        leaks = 0
+        for label, rows in (('not cached', range(PICTURES)), ('cached', range(PICTURES))):
+            clicks, shown = [], []
+            for row in rows:
+                click, until_shown = play(row)
+                clicks.append(click)
+                shown.append(until_shown)
+                if window.media_label.pixmap() is not None or window.picture_key is not None:
+                    leaks += 1
+            print(f'click, {label + ":":<12}       {ms(clicks)}')
+            print(f'until shown, {label + ":":<12} {ms(shown)}')
+
+        cache = media.get_media_loader().cache
+        print(f'cache: {len(cache)} pictures, {cache.size / 1024:.0f} of '
+              f'{cache.max_bytes / 1024:.0f} KiB')
+
+        shared = check_shared_prefetch(app, paths[0])
+        print(f'prefetched picture raised by its clue and kept after it closed: {shared}')
+
+    if cache.size > cache.max_bytes or leaks:
+        print('error: the cache should stay in its bound and closed clues free their picture')
+        return 1
+    if not shared:
+        print('error: a clue should raise the priority of a prefetched picture and '
+              'closing it should leave the picture to be cached')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
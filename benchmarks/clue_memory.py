@@ -0,0 +1,104 @@
+'''
+Benchmark for the memory used by a large number of questions.
+
+Makes CLUES questions (the size of a big bank loaded in memory) as
+Program_files/models.Question, which uses __slots__, and as the same class with
+an instance __dict__, and prints for each:
+    - memory per question (tracemalloc), not counting the text, which is the same.
+    - time to read every question's points with get_points().
+Then compares, for a board of CLUES questions and teams, the opened flags as a
+bitset (BoardFlags) and as lists of bools, and the scores as an array('d') and as
+a list of floats. Category names are interned, so every question of a category
+shares one name string; the memory saved by that is printed too.
+
+Run from the repository root:
+    python benchmarks/clue_memory.py [CLUES]
+'''
+
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Program_files.models import BoardFlags, Question
+
+CATEGORIES = 1000
+ROWS = 6
+
+
+class DictQuestion():
+    '''
+    Question as it was before __slots__, for comparison.
+    '''
+
+    def __init__(self, question='', answer='', points=0):
+        self.question = question
+        self.answer = answer
+        self.points = points
+        self.opened = False
+
+    def get_points(self) -> float:
+        return self.points
+
+
+def measure(make) -> tuple:
+    '''
+    Function to measure the memory taken by what make() returns.
+
+        Returns:
+            (the object made, bytes allocated and still in use).
+    '''
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    made = make()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return made, size
+
+
+def main() -> None:
+    clues = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    question, answer = 'What is a question?', 'An answer'
+    points = [100 * (row + 1) for row in range(ROWS)]
+
+    print(f'{clues:,} questions')
+    for name, cls in (('Question (__slots__)', Question), ('Question (__dict__)', DictQuestion)):
+        questions, size = measure(lambda: [
+            cls(question, answer, points[index % ROWS]) for index in range(clues)
+        ])
+        start = time.perf_counter()
+        total = sum(q.get_points() for q in questions)
+        took = time.perf_counter() - start
+        print(f'{name:<24} {size / clues:6.1f} bytes a question, '
+              f'get_points {took / clues * 1e9:5.1f} ns ({total:.0f})')
+        del questions
+
+    columns = [ROWS] * (clues // ROWS)
+    flags, size = measure(lambda: BoardFlags(columns))
+    print(f'{"opened (bitset)":<24} {size / clues:6.3f} bytes a question')
+    lists, size = measure(lambda: [[False] * length for length in columns])
+    print(f'{"opened (lists)":<24} {size / clues:6.3f} bytes a question')
+    del flags, lists
+
+    scores, size = measure(lambda: array('d', bytes(8 * clues)))
+    print(f'{"scores (array)":<24} {size / clues:6.1f} bytes a team')
+    scores, size = measure(lambda: [float(team) for team in range(clues)])
+    print(f'{"scores (list)":<24} {size / clues:6.1f} bytes a team')
+    del scores
+
+    # a loader reads a new string for each question's category name.
+    names, size = measure(lambda: [f'Category {index % CATEGORIES}' for index in range(clues)])
+    print(f'{"category names":<24} {size / clues:6.1f} bytes a question '
+          f'({len(set(map(id, names))):,} strings)')
+    del names
+    names, size = measure(lambda: [sys.intern(f'Category {index % CATEGORIES}')
+                                   for index in range(clues)])
+    print(f'{"category names (intern)":<24} {size / clues:6.1f} bytes a question '
+          f'({len(set(map(id, names))):,} strings)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+'''
+Compare two runs of the pytest benchmarks (benchmarks/bench_gui.py).
+
+Reads the JSON files written with --benchmark-json, prints each benchmark's time
+in both and flags the ones that got slower by more than the threshold.
+Exits with an error if any did, so it can fail a build.
+
+Run from the repository root:
+    python benchmarks/compare.py BASELINE.json RESULT.json [--threshold 10] [--stat median]
+'''
+
+import argparse
+import json
+import sys
+
+STATS = ['min', 'max', 'mean', 'median', 'stddev', 'iqr']
+
+
+def load(path: str, stat: str) -> dict:
+    '''
+    Function to read a pytest-benchmark JSON file.
+
+        Returns:
+            dict of benchmark name -> seconds (the chosen statistic).
+    '''
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+    return {bench['name']: bench['stats'][stat] for bench in data['benchmarks']}
+
+
+def compare(baseline: dict, result: dict, threshold: float) -> list:
+    '''
+    Function to compare the times of two runs.
+
+        Parameters:
+            baseline, result: dicts from load().
+            threshold: percentage slower that counts as a regression.
+
+        Returns:
+            list of (name, baseline seconds, result seconds, change %, regressed),
+            None for a benchmark only in one of the runs.
+    '''
+    rows = []
+    for name in sorted(baseline.keys() | result.keys()):
+        before = baseline.get(name)
+        after = result.get(name)
+        if before is None or after is None:
+            rows.append((name, before, after, None, False))
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        rows.append((name, before, after, change, change > threshold))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='compare two pytest benchmark runs')
+    parser.add_argument('baseline', help='JSON file of the baseline run')
+    parser.add_argument('result', help='JSON file of the run to check')
+    parser.add_argument('--threshold', type=float, default=10.0, metavar='PERCENT',
+                        help='slower than the baseline by more than this is a '
+                             'regression (default: 10)')
+    parser.add_argument('--stat', choices=STATS, default='median',
+                        help='statistic compared (default: median)')
+    args = parser.parse_args()
+
+    rows = compare(load(args.baseline, args.stat), load(args.result, args.stat),
+                   args.threshold)
+
+    print(f'{"benchmark":<28} {"baseline [ms]":>14} {"result [ms]":>12} {"change":>9}')
+    for name, before, after, change, regressed in rows:
+        before_text = '-' if before is None else f'{before * 1000:.3f}'
+        after_text = '-' if after is None else f'{after * 1000:.3f}'
+        change_text = 'new' if before is None else 'gone' if after is None else f'{change:+.1f}%'
+        flag = '  REGRESSION' if regressed else ''
+        print(f'{name:<28} {before_text:>14} {after_text:>12} {change_text:>9}{flag}')
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) slower than the baseline by more than '
+              f'{args.threshold:g}% ({args.stat}): {", ".join(regressions)}')
+        return 1
+    print(f'no benchmark slower than the baseline by more than {args.threshold:g}% ({args.stat})')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+'''
+Fixtures for the pytest benchmarks of the windows (benchmarks/bench_gui.py).
+
+The windows are built offscreen, in one QApplication for the whole run. They are
+never closed, since closing the game window asks for confirmation; they are
+hidden and deleted instead.
+'''
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+TEAM_NAMES = ['Team 1', 'Team 2', 'Team 3']
+
+
+@pytest.fixture(scope='session')
+def app():
+    '''
+    Function to get the QApplication, made once for every benchmark.
+    '''
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    yield app
+    app.processEvents()
+
+
+@pytest.fixture(scope='session')
+def board():
+    '''
+    Function to get the board of questions.py, 6 categories of 6 questions.
+
+        Returns:
+            (questions, category_names)
+    '''
+    from questions import all_questions, category_names
+    return all_questions, category_names
+
+
+def dispose(app, window) -> None:
+    '''
+    Function to get rid of a window without closing it.
+    '''
+    window.hide()
+    window.deleteLater()
+    app.processEvents()
+
+
+@pytest.fixture
+def make_game_window(app, board):
+    '''
+    Function to get a function building a GameWindow on the board (without
+        autosave), the windows built are deleted after the benchmark.
+    '''
+    from Program_files.game_window import GameWindow
+
+    windows = []
+
+    def make_game_window():
+        questions, category_names = board
+        window = GameWindow(
+            team_names=TEAM_NAMES,
+            category_names=category_names,
+            questions=questions,
+            autosave=False
+        )
+        windows.append(window)
+        return window
+
+    yield make_game_window
+    for window in windows:
+        dispose(app, window)
+
+
+@pytest.fixture
+def game_window(make_game_window):
+    '''
+    Function to get a GameWindow on the board, with its windows built.
+    '''
+    return make_game_window()
@@ -0,0 +1,65 @@
+'''
+Benchmark for the headless game engine.
+
+Plays a full scripted game (every question on a 6x6 board is opened, revealed
+and awarded) with no windows and without importing PyQt5.
+
+Run from the repository root:
+    python benchmarks/engine_game.py
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Program_files.engine import GameEngine
+from Program_files.models import Question
+
+GAMES = 10000
+
+
+def make_board(categories=6, rows=6) -> tuple:
+    questions = [
+        [Question(f'question {col}-{row}', f'answer {col}-{row}', 100 * (row + 1))
+         for row in range(rows)]
+        for col in range(categories)
+    ]
+    category_names = [f'Category {col + 1}' for col in range(categories)]
+    return questions, category_names
+
+
+def play_game(questions: list, category_names: list, team_names: list) -> GameEngine:
+    engine = GameEngine(questions, category_names, team_names)
+    teams = len(team_names)
+    turn = 0
+    for col in range(len(questions)):
+        for row in range(len(questions[col])):
+            engine.open_question(col, row)
+            engine.reveal_answer()
+            engine.award(turn % teams)
+            turn += 1
+    return engine
+
+
+def main() -> None:
+    questions, category_names = make_board()
+    team_names = ['Team 1', 'Team 2', 'Team 3']
+
+    engine = play_game(questions, category_names, team_names)
+    assert engine.questions_left() == 0
+    assert sum(engine.scores()) == sum(q.get_points() for col in questions for q in col)
+    assert 'PyQt5' not in sys.modules
+
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        play_game(questions, category_names, team_names)
+    elapsed = time.perf_counter() - start
+
+    print(f'{GAMES} games of 36 questions in {elapsed:.3f} s')
+    print(f'{elapsed / GAMES * 1e6:.1f} us per game, {GAMES / elapsed:,.0f} games/s')
+
+
+if __name__ == '__main__':
+    main()
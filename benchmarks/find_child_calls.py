@@ -0,0 +1,70 @@
+'''
+Check that playing the game never searches the widget tree.
+
+Plays a short scripted game through the windows (offscreen) and counts the
+findChild/findChildren calls made by each action with Program_files/lookups.py.
+Exits with an error if any action made one.
+
+Run from the repository root:
+    python benchmarks/find_child_calls.py
+'''
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from Program_files.game_window import GameWindow
+from Program_files.lookups import count_lookups
+from questions import all_questions, category_names
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+
+    with count_lookups() as lookups:
+        window = GameWindow(
+            team_names=['Team 1', 'Team 2', 'Team 3'],
+            category_names=category_names,
+            questions=all_questions,
+            autosave=False
+        )
+        app.processEvents()
+        question_window = window.question_window
+        scoreboard = window.scoreboard
+
+        for turn, (col, row) in enumerate([(0, 0), (1, 2), (5, 5)]):
+            with lookups.action(f'open question {col},{row}'):
+                window.board_buttons[col][row].click()
+                app.processEvents()
+            with lookups.action('show answer'):
+                question_window.btn_question.click()
+                app.processEvents()
+            with lookups.action('award points'):
+                question_window.team_view.clicked.emit(scoreboard.index(turn % 3, 0))
+                app.processEvents()
+            with lookups.action('close question'):
+                question_window.close()
+                app.processEvents()
+
+        with lookups.action('undo'):
+            window.action_undo.trigger()
+        with lookups.action('redo'):
+            window.action_redo.trigger()
+        with lookups.action('edit points'):
+            scoreboard.confirm = lambda team_index, points: True
+            scoreboard.setData(scoreboard.index(0, scoreboard.POINTS), 500)
+            app.processEvents()
+
+    lookups.report(sys.stdout)
+    total = lookups.total()
+    print(f'{total} searches after the windows were built')
+    if total:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
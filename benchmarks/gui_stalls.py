@@ -0,0 +1,68 @@
+'''
+Find what blocks the GUI thread while a game is played.
+
+Plays a scripted game of every question on the board through the windows
+(offscreen), with each click run from the event loop like a real one, and
+prints the handlers that blocked the GUI thread for longer than 16 ms, ranked by
+the time they blocked it (see Program_files/watchdog.py).
+
+Run from the repository root:
+    python benchmarks/gui_stalls.py [THRESHOLD_MS]
+'''
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from Program_files.watchdog import StallWatchdog
+from questions import all_questions, category_names
+
+
+def main() -> None:
+    threshold = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    app = QApplication(sys.argv[:1])
+    watchdog = StallWatchdog(threshold / 1000)
+    watchdog.start()
+
+    state = {}
+
+    def build() -> None:
+        from Program_files.game_window import GameWindow
+
+        state['window'] = GameWindow(
+            team_names=['Team 1', 'Team 2', 'Team 3'],
+            category_names=category_names,
+            questions=all_questions,
+            autosave=False
+        )
+
+    steps = [build]
+    for col, column in enumerate(all_questions):
+        for row in range(len(column)):
+            team = (col + row) % 3
+            steps += [
+                lambda col=col, row=row: state['window'].board_buttons[col][row].click(),
+                lambda: state['window'].question_window.btn_question.click(),
+                lambda team=team: state['window'].question_window.team_view.clicked.emit(
+                    state['window'].scoreboard.index(team, 0)
+                ),
+                lambda: state['window'].question_window.close(),
+            ]
+
+    # each click is its own timer, so Qt calls it like a real click's handler,
+    # with a short gap, like between two clicks, for the heartbeat to catch up.
+    steps.append(app.quit)
+    for index, step in enumerate(steps):
+        QTimer.singleShot(index * 20, step)
+    app.exec_()
+    watchdog.stop()
+    watchdog.report(sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+'''
+Benchmark for the idle chore scheduler.
+
+Plays questions through the game window (offscreen), a click every CLICK_EVERY
+ms: without chores, while a second of background chores (in steps of STEP
+seconds) is queued on the game window's IdleScheduler, and with the same chores
+run in one go on the GUI thread. Prints, for each:
+    - how late the clicks were handled (the timer that clicks runs late when the
+      GUI thread is busy), median and max.
+    - how long opening a question and showing its answer took.
+and the scheduler's stats (queue depth, slices, slices over budget).
+Exits with an error if more than 2% of the slices ran over their budget or a chore
+was left queued.
+
+Run from the repository root:
+    python benchmarks/idle_chores.py
+'''
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from Program_files.board_loader import load_board
+from Program_files.game_window import GameWindow
+from Program_files.idle import LOW, NORMAL
+
+BOARD = os.path.join(ROOT, 'boards', 'example_board.json')
+CLICKS = 30
+CLICK_EVERY = 30  # ms
+CHORE_SECONDS = 1.0
+STEP = 0.0005  # seconds of work per chore step
+OVERRUNS = 0.02  # part of the slices allowed over budget
+
+
+def work(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def chore(seconds: float):
+    for _ in range(int(seconds / STEP)):
+        work(STEP)
+        yield
+
+
+def play(app, window, start_chores) -> tuple:
+    '''
+    Function to click CLICKS questions while the chores run.
+
+        Returns:
+            (click lateness, click handling times), in seconds.
+    '''
+    lateness = []
+    handling = []
+    question_window = window.question_window
+    cells = [(col, row) for col in range(len(window.board_buttons))
+             for row in range(len(window.board_buttons[col]))]
+    start = time.perf_counter()
+
+    def click(index: int) -> None:
+        lateness.append(time.perf_counter() - start - index * CLICK_EVERY / 1000)
+        col, row = cells[index % len(cells)]
+        began = time.perf_counter()
+        window.board_buttons[col][row].click()
+        question_window.btn_question.click()
+        handling.append(time.perf_counter() - began)
+        question_window.hide()
+        if index == CLICKS - 1:
+            app.quit()
+
+    for index in range(CLICKS):
+        QTimer.singleShot(index * CLICK_EVERY, Qt.PreciseTimer, lambda index=index: click(index))
+    QTimer.singleShot(0, start_chores)
+    app.exec_()
+    return lateness, handling
+
+
+def report(name: str, lateness: list, handling: list) -> None:
+    print(f'{name}: clicks late by median {statistics.median(lateness) * 1000:6.2f} ms, '
+          f'max {max(lateness) * 1000:7.2f} ms; handled in median '
+          f'{statistics.median(handling) * 1000:.2f} ms')
+
+
+def main() -> int:
+    app = QApplication(sys.argv[:1])
+    questions, category_names = load_board(BOARD)
+    window = GameWindow(team_names=['Team 1', 'Team 2', 'Team 3'],
+                        category_names=category_names, questions=questions,
+                        autosave=False)
+    app.processEvents()
+    scheduler = window.idle
+
+    def queue_chores() -> None:
+        scheduler.schedule(chore(CHORE_SECONDS / 2), NORMAL, 'normal chore')
+        scheduler.schedule(chore(CHORE_SECONDS / 2), LOW, 'low chore')
+
+    report('no chores     ', *play(app, window, lambda: None))
+    report('idle scheduler', *play(app, window, queue_chores))
+    while scheduler.depth:
+        app.processEvents()
+    scheduler.report(sys.stdout)
+    stats = scheduler.stats()
+
+    report('in one go     ', *play(app, window, lambda: work(CHORE_SECONDS)))
+
+    # a step can be slowed down by other programs, so a few overruns are allowed.
+    if stats['overruns'] > stats['slices'] * OVERRUNS or stats['depth']:
+        print('error: slices should keep to their budget and every chore should finish')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+'''
+Benchmark for the autosave journal.
+
+Plays long games on a 20x20 board with 8 teams through Program_files/journal.py,
+then "crashes" (the journal thread is stopped without removing the files) and
+times resuming the game. Prints:
+    - the time the game waits for each journaled change.
+    - the time the journal thread takes to write and fsync everything.
+    - the time to rebuild the engine from the files, which should stay under
+      100 ms however long the game went on.
+Exits with an error if a resumed game doesn't match the one played, or resuming
+takes 100 ms or more.
+
+Run from the repository root:
+    python benchmarks/journal_resume.py
+'''
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Program_files.engine import GameEngine
+from Program_files.journal import GameJournal, JournalWriter, load_autosave, restore_engine
+from Program_files.models import Question
+
+SIZE = 20
+TEAMS = 8
+LIMIT_MS = 100
+
+
+def make_board() -> list:
+    return [
+        [
+            Question(f'Question {col}-{row} ' + 'x' * 80, f'Answer {col}-{row}', 100 * (row + 1))
+            for row in range(SIZE)
+        ]
+        for col in range(SIZE)
+    ]
+
+
+def play(engine: GameEngine, events: int, rng: random.Random) -> None:
+    done = 0
+    while done < events:
+        col, row = rng.randrange(SIZE), rng.randrange(SIZE)
+        engine.open_question(col, row)
+        engine.reveal_answer()
+        roll = rng.random()
+        if roll < 0.7:
+            engine.award(rng.randrange(TEAMS))
+        elif roll < 0.85:
+            engine.deduct(rng.randrange(TEAMS))
+        elif roll < 0.95:
+            engine.undo()
+        else:
+            engine.set_points(rng.randrange(TEAMS), 1000)
+        done += 3
+
+
+def main() -> int:
+    rng = random.Random(1)
+    failed = False
+    for events in (1000, 100000):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = GameEngine(make_board(), [f'Category {n}' for n in range(SIZE)],
+                                [f'Team {n}' for n in range(TEAMS)])
+            journal = GameJournal(engine, JournalWriter(directory))
+
+            start = time.perf_counter()
+            play(engine, events, rng)
+            game_us = (time.perf_counter() - start) / events * 1e6
+
+            start = time.perf_counter()
+            journal.writer.close(discard=False)  # the crash
+            drain_ms = (time.perf_counter() - start) * 1000
+
+            best = float('inf')
+            for _ in range(5):
+                start = time.perf_counter()
+                resumed = restore_engine(load_autosave(directory))
+                best = min(best, (time.perf_counter() - start) * 1000)
+
+        same = (
+            resumed.scores() == engine.scores()
+            and resumed.opened == engine.opened
+            and resumed.current == engine.current
+            and list(resumed.ledger.undo_stack) == list(engine.ledger.undo_stack)
+        )
+        failed |= not same or best >= LIMIT_MS
+        print(f'{events:>7,} events: {game_us:.1f} us per event (with the engine), '
+              f'journal thread done {drain_ms:.1f} ms after, '
+              f'resume {best:.1f} ms{"" if same else " - RESUMED GAME DIFFERS"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
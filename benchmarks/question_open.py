@@ -0,0 +1,105 @@
+'''
+Benchmark for opening a question window.
+
+Times building the question window widgets with uic.loadUi (parsing the .ui XML)
+against the compiled module from Program_files/ui_loader.py, the one-off
+QuestionWindow construction done while the board loads, and re-opening the
+reused window, which is what a board click costs.
+
+Run from the repository root:
+    python benchmarks/question_open.py
+'''
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5 import QtWidgets, uic
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+from Program_files import question_window
+from Program_files.audio import AudioEngine
+from Program_files.engine import GameEngine
+from Program_files.question_window import Question, QuestionWindow
+from Program_files.scoreboard import ScoreboardModel
+from Program_files.ui_loader import _source_path, compile_ui, load_ui
+
+ROUNDS = 50
+
+
+class BoardStandIn(QMainWindow):
+    '''
+    Minimal parent window with the attributes QuestionWindow reads.
+    '''
+
+    def __init__(self, team_names: list):
+        super(BoardStandIn, self).__init__()
+        self.team_names = team_names
+        self.engine = GameEngine(
+            questions=[[Question('question', 'answer', 100)]],
+            category_names=['Category'],
+            team_names=team_names
+        )
+        self.engine.open_question(0, 0)
+        self.team_objects = self.engine.teams
+        self.scoreboard = ScoreboardModel(self.engine, parent=self)
+        self.audio = AudioEngine()
+
+
+def median_ms(func, rounds=ROUNDS) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    compile_ui('question_window')
+
+    parent = BoardStandIn(['Team 1', 'Team 2', 'Team 3'])
+    clicked_btn = QtWidgets.QPushButton()
+    source = _source_path('question_window')
+
+    def build_window() -> None:
+        QuestionWindow(parent=parent)
+
+    def build_window_uic() -> None:
+        # same as build_window, but building the widgets the old way.
+        compiled = question_window.load_ui
+        question_window.load_ui = lambda name, widget: uic.loadUi(
+            _source_path(name), widget
+        )
+        try:
+            build_window()
+        finally:
+            question_window.load_ui = compiled
+
+    window = QuestionWindow(parent=parent)
+    question = Question('question', 'answer', 100)
+
+    def open_question() -> None:
+        window.open_question(questionObj=question, clicked_btn=clicked_btn)
+        window.hide()
+
+    results = {
+        'uic.loadUi': median_ms(lambda: uic.loadUi(source, QMainWindow())),
+        'compiled load_ui': median_ms(
+            lambda: load_ui('question_window', QMainWindow())
+        ),
+        'build (uic.loadUi)': median_ms(build_window_uic),
+        'build (compiled)': median_ms(build_window),
+        'open (reused)': median_ms(open_question),
+    }
+    for name, value in results.items():
+        print(f'{name:<20} {value:8.2f} ms (median of {ROUNDS})')
+
+
+if __name__ == '__main__':
+    main()
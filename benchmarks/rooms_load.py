@@ -0,0 +1,124 @@
+'''
+Load test for the game room server.
+
+Starts `python -m Program_files.rooms` in its own process, then for a growing
+number of rooms connects a host and PLAYERS players to each room and plays
+TURNS turns (open, reveal, award) in every room at once. Prints, for each room
+count:
+    - rooms/s: rooms created and joined by all their players per second.
+    - events/s: room events delivered to the players per second.
+    - p50/p99 event latency: from the host sending a request to a player
+      getting the event it caused.
+
+The clients all run in this one process, so at the larger room counts some of
+the latency is the clients' own.
+
+Run from the repository root:
+    python benchmarks/rooms_load.py [--rooms 10 50 200 500]
+'''
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Program_files.rooms import RoomClient
+
+PLAYERS = 3
+TURNS = 30
+TEAMS = ['Team 1', 'Team 2', 'Team 3']
+
+
+async def run_room(port: int, index: int, latencies: list, ready: list,
+                   start_play: asyncio.Event) -> int:
+    sent = []  # time each event's request was sent, in event order
+    received = [0]
+
+    def on_event(event: dict) -> None:
+        if event['event'] == 'closed':
+            return
+        latencies.append(time.perf_counter() - sent[event['seq'] - 1])
+        received[0] += 1
+
+    host = RoomClient()
+    await host.connect('127.0.0.1', port)
+    room = (await host.request('create', teams=TEAMS))['room']
+    players = []
+    for _ in range(PLAYERS):
+        player = RoomClient(on_event)
+        await player.connect('127.0.0.1', port)
+        await player.request('join', room=room)
+        players.append(player)
+
+    ready.append(room)
+    await start_play.wait()
+    for turn in range(TURNS):
+        col, row = turn % 6, (turn // 6) % 5
+        sent.append(time.perf_counter())
+        await host.request('open', col=col, row=row)
+        sent.append(time.perf_counter())
+        await host.request('reveal')
+        sent.append(time.perf_counter())
+        await host.request('award', team=(turn + index) % len(TEAMS))
+
+    await host.request('close')
+    for client in [host] + players:
+        await client.close()
+    return received[0]
+
+
+async def load(port: int, rooms: int) -> None:
+    latencies = []
+    ready = []
+    start_play = asyncio.Event()
+
+    start = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(run_room(port, index, latencies, ready, start_play))
+        for index in range(rooms)
+    ]
+    # every room is created and joined before any is played.
+    while len(ready) < rooms:
+        await asyncio.sleep(0.001)
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    start_play.set()
+    delivered = sum(await asyncio.gather(*tasks))
+    play = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f'{rooms:>5} rooms: {rooms / setup:8.0f} rooms/s, '
+          f'{delivered / play:8.0f} events/s, '
+          f'latency p50 {p50:6.2f} ms, p99 {p99:6.2f} ms')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='room server load test')
+    parser.add_argument('--rooms', type=int, nargs='+', default=[10, 50, 200, 500])
+    args = parser.parse_args()
+
+    for rooms in args.rooms:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'Program_files.rooms',
+             '--board', os.path.join(ROOT, 'boards', 'example_board.json'),
+             '--host', '127.0.0.1', '--port', '0'],
+            cwd=ROOT, stdout=subprocess.PIPE, text=True
+        )
+        try:
+            port = int(server.stdout.readline().rsplit(' ', 1)[1])
+            asyncio.run(load(port, rooms))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
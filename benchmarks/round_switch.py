@@ -0,0 +1,116 @@
+'''
+Benchmark for starting the next round.
+
+Plays the first round of boards/example_board.json through the game window
+(offscreen) while the second round is loaded in the background, and prints:
+    - how long the GUI thread was busy laying out the next round's board (the
+      only part of the preload done on it), in idle slices between clicks.
+    - how long starting the next round takes, from the Next Round action to the
+      new board being drawn.
+    - how long building a new game window for the round takes, which is what
+      restarting the game for it cost.
+Exits with an error if the points weren't carried over or the board didn't change.
+
+Run from the repository root:
+    python benchmarks/round_switch.py
+'''
+
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt5.QtWidgets import QApplication
+
+from Program_files.board_loader import load_board, round_names
+from Program_files.game_window import GameWindow
+
+BOARD = os.path.join(ROOT, 'boards', 'example_board.json')
+TEAMS = ['Team 1', 'Team 2', 'Team 3']
+
+
+def main() -> int:
+    app = QApplication(sys.argv[:1])
+    rounds = round_names(BOARD)
+
+    def round_loader(played: int):
+        if played >= len(rounds):
+            return None
+        return load_board(BOARD, round=played)
+
+    build_times = []
+    lay_out = GameWindow.lay_out_next_round
+
+    def timed_lay_out(self, questions, category_names):
+        # the time of each step, the scheduler runs them between clicks.
+        steps = lay_out(self, questions, category_names)
+        while True:
+            start = time.perf_counter()
+            try:
+                next(steps)
+            except StopIteration:
+                break
+            finally:
+                build_times.append(time.perf_counter() - start)
+            yield
+    GameWindow.lay_out_next_round = timed_lay_out
+
+    questions, category_names = load_board(BOARD, round=0)
+    window = GameWindow(team_names=TEAMS, category_names=category_names,
+                        questions=questions, autosave=False, round_loader=round_loader)
+    app.processEvents()
+
+    # the host plays a few questions while the next round loads.
+    question_window = window.question_window
+    for col in range(3):
+        window.board_buttons[col][0].click()
+        question_window.btn_question.click()
+        question_window.team_view.clicked.emit(window.scoreboard.index(col, 0))
+        question_window.hide()
+        app.processEvents()
+    scores = window.engine.scores()
+
+    while not window.action_next_round.isEnabled():
+        app.processEvents()
+        time.sleep(0.001)
+
+    start = time.perf_counter()
+    window.action_next_round.trigger()
+    swap = time.perf_counter() - start
+    window.repaint()
+    app.processEvents()
+    drawn = time.perf_counter() - start
+
+    second = load_board(BOARD, round=1)
+    start = time.perf_counter()
+    rebuilt = GameWindow(team_names=TEAMS, category_names=second[1], questions=second[0],
+                         autosave=False)
+    app.processEvents()
+    rebuild = time.perf_counter() - start
+    rebuilt.hide()
+
+    print(f'next round built on the GUI thread: {sum(build_times) * 1000:.1f} ms '
+          f'in {len(build_times)} steps, longest {max(build_times) * 1000:.2f} ms '
+          f'(loaded in a background thread)')
+    window.idle.report(sys.stdout)
+    print(f'start next round: swap {swap * 1000:.2f} ms, drawn {drawn * 1000:.2f} ms')
+    print(f'new game window for the round: {rebuild * 1000:.1f} ms')
+
+    # there is no third round, so the action stays off.
+    for _ in range(50):
+        app.processEvents()
+        time.sleep(0.002)
+
+    if (window.engine.scores() != scores or window.all_questions is questions
+            or window.board_buttons[0][0].text() != '{:.0f}'.format(second[0][0][0].get_points())
+            or window.action_next_round.isEnabled()):
+        print('error: the next round should keep the points and show its own board')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+'''
+Benchmark for the score ledger.
+
+Times award, undo and redo on ledgers of different lengths to check they don't
+get slower as the game goes on, and checks that replaying the entries gives the
+same totals.
+
+Run from the repository root:
+    python benchmarks/score_ledger.py
+'''
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Program_files.ledger import ScoreLedger
+
+TEAMS = 4
+OPS = 100000
+
+
+def fill(ledger: ScoreLedger, count: int, rng: random.Random) -> None:
+    for index in range(count):
+        team = index % TEAMS
+        roll = rng.random()
+        if roll < 0.6:
+            ledger.award(team, 100 * rng.randint(1, 10), (index % 6, index % 6))
+        elif roll < 0.8:
+            ledger.deduct(team, 100 * rng.randint(1, 10))
+        elif roll < 0.85:
+            ledger.override(team, 1000)
+        elif roll < 0.95:
+            ledger.undo()
+        else:
+            ledger.redo()
+
+
+def per_op_us(ledger: ScoreLedger, func) -> float:
+    start = time.perf_counter()
+    for index in range(OPS):
+        func(index)
+    return (time.perf_counter() - start) / OPS * 1e6
+
+
+def main() -> None:
+    rng = random.Random(1)
+    for size in (1000, 1000000):
+        ledger = ScoreLedger(TEAMS)
+        fill(ledger, size, rng)
+
+        replayed = ScoreLedger.replay(ledger.entries, TEAMS)
+        assert replayed.totals == ledger.totals
+
+        award = per_op_us(ledger, lambda index: ledger.award(index % TEAMS, 100))
+        # undo then redo, so there is always something to undo.
+        undo_redo = per_op_us(ledger, lambda index: (ledger.undo(), ledger.redo()))
+        total = per_op_us(ledger, lambda index: ledger.total(index % TEAMS))
+        print(f'{size:>9,} entries: award {award:.2f} us, '
+              f'undo + redo {undo_redo:.2f} us, total {total:.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Benchmark for updating the scoreboard.
+
+Shows the scoreboard of 2 to 500 teams in a view (offscreen) and times giving
+points to a random team until the view has redrawn, which should cost the same
+whatever the number of teams.
+
+Run from the repository root:
+    python benchmarks/scoreboard_update.py
+'''
+
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QTableView
+
+from Program_files.engine import GameEngine
+from Program_files.models import Question
+from Program_files.scoreboard import ScoreboardModel, set_up_team_view
+from Program_files.theme import apply_theme
+
+UPDATES = 300
+TEAM_COUNTS = [2, 10, 50, 200, 500]
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    apply_theme(app)
+    rng = random.Random(1)
+
+    for teams in TEAM_COUNTS:
+        engine = GameEngine(
+            questions=[[Question('question', 'answer', 100)]],
+            category_names=['Category'],
+            team_names=[f'Team {index + 1}' for index in range(teams)]
+        )
+        engine.open_question(0, 0)
+        model = ScoreboardModel(engine)
+        engine.add_listener(model.on_engine_event)
+
+        view = QTableView()
+        view.setModel(model)
+        set_up_team_view(view)
+        view.resize(600, 900)
+        view.show()
+        app.processEvents()
+
+        # teams the view can show, updates to hidden rows don't repaint.
+        visible = view.rowAt(view.viewport().height() - 1)
+        visible = teams if visible < 0 else visible + 1
+
+        times = []
+        for _ in range(UPDATES):
+            team = rng.randrange(visible)
+            start = time.perf_counter()
+            engine.award(team)
+            app.processEvents()  # paints the changed cell
+            times.append(time.perf_counter() - start)
+
+        print(f'{teams:>4} teams: {statistics.median(times) * 1e6:8.1f} us per update '
+              f'(median of {UPDATES}, {visible} rows on screen)')
+        view.close()
+
+
+if __name__ == '__main__':
+    main()
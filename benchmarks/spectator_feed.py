@@ -0,0 +1,176 @@
+'''
+Benchmark for the spectator feed.
+
+Plays a game on the main thread (standing in for the GUI thread) with the feed
+running, first with no viewers and then with VIEWERS viewers on the /events
+stream (in another process) plus one viewer that never reads. Prints, for each:
+    - how long each engine event takes on the main thread, with the feed's
+      listener.
+    - how late a 1 ms timer on the main thread runs (p99 and max).
+    - that every viewer got every delta, and the stalled viewer was dropped.
+Then reconnects a viewer with a Last-Event-ID the feed hasn't reached, as a tab
+left open while the game restarted would.
+Exits with an error if a viewer missed a delta, the stalled one wasn't dropped,
+or the reconnecting viewer didn't get the whole state.
+
+Run from the repository root:
+    python benchmarks/spectator_feed.py [--viewers 1000]
+'''
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TURNS = 60  # 3 events each
+
+
+def play(engine, turns: int) -> tuple:
+    '''
+    Function to play turns while a 1 ms timer runs, like the GUI thread does.
+
+        Returns:
+            (event times, timer lateness), in seconds.
+    '''
+    event_times = []
+    lateness = []
+    next_tick = time.perf_counter()
+    turn = 0
+    while turn < turns:
+        next_tick += 0.001
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        lateness.append(max(0.0, time.perf_counter() - next_tick))
+        next_tick = max(next_tick, time.perf_counter())
+
+        if len(lateness) % 30 == 0:
+            col, row = turn % 6, (turn // 6) % 5
+            # open, award, deduct: 3 events however often the cell was played.
+            for action in (lambda: engine.open_question(col, row),
+                           lambda: engine.award(turn % 3, 100),
+                           lambda: engine.deduct((turn + 1) % 3, 100)):
+                start = time.perf_counter()
+                action()
+                event_times.append(time.perf_counter() - start)
+            turn += 1
+    return event_times, lateness
+
+
+def report(name: str, event_times: list, lateness: list) -> None:
+    event_times.sort()
+    lateness.sort()
+    print(f'{name}: {event_times[len(event_times) // 2] * 1e6:6.1f} us per event (median), '
+          f'timer late p99 {lateness[int(len(lateness) * 0.99)] * 1000:.2f} ms, '
+          f'max {lateness[-1] * 1000:.2f} ms')
+
+
+async def viewers(port: int, count: int, expected: int) -> None:
+    '''
+    Function run in the viewers' process: count the deltas each viewer gets.
+    '''
+    received = [0] * count
+
+    async def viewer(index: int) -> None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=1 << 20)
+        writer.write(b'GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        async for line in reader:
+            if line.startswith(b'data: {"t"'):
+                received[index] += 1
+                if received[index] == expected:
+                    break
+        writer.close()
+
+    tasks = [asyncio.ensure_future(viewer(index)) for index in range(count)]
+    print('connected', flush=True)
+    await asyncio.wait(tasks, timeout=60)
+    print(json.dumps([min(received), max(received)]), flush=True)
+
+
+def reconnect_ahead(port: int, last_event_id: int) -> bool:
+    '''
+    Function to reconnect a viewer whose last event id is ahead of the feed.
+
+        Returns:
+            if the viewer was sent a snapshot.
+    '''
+    viewer = socket.create_connection(('127.0.0.1', port), timeout=5)
+    viewer.sendall(f'GET /events HTTP/1.1\r\nLast-Event-ID: {last_event_id}\r\n\r\n'.encode())
+    received = b''
+    try:
+        while b'event: snapshot' not in received:
+            data = viewer.recv(65536)
+            if not data:
+                break
+            received += data
+    except socket.timeout:
+        pass
+    viewer.close()
+    return b'event: snapshot' in received
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='spectator feed benchmark')
+    parser.add_argument('--viewers', type=int, default=1000)
+    parser.add_argument('--viewers-process', nargs=3, type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.viewers_process:
+        asyncio.run(viewers(*args.viewers_process))
+        return 0
+
+    from Program_files.engine import GameEngine
+    from Program_files.models import Question
+    from Program_files.spectator import SpectatorFeed
+
+    # long clues, so the stalled viewer's socket buffers fill up.
+    board = [[Question(f'Clue {col}-{row} ' + 'x' * 2000, 'Answer', 100 * (row + 1))
+              for row in range(5)] for col in range(6)]
+    engine = GameEngine(board, [f'Category {n}' for n in range(6)],
+                        ['Team 1', 'Team 2', 'Team 3'])
+    feed = SpectatorFeed(host='127.0.0.1', port=0, buffer_size=4096)
+    feed.start(engine)
+
+    report('no viewers   ', *play(engine, TURNS))
+
+    process = subprocess.Popen(
+        [sys.executable, __file__, '--viewers-process',
+         str(feed.port), str(args.viewers), str(TURNS * 3)],
+        stdout=subprocess.PIPE, text=True
+    )
+    process.stdout.readline()
+    stalled = socket.socket()
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024)
+    stalled.connect(('127.0.0.1', feed.port))
+    stalled.sendall(b'GET /events HTTP/1.1\r\n\r\n')
+    while len(feed.viewers) < args.viewers + 1:
+        time.sleep(0.01)
+
+    report(f'{args.viewers} viewers', *play(engine, TURNS))
+    low, high = json.loads(process.stdout.readline())
+    process.wait()
+    dropped = feed.dropped
+    resynced = reconnect_ahead(feed.port, feed.state['seq'] + 100)
+    feed.stop()
+    stalled.close()
+
+    print(f'deltas per viewer: min {low}, max {high} of {TURNS * 3}; '
+          f'viewers dropped: {dropped}')
+    print(f'viewer ahead of the feed got a snapshot: {resynced}')
+    if low != TURNS * 3 or dropped != 1:
+        print('error: every viewer should get every delta and only the stalled one be dropped')
+        return 1
+    if not resynced:
+        print('error: a viewer ahead of the feed should get the whole state again')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+'''
+Benchmark for styling the board.
+
+Builds a 6x6 board of buttons (plus the category headers) styled the old way,
+with a stylesheet set on every widget, and with the application theme from
+Program_files/theme.py, where the widgets only get a dynamic property. Also
+times marking one question as opened, which happens after every answer.
+
+Run from the repository root:
+    python benchmarks/theme_build.py
+'''
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QGridLayout, QPushButton, QWidget
+
+from Program_files.theme import apply_theme, mark, set_state
+
+ROUNDS = 30
+CATEGORIES = 6
+ROWS = 6
+
+# stylesheets the board used to set on each widget
+LEGACY_HEADER = '''
+QPushButton {
+    color: white;
+    font-size: 45px;
+    background-color: rgb(50, 50, 255);
+    padding: 5px;
+}
+'''
+LEGACY_CELL = '''
+QPushButton {
+    background-color: rgb(50, 50, 255);
+    color: rgb(255, 170, 0);
+    font: Arial Bold;
+    font-size: 40px;
+}
+
+QPushButton:hover {
+    background-color: rgb(100, 100, 255);
+}
+'''
+LEGACY_OPENED = '''
+QPushButton {
+    color: rgb(255, 170, 0);
+    background-color: rgb(50, 50, 255);
+    text-decoration: line-through;
+    font-size: 40px;
+}
+'''
+
+
+def build_board() -> tuple:
+    '''
+    Function to make the board widgets, returning (window, headers, cells).
+    '''
+    window = QWidget()
+    central = QWidget(window)
+    central.setObjectName('game_central')
+    layout = QGridLayout(central)
+    headers = []
+    cells = []
+    for col in range(CATEGORIES):
+        header = QPushButton(f'Category {col + 1}', central)
+        layout.addWidget(header, 0, col)
+        headers.append(header)
+        for row in range(ROWS):
+            cell = QPushButton(str((row + 1) * 100), central)
+            layout.addWidget(cell, row + 1, col)
+            cells.append(cell)
+    return window, headers, cells
+
+
+def show(app: QApplication, window: QWidget) -> None:
+    window.show()
+    window.grab()  # polish and paint every widget
+    app.processEvents()
+
+
+def median_ms(func, rounds=ROUNDS) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    windows = []
+
+    def build_legacy() -> None:
+        window, headers, cells = build_board()
+        for header in headers:
+            header.setStyleSheet(LEGACY_HEADER)
+        for cell in cells:
+            cell.setStyleSheet(LEGACY_CELL)
+        show(app, window)
+        windows.append((window, cells))
+
+    def build_theme() -> None:
+        window, headers, cells = build_board()
+        mark(headers, 'category_header')
+        mark(cells, 'cell')
+        show(app, window)
+        windows.append((window, cells))
+
+    def open_cell(style) -> None:
+        window, cells = windows[-1]
+        cell = cells.pop()
+        style(cell)
+        cell.repaint()
+
+    results = {}
+
+    app.setStyleSheet('')
+    results['board build (per widget)'] = median_ms(build_legacy)
+    results['open cell (per widget)'] = median_ms(
+        lambda: open_cell(lambda cell: cell.setStyleSheet(LEGACY_OPENED))
+    )
+    for window, _ in windows:
+        window.close()
+    windows.clear()
+
+    apply_theme(app)
+    results['board build (theme)'] = median_ms(build_theme)
+    results['open cell (theme)'] = median_ms(
+        lambda: open_cell(lambda cell: set_state(cell, 'opened'))
+    )
+
+    for name, value in results.items():
+        print(f'{name:<26} {value:8.3f} ms (median of {ROUNDS})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+'''
+Benchmark for the tracing spans (Program_files/tracing.py).
+
+Prints:
+    - the cost of a span with tracing off, as left in the code, and on.
+    - the time of a scripted game (every question opened, answered and its
+      points given) played through the windows (offscreen) with tracing off and
+      on, and the slowest spans of the traced game.
+The trace is written to trace.json, to open in Perfetto (https://ui.perfetto.dev).
+
+Run from the repository root:
+    python benchmarks/trace_spans.py [PATH]
+'''
+
+import os
+import sys
+import time
+import timeit
+from collections import defaultdict
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from Program_files import tracing
+from questions import all_questions, category_names
+
+
+def span_cost() -> float:
+    '''
+    Function to time an empty span.
+
+        Returns:
+            seconds per span.
+    '''
+    def empty() -> None:
+        with tracing.span('empty'):
+            pass
+
+    number = 200000
+    return min(timeit.repeat(empty, number=number, repeat=5)) / number
+
+
+def play_game(app) -> float:
+    '''
+    Function to open the game window and play every question on the board.
+
+        Returns:
+            seconds taken.
+    '''
+    from Program_files.game_window import GameWindow
+
+    start = time.perf_counter()
+    window = GameWindow(
+        team_names=['Team 1', 'Team 2', 'Team 3'],
+        category_names=category_names,
+        questions=all_questions,
+        autosave=False
+    )
+    question_window = window.question_window
+    for col, column in enumerate(all_questions):
+        for row in range(len(column)):
+            window.board_buttons[col][row].click()
+            question_window.btn_question.click()
+            question_window.team_view.clicked.emit(
+                window.scoreboard.index((col + row) % 3, 0)
+            )
+            question_window.hide()
+            app.processEvents()
+    took = time.perf_counter() - start
+
+    window.team_window.hide()
+    window.hide()
+    window.deleteLater()
+    app.processEvents()
+    return took
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else 'trace.json'
+    app = QApplication(sys.argv[:1])
+    play_game(app)  # imports, compiled .ui files and styles are cached after this
+
+    off = span_cost()
+    game_off = play_game(app)
+    tracing.enable()
+    tracing._events.clear()
+    on = span_cost()
+    tracing._events.clear()
+    game_on = play_game(app)
+
+    print(f'span: {off * 1e9:.0f} ns with tracing off, {on * 1e9:.0f} ns on')
+    print(f'game: {game_off * 1000:.1f} ms with tracing off, {game_on * 1000:.1f} ms on '
+          f'({len(tracing._events)} spans)')
+
+    totals = defaultdict(lambda: [0, 0.0])
+    for event in tracing._events:
+        totals[event['name']][0] += 1
+        totals[event['name']][1] += event['dur']
+    print('  total [ms]  spans  span')
+    for name, (count, total) in sorted(totals.items(), key=lambda item: -item[1][1])[:12]:
+        print(f'{total / 1000:12.1f} {count:6}  {name}')
+
+    tracing.write(path)
+    print(f'trace written to {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+'''
+Check that playing for hours doesn't keep windows or memory alive.
+
+Plays QUESTIONS questions through the windows (offscreen): every one is opened,
+answered, given to a team and closed, some are closed without points (answering
+the "Points Not Added" box), and now and then the host edits points (answering
+the warning), cancels quitting the game and changes the number of teams on the
+menu. After a warm-up it compares, at the end:
+    - live Qt objects: every QObject in the app's and the windows' object trees,
+      and every widget.
+    - the Python heap, with tracemalloc.
+Exits with an error if the Qt objects grew, or the heap grew by more than the
+game's own record of the turns (HEAP_PER_QUESTION bytes a question).
+
+Run from the repository root:
+    python benchmarks/window_lifecycle.py [QUESTIONS]
+'''
+
+import gc
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+from Program_files.game_window import GameWindow
+from Program_files.menu_window import MenuWindow
+from questions import all_questions, category_names
+
+WARM_UP = 100
+HEAP_PER_QUESTION = 1024  # bytes, the ledger entry and turn log of a question
+
+
+def qt_objects(app) -> int:
+    '''
+    Function to count the live Qt objects.
+
+        Returns:
+            QObjects in the object trees of the app and its top level widgets,
+            plus widgets outside of them.
+    '''
+    count = len(app.findChildren(QObject))
+    for widget in app.topLevelWidgets():
+        count += 1 + len(widget.findChildren(QObject))
+    return count + len(app.allWidgets())
+
+
+def answer_box(button) -> None:
+    '''
+    Function to click a button of the message box once it is showing.
+    '''
+    def click() -> None:
+        box = QApplication.activeModalWidget()
+        if isinstance(box, QMessageBox):
+            box.button(button).click()
+        else:
+            QTimer.singleShot(1, click)
+    QTimer.singleShot(0, click)
+
+
+def main() -> int:
+    questions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app = QApplication(sys.argv[:1])
+
+    menu = MenuWindow(questions=all_questions, category_names=category_names,
+                      autosave=False)
+    app.processEvents()
+    window = GameWindow(
+        parent=menu,
+        team_names=['Team 1', 'Team 2', 'Team 3'],
+        category_names=category_names,
+        questions=all_questions,
+        autosave=False
+    )
+    question_window = window.question_window
+    scoreboard = window.scoreboard
+    cells = [(col, row) for col, column in enumerate(all_questions)
+             for row in range(len(column))]
+
+    def play(number: int) -> None:
+        col, row = cells[number % len(cells)]
+        window.board_buttons[col][row].click()
+        if question_window.btn_question.isEnabled():
+            question_window.btn_question.click()
+        if number % 10 == 9:
+            answer_box(QMessageBox.Ok)  # "Points Not Added"
+        else:
+            question_window.team_view.clicked.emit(scoreboard.index(number % 3, 0))
+        question_window.close()
+
+        if number % 50 == 49:
+            answer_box(QMessageBox.Ok)  # "Changing Points"
+            scoreboard.setData(scoreboard.index(0, scoreboard.POINTS), number)
+            answer_box(QMessageBox.Cancel)  # "Exiting Jeopardy!"
+            window.close()
+            menu.spinBox_num_teams.setValue(8)
+            menu.spinBox_num_teams.setValue(2)
+        app.processEvents()
+
+    for number in range(WARM_UP):
+        play(number)
+    gc.collect()
+    app.processEvents()
+    tracemalloc.start()
+    heap_before = tracemalloc.take_snapshot()
+    objects_before = qt_objects(app)
+
+    for number in range(WARM_UP, WARM_UP + questions):
+        play(number)
+    gc.collect()
+    app.processEvents()
+    heap_after = tracemalloc.take_snapshot()
+    objects_after = qt_objects(app)
+    tracemalloc.stop()
+
+    growth = heap_after.compare_to(heap_before, 'lineno')
+    heap_growth = sum(stat.size_diff for stat in growth)
+    print(f'{questions} questions after {WARM_UP} to warm up')
+    print(f'Qt objects: {objects_before} -> {objects_after}')
+    print(f'Python heap: {heap_growth / 1024:+.1f} KiB '
+          f'({heap_growth / questions:+.0f} bytes a question), largest growth:')
+    for stat in growth[:5]:
+        print(f'    {stat.size_diff / 1024:+8.1f} KiB  {stat.traceback}')
+
+    if objects_after > objects_before or heap_growth > HEAP_PER_QUESTION * questions:
+        print('error: Qt objects or the Python heap kept growing')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())